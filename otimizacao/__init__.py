@@ -0,0 +1,16 @@
+"""
+Núcleo reutilizável das meta-heurísticas do trabalho final.
+"""
+from otimizacao.objetivos import (
+    FUNCOES_TESTE,
+    ackley,
+    avaliar_populacao,
+    funcao_rastrigin,
+    funcao_schaffer_np,
+    griewank,
+    rastrigin,
+    rosenbrock,
+    schaffer_n2,
+    sphere,
+    vetorizada,
+)
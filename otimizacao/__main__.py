@@ -0,0 +1,5 @@
+import sys
+
+from otimizacao.cli import main
+
+sys.exit(main())
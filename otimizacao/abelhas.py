@@ -0,0 +1,309 @@
+"""
+Algoritmo ABC - Artificial Bee Colony (versão vetorizada).
+
+As três fases do ABC são executadas como operações em lote sobre toda a
+colônia:
+
+- Abelhas funcionárias: uma tentativa de vizinhança por fonte de alimento.
+- Abelhas observadoras: as fontes são escolhidas com um único sorteio sobre
+  a probabilidade acumulada (roleta), em vez de um ``np.random.choice`` por
+  abelha.
+- Abelhas exploradoras: fontes que excedem ``limite_abandono`` tentativas sem
+  melhora são abandonadas e reiniciadas em posições aleatórias.
+
+Com ``nucleo="numba"`` o movimento de vizinhança e a avaliação dos candidatos
+rodam em um laço compilado (ver ``otimizacao.compilado``). Com ``substituto``,
+os candidatos das funcionárias e observadoras passam por um modelo substituto
+e só os mais promissores chegam à função objetivo (ver ``otimizacao.substituto``).
+"""
+import numpy as np
+
+from otimizacao.checkpoint import conferir_forma
+from otimizacao.compilado import codigo_objetivo, funcionarias_abc, vizinhos_abc
+from otimizacao.objetivos import avaliar_populacao
+from otimizacao.telemetria import CRONOMETRO_NULO, escolher_cronometro, metricas_geracao
+
+
+def qualidade(fitness_values):
+    """
+    Converte custos (minimização) na qualidade usada pela roleta do ABC.
+
+    Usa a transformação padrão do ABC: ``1 / (1 + f)`` para ``f >= 0`` e
+    ``1 + |f|`` para ``f < 0``, de modo que fontes de menor custo tenham maior
+    probabilidade de serem escolhidas.
+    """
+    fitness_values = np.asarray(fitness_values, dtype=float)
+    return np.where(fitness_values >= 0,
+                    1.0 / (1.0 + np.abs(fitness_values)),
+                    1.0 + np.abs(fitness_values))
+
+
+def sortear_roleta(pesos, quantidade, rng):
+    """
+    Sorteia ``quantidade`` índices proporcionais a ``pesos`` com uma única busca
+    binária sobre a soma acumulada.
+    """
+    acumulado = np.cumsum(pesos)
+    sorteios = rng.random(quantidade) * acumulado[-1]
+    indices = np.searchsorted(acumulado, sorteios, side="right")
+    return np.minimum(indices, len(acumulado) - 1)
+
+
+class ABC:
+    def __init__(self, cost_func, num_bees=30, max_iter=100, dim=2, lim_inf=-5.12, lim_sup=5.12,
+                 limite_abandono=None, semente=None, nucleo="numpy", substituto=None):
+        """
+        Parâmetros:
+            cost_func (callable): Função objetivo a ser minimizada.
+            num_bees (int): Número de fontes de alimento (abelhas funcionárias).
+            max_iter (int): Número de iterações.
+            dim (int): Número de variáveis de decisão.
+            lim_inf, lim_sup (float): Limites de cada coordenada.
+            limite_abandono (int | None): Tentativas sem melhora antes de uma fonte
+                ser abandonada pela fase exploradora. O padrão é ``num_bees * dim``.
+            semente (int | np.random.Generator | None): Semente ou gerador aleatório.
+            nucleo (str): ``"numpy"`` (padrão), ``"numba"`` ou ``"auto"``, como
+                em ``pso``.
+            substituto (Substituto | None): Modelo substituto usado na triagem
+                dos candidatos, como em ``pso``. As fontes iniciais e as das
+                exploradoras são sempre avaliadas na função real.
+        """
+        if substituto is not None and nucleo == "numba":
+            raise ValueError("O núcleo compilado avalia todos os candidatos; não use nucleo='numba' com substituto.")
+        self.cost_func = cost_func
+        self.num_bees = num_bees
+        self.max_iter = max_iter
+        self.dim = dim
+        self.lim_inf = lim_inf
+        self.lim_sup = lim_sup
+        self.limite_abandono = num_bees * dim if limite_abandono is None else limite_abandono
+        self.rng = np.random.default_rng(semente)
+        self.substituto = substituto
+        self.food_sources = self.rng.uniform(lim_inf, lim_sup, (num_bees, dim))
+        self.tentativas = np.zeros(num_bees, dtype=np.int64)
+        # As fontes iniciais só são avaliadas em inicializar (ao retomar um checkpoint, nunca)
+        self.fitness_values = None
+        self.best_position = None
+        self.best_fitness = np.inf
+        self._codigo = codigo_objetivo(cost_func, nucleo) if substituto is None else None
+        if self._codigo is not None:
+            self._sorteios = np.empty((num_bees, dim))
+            self._novas = np.empty((num_bees, dim))
+            self._novos_fitness = np.empty(num_bees)
+
+    def inicializar(self):
+        """
+        Avalia as fontes de alimento iniciais. Chamado por ``optimize`` (exceto
+        ao retomar um checkpoint) e na primeira chamada de ``passo``.
+        """
+        self.fitness_values = self._avaliar(self.food_sources)
+        indice_melhor = np.argmin(self.fitness_values)
+        self.best_position = self.food_sources[indice_melhor].copy()
+        self.best_fitness = self.fitness_values[indice_melhor]
+
+    def _avaliar(self, pontos, referencia=None):
+        # Com substituto, só candidatos com referência (fitness a vencer) passam pela triagem
+        if self.substituto is None:
+            return avaliar_populacao(self.cost_func, pontos)
+        if referencia is None:
+            return self.substituto.avaliar_reais(self.cost_func, pontos)
+        return self.substituto.avaliar(self.cost_func, pontos, referencia)
+
+    def _vizinhos(self, indices):
+        # Mesmo movimento da versão original: perturbação relativa à melhor fonte
+        origem = self.food_sources[indices]
+        phi = self.rng.uniform(-1, 1, origem.shape)
+        novas = origem + phi * (origem - self.best_position)
+        return np.clip(novas, self.lim_inf, self.lim_sup, out=novas)
+
+    def _fase_funcionarias(self):
+        if self._codigo is not None:
+            self.rng.random(out=self._sorteios)
+            funcionarias_abc(self._codigo, self.food_sources, self.fitness_values, self.tentativas,
+                             self.best_position, self._sorteios, float(self.lim_inf), float(self.lim_sup),
+                             self._novas)
+            return
+        novas = self._vizinhos(np.arange(self.num_bees))
+        novos_fitness = self._avaliar(novas, self.fitness_values)
+
+        melhorou = novos_fitness < self.fitness_values
+        self.food_sources[melhorou] = novas[melhorou]
+        self.fitness_values[melhorou] = novos_fitness[melhorou]
+        self.tentativas[melhorou] = 0
+        self.tentativas[~melhorou] += 1
+
+    def _fase_observadoras(self):
+        selecionadas = sortear_roleta(qualidade(self.fitness_values), self.num_bees, self.rng)
+        if self._codigo is None:
+            novas = self._vizinhos(selecionadas)
+            novos_fitness = self._avaliar(novas, self.fitness_values[selecionadas])
+        else:
+            novas, novos_fitness = self._novas, self._novos_fitness
+            self.rng.random(out=self._sorteios)
+            vizinhos_abc(self._codigo, self.food_sources, selecionadas, self.best_position, self._sorteios,
+                         float(self.lim_inf), float(self.lim_sup), novas, novos_fitness)
+
+        # Várias observadoras podem escolher a mesma fonte: fica apenas o melhor candidato de cada uma
+        ordem = np.lexsort((novos_fitness, selecionadas))
+        alvos = selecionadas[ordem]
+        primeiro = np.ones(len(alvos), dtype=bool)
+        primeiro[1:] = alvos[1:] != alvos[:-1]
+        candidatos = ordem[primeiro]
+        fontes = selecionadas[candidatos]
+
+        falhas = novos_fitness >= self.fitness_values[selecionadas]
+        melhorou = novos_fitness[candidatos] < self.fitness_values[fontes]
+        fontes_melhoradas = fontes[melhorou]
+        self.food_sources[fontes_melhoradas] = novas[candidatos[melhorou]]
+        self.fitness_values[fontes_melhoradas] = novos_fitness[candidatos[melhorou]]
+
+        self.tentativas += np.bincount(selecionadas[falhas], minlength=self.num_bees)
+        self.tentativas[fontes_melhoradas] = 0
+
+    def _fase_exploradoras(self):
+        abandonadas = np.flatnonzero(self.tentativas > self.limite_abandono)
+        if len(abandonadas) == 0:
+            return 0
+        novas = self.rng.uniform(self.lim_inf, self.lim_sup, (len(abandonadas), self.dim))
+        self.food_sources[abandonadas] = novas
+        self.fitness_values[abandonadas] = self._avaliar(novas)
+        self.tentativas[abandonadas] = 0
+        return len(abandonadas)
+
+    def passo(self, cronometro=CRONOMETRO_NULO):
+        """Executa uma iteração (três fases) e retorna o número de fontes abandonadas."""
+        if self.fitness_values is None:
+            self.inicializar()
+        self._fase_funcionarias()
+        cronometro.marcar("funcionarias")
+        self._fase_observadoras()
+        cronometro.marcar("observadoras")
+
+        # Atualiza a melhor posição antes de abandonar fontes
+        indice_melhor = np.argmin(self.fitness_values)
+        if self.fitness_values[indice_melhor] < self.best_fitness:
+            self.best_fitness = self.fitness_values[indice_melhor]
+            self.best_position = self.food_sources[indice_melhor].copy()
+
+        num_exploradoras = self._fase_exploradoras()
+        cronometro.marcar("exploradoras")
+        return num_exploradoras
+
+    def emigrantes(self, quantidade):
+        """As ``quantidade`` melhores fontes de alimento e seus fitness."""
+        if self.fitness_values is None:
+            self.inicializar()
+        indices = np.argsort(self.fitness_values, kind="stable")[:quantidade]
+        return self.food_sources[indices].copy(), self.fitness_values[indices].copy()
+
+    def receber_migrantes(self, posicoes, fitness):
+        """Substitui as piores fontes pelos imigrantes, com o contador de tentativas zerado."""
+        if self.fitness_values is None:
+            self.inicializar()
+        quantidade = min(len(fitness), self.num_bees)
+        piores = np.argsort(self.fitness_values, kind="stable")[::-1][:quantidade]
+        self.food_sources[piores] = posicoes[:quantidade]
+        self.fitness_values[piores] = fitness[:quantidade]
+        self.tentativas[piores] = 0
+        indice_melhor = np.argmin(self.fitness_values)
+        if self.fitness_values[indice_melhor] < self.best_fitness:
+            self.best_fitness = self.fitness_values[indice_melhor]
+            self.best_position = self.food_sources[indice_melhor].copy()
+
+    def _salvar(self, checkpoint, iteracao, historico_melhor, historico_pior, parada=None):
+        checkpoint.salvar("abc", iteracao, self.rng, food_sources=self.food_sources,
+                          fitness_values=self.fitness_values, tentativas=self.tentativas,
+                          best_position=self.best_position, best_fitness=self.best_fitness,
+                          historico_melhor=historico_melhor, historico_pior=historico_pior,
+                          **(parada.estado() if parada is not None else {}),
+                          **(self.substituto.estado() if self.substituto is not None else {}))
+
+    def _restaurar(self, estado):
+        conferir_forma(estado, "food_sources", (self.num_bees, self.dim))
+        self.food_sources = estado["food_sources"]
+        self.fitness_values = estado["fitness_values"]
+        self.tentativas = estado["tentativas"]
+        self.best_position = estado["best_position"]
+        self.best_fitness = estado["best_fitness"][()]
+        if self.substituto is not None:
+            self.substituto.restaurar(estado)
+        return estado["geracao"], estado["historico_melhor"].tolist(), estado["historico_pior"].tolist()
+
+    def optimize(self, callback=None, telemetria=None, guardar_historico=True, checkpoint=None, parada=None,
+                 perfil=None, mostrar_prints=False):
+        """
+        Executa ``max_iter`` iterações do ABC.
+
+        Parâmetros:
+            callback (callable | None): Chamada como ``callback(iteracao,
+                food_sources, fitness_values)`` ao fim de cada iteração.
+            telemetria (TelemetriaCSV | TelemetriaAnel | None): Destino das
+                métricas de cada iteração (ver ``otimizacao.telemetria``).
+            guardar_historico (bool): Se falso, os históricos não são acumulados.
+            checkpoint (Checkpoint | None): Grava o estado periodicamente e, se o
+                arquivo já existir, retoma a execução a partir dele
+                (ver ``otimizacao.checkpoint``).
+            parada (CriteriosParada | None): Critérios de parada antecipada,
+                verificados ao fim de cada geração; o critério atingido fica em
+                ``parada.motivo`` (ver ``otimizacao.parada``).
+            perfil (CronometroFases | None): Acumula o tempo de cada fase
+                (``perfil.resumo()``). Sem ``perfil`` nem ``telemetria``, as fases
+                não são cronometradas.
+            mostrar_prints (bool): Imprime o melhor e o pior fitness e o número de
+                fontes abandonadas a cada iteração.
+
+        Retorna:
+            tuple: (best_position, best_fitness, historico_melhor, historico_pior)
+        """
+        inicio = 0
+        historico_melhor = []
+        historico_pior = []
+        estado = checkpoint.carregar("abc", self.rng) if checkpoint is not None else None
+        if estado is not None:
+            inicio, historico_melhor, historico_pior = self._restaurar(estado)
+        elif self.fitness_values is None:
+            self.inicializar()
+        if parada is not None:
+            parada.iniciar(self.num_bees)
+            if estado is not None:
+                parada.restaurar(estado)
+        cronometro = escolher_cronometro(perfil, telemetria)
+
+        # Um checkpoint gravado na parada antecipada devolve o resultado sem novas gerações
+        fim = inicio if parada is not None and parada.motivo is not None else self.max_iter
+        for iteration in range(inicio, fim):
+            cronometro.reiniciar()
+            avaliacoes_antes = self.substituto.avaliacoes_reais if self.substituto is not None else 0
+            num_exploradoras = self.passo(cronometro)
+            if self.substituto is None:
+                avaliacoes = 2 * self.num_bees + num_exploradoras
+            else:
+                avaliacoes = self.substituto.avaliacoes_reais - avaliacoes_antes
+
+            if guardar_historico:
+                historico_melhor.append(self.best_fitness)
+                historico_pior.append(np.max(self.fitness_values))
+
+            if callback is not None:
+                callback(iteration, self.food_sources, self.fitness_values)
+                cronometro.marcar("callback")
+
+            if telemetria is not None:
+                telemetria.registrar(metricas_geracao(iteration + 1, self.best_fitness, self.fitness_values,
+                                                      self.food_sources, avaliacoes,
+                                                      cronometro))
+
+            if mostrar_prints:
+                print(f"[Iteração {iteration + 1}] melhor = {self.best_fitness:.6f} | "
+                      f"pior = {np.max(self.fitness_values):.6f} | fontes abandonadas = {num_exploradoras}")
+
+            parar = parada is not None and parada.verificar(iteration + 1, self.best_fitness, self.food_sources,
+                                                            avaliacoes)
+
+            if checkpoint is not None and (parar or checkpoint.deve_salvar(iteration + 1, self.max_iter)):
+                self._salvar(checkpoint, iteration + 1, historico_melhor, historico_pior, parada)
+
+            if parar:
+                break
+
+        return self.best_position, self.best_fitness, historico_melhor, historico_pior
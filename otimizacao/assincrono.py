@@ -0,0 +1,345 @@
+"""
+Interface perguntar/responder (``ask``/``tell``) para avaliadores externos.
+
+``pso``, ``ABC`` e ``algoritmo_genetico`` controlam o próprio laço e esperam
+a geração inteira ser avaliada. As classes deste módulo invertem o controle:
+``ask(n)`` devolve até ``n`` candidatos com identificadores e
+``tell(ids, fitness)`` recebe os resultados quando chegarem, em qualquer
+ordem. Para isso cada algoritmo roda na sua forma de estado estacionário:
+
+- ``PSOAssincrono``: cada partícula se move assim que sua avaliação anterior
+  chega, usando o melhor global daquele momento (PSO assíncrono);
+- ``ABCAssincrono``: cada candidato é uma tentativa de vizinhança de uma
+  fonte (alternando funcionárias e observadoras) com seleção gulosa na
+  chegada; fontes abandonadas voltam como posições aleatórias a avaliar;
+- ``GAAssincrono``: GA de estado estacionário; cada filho avaliado substitui
+  o pior indivíduo da população se for melhor.
+
+``otimizar_assincrono`` é o driver para ``asyncio``: mantém ``em_voo``
+avaliações em andamento e entrega cada resultado ao otimizador assim que ele
+termina, de modo que nenhum avaliador fica ocioso esperando o mais lento:
+
+    async def avaliar(x):
+        return await fila_de_jobs.enviar(x)
+
+    otimizador = PSOAssincrono(dimensao=10, limites=(-5.12, 5.12), semente=0)
+    melhor, fitness = asyncio.run(otimizar_assincrono(otimizador, avaliar, num_avaliacoes=10_000, em_voo=64))
+
+Para uma função síncrona lenta, ``avaliar`` pode repassá-la a um executor
+(``loop.run_in_executor``).
+"""
+import asyncio
+import inspect
+from collections import deque
+
+import numpy as np
+
+from otimizacao.abelhas import qualidade, sortear_roleta
+from otimizacao.genetico import crossover_um_ponto, mutacao, selecao_torneio
+
+
+class _Assincrono:
+    """Identificadores e candidatos pendentes, comuns aos três otimizadores."""
+
+    def __init__(self, semente):
+        self.rng = np.random.default_rng(semente)
+        self.num_avaliacoes = 0
+        self._proximo_id = 0
+        self._pendentes = {}
+
+    @property
+    def num_pendentes(self):
+        """Candidatos entregues por ``ask`` ainda sem resposta."""
+        return len(self._pendentes)
+
+    def ask(self, n=1):
+        """
+        Gera até ``n`` candidatos para avaliação.
+
+        Pode devolver menos que ``n`` (ex.: no PSO, quando todas as partículas
+        já estão em avaliação).
+
+        Retorna:
+            tuple: (ids ``(k,)``, candidatos ``(k, dim)``)
+        """
+        infos, candidatos = self._gerar(n)
+        ids = np.arange(self._proximo_id, self._proximo_id + len(infos))
+        self._proximo_id += len(infos)
+        self._pendentes.update(zip(ids.tolist(), infos))
+        return ids, candidatos
+
+    def tell(self, ids, fitness):
+        """
+        Informa o fitness de candidatos entregues por ``ask``, em qualquer ordem
+        e em qualquer quantidade.
+        """
+        ids = np.atleast_1d(ids)
+        fitness = np.asarray(fitness, dtype=float).reshape(len(ids))
+        desconhecidos = [int(i) for i in ids if int(i) not in self._pendentes]
+        if desconhecidos:
+            raise ValueError(f"Candidatos desconhecidos ou já informados: {desconhecidos}.")
+        self._receber([self._pendentes.pop(int(i)) for i in ids], fitness)
+        self.num_avaliacoes += len(ids)
+
+
+class PSOAssincrono(_Assincrono):
+    """
+    PSO assíncrono (topologia gbest), minimizando.
+
+    Parâmetros:
+        dimensao, num_particulas, w, c1, c2, limites, semente: Como em ``pso``.
+    """
+
+    def __init__(self, dimensao=2, num_particulas=30, w=0.5, c1=1, c2=2, limites=(-100, 100), semente=None):
+        super().__init__(semente)
+        self.dimensao = dimensao
+        self.w, self.c1, self.c2 = w, c1, c2
+        self.limite_inferior, self.limite_superior = limites
+        self.particulas = self.rng.uniform(self.limite_inferior, self.limite_superior, (num_particulas, dimensao))
+        self.velocidades = np.zeros((num_particulas, dimensao))
+        self.melhores_posicoes = self.particulas.copy()
+        self.melhores_fitness = np.full(num_particulas, np.inf)
+        self.melhor_global = self.particulas[0].copy()
+        self.melhor_fitness_global = np.inf
+        self._avaliada = np.zeros(num_particulas, dtype=bool)
+        self._livres = deque(range(num_particulas))
+
+    def _gerar(self, quantidade):
+        indices = np.array([self._livres.popleft() for _ in range(min(quantidade, len(self._livres)))], dtype=int)
+        # Partículas ainda não avaliadas são avaliadas na posição inicial
+        mover = indices[self._avaliada[indices]]
+        if len(mover):
+            particulas = self.particulas[mover]
+            r1 = self.rng.random(particulas.shape)
+            r2 = self.rng.random(particulas.shape)
+            velocidades = (self.w * self.velocidades[mover]
+                           + self.c1 * r1 * (self.melhores_posicoes[mover] - particulas)
+                           + self.c2 * r2 * (self.melhor_global - particulas))
+            self.velocidades[mover] = velocidades
+            self.particulas[mover] = np.clip(particulas + velocidades, self.limite_inferior, self.limite_superior)
+        return indices.tolist(), self.particulas[indices].copy()
+
+    def _receber(self, indices, fitness):
+        for indice, valor in zip(indices, fitness):
+            self._avaliada[indice] = True
+            if valor < self.melhores_fitness[indice]:
+                self.melhores_fitness[indice] = valor
+                self.melhores_posicoes[indice] = self.particulas[indice]
+                if valor < self.melhor_fitness_global:
+                    self.melhor_fitness_global = valor
+                    self.melhor_global = self.particulas[indice].copy()
+            self._livres.append(indice)
+
+    def melhor(self):
+        """(melhor_global, melhor_fitness_global)"""
+        return self.melhor_global, self.melhor_fitness_global
+
+
+class ABCAssincrono(_Assincrono):
+    """
+    ABC de estado estacionário, minimizando.
+
+    Parâmetros:
+        num_bees, dim, lim_inf, lim_sup, limite_abandono, semente: Como em ``ABC``.
+    """
+
+    def __init__(self, num_bees=30, dim=2, lim_inf=-5.12, lim_sup=5.12, limite_abandono=None, semente=None):
+        super().__init__(semente)
+        self.num_bees = num_bees
+        self.dim = dim
+        self.lim_inf = lim_inf
+        self.lim_sup = lim_sup
+        self.limite_abandono = num_bees * dim if limite_abandono is None else limite_abandono
+        self.food_sources = self.rng.uniform(lim_inf, lim_sup, (num_bees, dim))
+        self.fitness_values = np.full(num_bees, np.inf)
+        self.tentativas = np.zeros(num_bees, dtype=np.int64)
+        # Incrementada a cada abandono: descarta respostas de candidatos gerados a partir da fonte antiga
+        self._versao = np.zeros(num_bees, dtype=np.int64)
+        self.best_position = None
+        self.best_fitness = np.inf
+        self._conhecida = np.zeros(num_bees, dtype=bool)
+        self._a_avaliar = deque(range(num_bees))
+        self._proxima_funcionaria = 0
+        self._observadora = False
+
+    def _fonte_vizinha(self):
+        conhecidas = np.flatnonzero(self._conhecida)
+        if self._observadora:
+            fonte = conhecidas[sortear_roleta(qualidade(self.fitness_values[conhecidas]), 1, self.rng)[0]]
+        else:
+            posicao = np.searchsorted(conhecidas, self._proxima_funcionaria) % len(conhecidas)
+            fonte = conhecidas[posicao]
+            self._proxima_funcionaria = fonte + 1
+        self._observadora = not self._observadora
+        return fonte
+
+    def _gerar(self, quantidade):
+        infos, candidatos = [], []
+        for _ in range(quantidade):
+            if self._a_avaliar:
+                fonte = self._a_avaliar.popleft()
+                candidato = self.food_sources[fonte].copy()
+                infos.append((fonte, self._versao[fonte], True, candidato))
+            elif self._conhecida.any():
+                # Mesmo movimento do ABC: perturbação relativa à melhor fonte
+                fonte = self._fonte_vizinha()
+                origem = self.food_sources[fonte]
+                phi = self.rng.uniform(-1, 1, self.dim)
+                candidato = np.clip(origem + phi * (origem - self.best_position), self.lim_inf, self.lim_sup)
+                infos.append((fonte, self._versao[fonte], False, candidato))
+            else:
+                break
+            candidatos.append(candidato)
+        return infos, np.array(candidatos).reshape(len(candidatos), self.dim)
+
+    def _receber(self, infos, fitness):
+        for (fonte, versao, inicial, candidato), valor in zip(infos, fitness):
+            # O primeiro candidato respondido vira a referência do movimento, mesmo com fitness inf ou nan
+            if self.best_position is None or valor < self.best_fitness:
+                self.best_position = candidato.copy()
+            if valor < self.best_fitness:
+                self.best_fitness = valor
+            if versao != self._versao[fonte]:
+                continue  # a fonte foi abandonada (e talvez reiniciada) enquanto o candidato era avaliado
+            if inicial:
+                self.fitness_values[fonte] = valor
+                self._conhecida[fonte] = True
+                self.tentativas[fonte] = 0
+            elif valor < self.fitness_values[fonte]:
+                self.food_sources[fonte] = candidato
+                self.fitness_values[fonte] = valor
+                self.tentativas[fonte] = 0
+            else:
+                self.tentativas[fonte] += 1
+                if self.tentativas[fonte] > self.limite_abandono:
+                    # Exploradora: a fonte volta como posição aleatória a avaliar
+                    self.food_sources[fonte] = self.rng.uniform(self.lim_inf, self.lim_sup, self.dim)
+                    self.fitness_values[fonte] = np.inf
+                    self._conhecida[fonte] = False
+                    self._versao[fonte] += 1
+                    self._a_avaliar.append(fonte)
+
+    def melhor(self):
+        """(best_position, best_fitness)"""
+        return self.best_position, self.best_fitness
+
+
+class GAAssincrono(_Assincrono):
+    """
+    GA binário de estado estacionário, maximizando (como ``algoritmo_genetico``).
+
+    Parâmetros:
+        n_itens (int): Número de genes.
+        tamanho_populacao, taxa_mutacao, tamanho_torneio, semente: Como em
+            ``algoritmo_genetico``.
+        reparo (callable | None): Aplicado in-place à matriz de filhos antes da
+            avaliação (ex.: ``lambda filhos: reparar_mochila(filhos, pesos,
+            valores, capacidade)``).
+    """
+
+    def __init__(self, n_itens, tamanho_populacao=100, taxa_mutacao=0.8, tamanho_torneio=3, semente=None,
+                 reparo=None):
+        if tamanho_populacao < 2:
+            raise ValueError("tamanho_populacao deve ser pelo menos 2 (o crossover precisa de dois pais).")
+        super().__init__(semente)
+        self.n_itens = n_itens
+        self.taxa_mutacao = taxa_mutacao
+        self.tamanho_torneio = tamanho_torneio
+        self.reparo = reparo
+        self.populacao = self.rng.random((tamanho_populacao, n_itens)) < 0.5
+        if reparo is not None:
+            reparo(self.populacao)
+        self.fitness = np.full(tamanho_populacao, -np.inf)
+        self._avaliado = np.zeros(tamanho_populacao, dtype=bool)
+        self._a_avaliar = deque(range(tamanho_populacao))
+
+    def _filhos(self, quantidade):
+        # Torneio entre os indivíduos já avaliados, dois filhos por par de pais
+        avaliados = np.flatnonzero(self._avaliado)
+        num_pares = -(-quantidade // 2)
+        pais = self.populacao[avaliados[selecao_torneio(self.fitness[avaliados], 2 * num_pares,
+                                                         self.tamanho_torneio, self.rng)]]
+        filhos = mutacao(crossover_um_ponto(pais[0::2], pais[1::2], self.rng), self.taxa_mutacao, self.rng)
+        if self.reparo is not None:
+            self.reparo(filhos)
+        return filhos[:quantidade]
+
+    def _gerar(self, quantidade):
+        iniciais = [self._a_avaliar.popleft() for _ in range(min(quantidade, len(self._a_avaliar)))]
+        infos = [(indice, self.populacao[indice].copy()) for indice in iniciais]
+        restantes = quantidade - len(iniciais)
+        if restantes > 0 and self._avaliado.sum() >= 2:
+            infos += [(None, filho) for filho in self._filhos(restantes)]
+        candidatos = np.array([individuo for _, individuo in infos], dtype=bool).reshape(len(infos), self.n_itens)
+        return infos, candidatos
+
+    def _receber(self, infos, fitness):
+        for (indice, individuo), valor in zip(infos, fitness):
+            if indice is not None:
+                self.fitness[indice] = valor
+                self._avaliado[indice] = True
+                continue
+            # O filho substitui o pior indivíduo já avaliado, se for melhor
+            avaliados = np.flatnonzero(self._avaliado)
+            pior = avaliados[np.argmin(self.fitness[avaliados])]
+            if valor > self.fitness[pior]:
+                self.populacao[pior] = individuo
+                self.fitness[pior] = valor
+
+    def melhor(self):
+        """(melhor_individuo como vetor 0/1, melhor_fitness)"""
+        indice = np.argmax(self.fitness)
+        return self.populacao[indice].astype(int), self.fitness[indice]
+
+
+async def otimizar_assincrono(otimizador, avaliar, num_avaliacoes, em_voo=8, callback=None):
+    """
+    Conduz um otimizador ``ask``/``tell`` com até ``em_voo`` avaliações simultâneas.
+
+    Parâmetros:
+        otimizador (PSOAssincrono | ABCAssincrono | GAAssincrono): Otimizador.
+        avaliar (callable): ``avaliar(candidato)`` devolve o fitness ou um
+            awaitable com o fitness (ex.: uma função ``async``).
+        num_avaliacoes (int): Total de candidatos enviados para avaliação.
+        em_voo (int): Avaliações mantidas em andamento.
+        callback (callable | None): Chamada como ``callback(num_avaliacoes,
+            candidatos, fitness)`` a cada lote de resultados entregue ao otimizador.
+
+    Retorna:
+        tuple: ``otimizador.melhor()``.
+    """
+    pendentes = {}
+    enviadas = 0
+    try:
+        while enviadas < num_avaliacoes or pendentes:
+            vagas = min(em_voo - len(pendentes), num_avaliacoes - enviadas)
+            if vagas > 0:
+                ids, candidatos = otimizador.ask(vagas)
+                for identificador, candidato in zip(ids, candidatos):
+                    resultado = avaliar(candidato)
+                    if not inspect.isawaitable(resultado):
+                        resultado = _pronto(resultado)
+                    pendentes[asyncio.ensure_future(resultado)] = (identificador, candidato)
+                enviadas += len(ids)
+            if not pendentes:
+                break
+
+            prontas, _ = await asyncio.wait(pendentes, return_when=asyncio.FIRST_COMPLETED)
+            prontas = list(prontas)
+            ids, candidatos = zip(*(pendentes.pop(tarefa) for tarefa in prontas))
+            # Lê a exceção de todas as tarefas prontas (e não só da primeira) antes de propagar
+            erros = [tarefa.exception() for tarefa in prontas if tarefa.exception() is not None]
+            if erros:
+                raise erros[0]
+            fitness = np.array([tarefa.result() for tarefa in prontas], dtype=float)
+            otimizador.tell(np.array(ids), fitness)
+            if callback is not None:
+                callback(otimizador.num_avaliacoes, np.array(candidatos), fitness)
+    finally:
+        for tarefa in pendentes:
+            tarefa.cancel()
+    return otimizador.melhor()
+
+
+async def _pronto(valor):
+    return valor
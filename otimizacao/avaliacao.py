@@ -0,0 +1,201 @@
+"""
+Avaliadores de fitness em lote: serial, com threads ou com processos.
+
+Um avaliador é um callable marcado como ``vetorizada`` que recebe a matriz
+``(n_pontos, dim)`` de candidatos e devolve o vetor de fitness. Como os
+otimizadores já avaliam a população inteira com ``avaliar_populacao``, basta
+passar o avaliador no lugar da função objetivo:
+
+    with criar_avaliador(simulacao, backend="processos", num_trabalhadores=8) as avaliador:
+        pso(avaliador, dimensao=30)
+
+O backend de processos copia os candidatos para um bloco de memória
+compartilhada (``multiprocessing.shared_memory``), de modo que a matriz não é
+serializada com pickle a cada geração; cada processo lê um bloco de linhas e
+escreve o resultado no vetor de saída também compartilhado. A ordem das linhas
+é preservada, portanto o resultado é idêntico ao serial para a mesma semente.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+
+import numpy as np
+
+from otimizacao.objetivos import avaliar_populacao, como_matriz
+
+BACKENDS = ("serial", "threads", "processos")
+
+
+def _blocos(n_pontos, tamanho_bloco, num_trabalhadores):
+    if tamanho_bloco is None:
+        tamanho_bloco = max(1, -(-n_pontos // num_trabalhadores))
+    return [(inicio, min(inicio + tamanho_bloco, n_pontos)) for inicio in range(0, n_pontos, tamanho_bloco)]
+
+
+class AvaliadorSerial:
+    """Avalia o lote inteiro no processo atual."""
+
+    vetorizada = True
+
+    def __init__(self, funcao):
+        self.funcao = funcao
+        self.num_avaliacoes = 0
+
+    def __call__(self, pontos):
+        pontos = como_matriz(pontos)
+        self.num_avaliacoes += len(pontos)
+        return avaliar_populacao(self.funcao, pontos)
+
+    def fechar(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+class AvaliadorThreads(AvaliadorSerial):
+    """
+    Divide o lote em blocos avaliados por um pool de threads.
+
+    Indicado para funções objetivo que liberam o GIL (NumPy, E/S, chamadas a
+    simuladores externos).
+    """
+
+    def __init__(self, funcao, num_trabalhadores=None, tamanho_bloco=None):
+        super().__init__(funcao)
+        self.num_trabalhadores = num_trabalhadores or os.cpu_count() or 1
+        self.tamanho_bloco = tamanho_bloco
+        self._pool = ThreadPoolExecutor(max_workers=self.num_trabalhadores)
+
+    def __call__(self, pontos):
+        pontos = como_matriz(pontos)
+        self.num_avaliacoes += len(pontos)
+        resultado = np.empty(len(pontos))
+        blocos = _blocos(len(pontos), self.tamanho_bloco, self.num_trabalhadores)
+
+        def avaliar_bloco(limites):
+            inicio, fim = limites
+            resultado[inicio:fim] = avaliar_populacao(self.funcao, pontos[inicio:fim])
+
+        list(self._pool.map(avaliar_bloco, blocos))
+        return resultado
+
+    def fechar(self):
+        self._pool.shutdown()
+
+
+# ----------------------------
+# Backend de processos com memória compartilhada
+# ----------------------------
+_funcao_trabalhador = None
+_memorias_trabalhador = {}
+
+
+def _inicializar_trabalhador(funcao):
+    global _funcao_trabalhador
+    _funcao_trabalhador = funcao
+
+
+def _anexar(nomes):
+    memorias = _memorias_trabalhador.get(nomes)
+    if memorias is None:
+        # O processo principal realocou os blocos: descarta os anexos antigos
+        for antigas in _memorias_trabalhador.values():
+            for memoria in antigas:
+                memoria.close()
+        _memorias_trabalhador.clear()
+
+        memorias = tuple(shared_memory.SharedMemory(name=nome) for nome in nomes)
+        _memorias_trabalhador[nomes] = memorias
+    return memorias
+
+
+def _avaliar_bloco_compartilhado(nome_entrada, nome_saida, forma, inicio, fim):
+    memoria_entrada, memoria_saida = _anexar((nome_entrada, nome_saida))
+    entrada = np.ndarray(forma, dtype=np.float64, buffer=memoria_entrada.buf)
+    saida = np.ndarray(forma[0], dtype=np.float64, buffer=memoria_saida.buf)
+    saida[inicio:fim] = avaliar_populacao(_funcao_trabalhador, entrada[inicio:fim])
+
+
+class AvaliadorProcessos(AvaliadorSerial):
+    """
+    Divide o lote em blocos avaliados por um pool de processos.
+
+    A função objetivo é enviada uma única vez para cada processo (no
+    inicializador do pool) e precisa ser serializável com pickle, isto é,
+    definida no nível de módulo.
+    """
+
+    def __init__(self, funcao, num_trabalhadores=None, tamanho_bloco=None):
+        super().__init__(funcao)
+        self.num_trabalhadores = num_trabalhadores or os.cpu_count() or 1
+        self.tamanho_bloco = tamanho_bloco
+        self._pool = ProcessPoolExecutor(max_workers=self.num_trabalhadores,
+                                         initializer=_inicializar_trabalhador, initargs=(funcao,))
+        self._entrada = None
+        self._saida = None
+
+    def _reservar(self, n_pontos, dim):
+        necessario = max(1, n_pontos * dim * 8)
+        if self._entrada is None or self._entrada.size < necessario or self._saida.size < n_pontos * 8:
+            self._liberar()
+            # Reserva com folga para que lotes um pouco maiores não realoquem o bloco
+            self._entrada = shared_memory.SharedMemory(create=True, size=2 * necessario)
+            self._saida = shared_memory.SharedMemory(create=True, size=max(8, 2 * n_pontos * 8))
+
+    def _liberar(self):
+        for memoria in (self._entrada, self._saida):
+            if memoria is not None:
+                memoria.close()
+                memoria.unlink()
+        self._entrada = self._saida = None
+
+    def __call__(self, pontos):
+        pontos = como_matriz(pontos)
+        n_pontos, dim = pontos.shape
+        self.num_avaliacoes += n_pontos
+        if n_pontos == 0:
+            return np.empty(0)
+
+        self._reservar(n_pontos, dim)
+        entrada = np.ndarray((n_pontos, dim), dtype=np.float64, buffer=self._entrada.buf)
+        saida = np.ndarray(n_pontos, dtype=np.float64, buffer=self._saida.buf)
+        entrada[:] = pontos
+
+        futuros = [self._pool.submit(_avaliar_bloco_compartilhado, self._entrada.name, self._saida.name,
+                                     (n_pontos, dim), inicio, fim)
+                   for inicio, fim in _blocos(n_pontos, self.tamanho_bloco, self.num_trabalhadores)]
+        for futuro in futuros:
+            futuro.result()
+        return saida.copy()
+
+    def fechar(self):
+        self._pool.shutdown()
+        self._liberar()
+
+
+def criar_avaliador(funcao, backend="serial", num_trabalhadores=None, tamanho_bloco=None):
+    """
+    Cria um avaliador em lote para ``funcao``.
+
+    Parâmetros:
+        funcao (callable): Função objetivo (escalar ou marcada com ``@vetorizada``).
+        backend (str): ``"serial"``, ``"threads"`` ou ``"processos"``.
+        num_trabalhadores (int | None): Número de threads/processos. O padrão é
+            ``os.cpu_count()``.
+        tamanho_bloco (int | None): Linhas por tarefa. O padrão divide o lote
+            igualmente entre os trabalhadores.
+
+    Retorna:
+        AvaliadorSerial: Avaliador utilizável como função objetivo vetorizada.
+    """
+    if backend == "serial":
+        return AvaliadorSerial(funcao)
+    if backend == "threads":
+        return AvaliadorThreads(funcao, num_trabalhadores, tamanho_bloco)
+    if backend == "processos":
+        return AvaliadorProcessos(funcao, num_trabalhadores, tamanho_bloco)
+    raise ValueError(f"Backend de avaliação desconhecido: {backend!r}. Use um de {BACKENDS}.")
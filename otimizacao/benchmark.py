@@ -0,0 +1,405 @@
+"""
+Medições de desempenho das funções objetivo e dos otimizadores.
+
+- ``comparar_objetivos``: avaliação ponto a ponto (como nos scripts
+  originais) contra a avaliação vetorizada de ``otimizacao.objetivos``.
+- ``executar_suite``: roda ``pso``, ``ABC`` e o GA da mochila sobre uma grade
+  de dimensões, tamanhos de população e sementes, registrando tempo de
+  parede, avaliações por segundo, pico de memória e fitness final. O relatório
+  é salvo em JSON e pode ser comparado com um relatório de referência; com
+  ``--referencia``, o comando termina com código de saída 1 se houver
+  regressão.
+- ``conferir_paridade``: roda os otimizadores com ``nucleo="numpy"`` e com o
+  núcleo compilado (``otimizacao.compilado``) para a mesma semente e confere
+  que os resultados coincidem; termina com código de saída 1 se divergirem.
+
+Uso:
+    python -m otimizacao.benchmark objetivos
+    python -m otimizacao.benchmark suite --saida atual.json --referencia base.json
+    python -m otimizacao.benchmark paridade
+"""
+import argparse
+import json
+import math
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from otimizacao.abelhas import ABC
+from otimizacao.avaliacao import AvaliadorSerial
+from otimizacao.compilado import NUMBA_DISPONIVEL
+from otimizacao.genetico import algoritmo_genetico
+from otimizacao.objetivos import FUNCOES_TESTE, rastrigin, schaffer_n2
+from otimizacao.pso import pso
+
+
+# ----------------------------
+# Implementações originais, usadas como referência
+# ----------------------------
+def _rastrigin_por_ponto(lista_x):
+    acumulador = 0
+    for x in lista_x:
+        acumulador += x ** 2 - 10 * math.cos(2 * math.pi * x)
+    return 10 * len(lista_x) + acumulador
+
+
+def _schaffer_por_ponto(lista_x):
+    x, y = lista_x
+    numerador = (math.sin(x**2 - y**2))**2 - 0.5
+    denominador = (1 + 0.001 * (x**2 + y**2))**2
+    return 0.5 + numerador / denominador
+
+
+def _cronometrar(funcao, repeticoes):
+    melhor = math.inf
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        funcao()
+        melhor = min(melhor, time.perf_counter() - inicio)
+    return melhor
+
+
+def comparar_objetivos(n_pontos=10_000, dimensoes=(2, 10, 30), repeticoes=5, semente=0):
+    """
+    Cronometra as versões ponto a ponto e vetorizadas das funções objetivo.
+
+    Parâmetros:
+        n_pontos (int): Número de pontos avaliados por chamada.
+        dimensoes (tuple of int): Dimensões testadas na função de Rastrigin.
+        repeticoes (int): Número de repetições; é reportado o menor tempo.
+        semente (int): Semente do gerador de pontos aleatórios.
+
+    Retorna:
+        list of dict: Uma linha por caso com os tempos (em segundos) e o ganho.
+    """
+    rng = np.random.default_rng(semente)
+    casos = [("rastrigin", d, _rastrigin_por_ponto, rastrigin, (-5.12, 5.12)) for d in dimensoes]
+    casos.append(("schaffer_n2", 2, _schaffer_por_ponto, schaffer_n2, (-100, 100)))
+
+    resultados = []
+    for nome, dim, por_ponto, vetorial, (inf, sup) in casos:
+        pontos = rng.uniform(inf, sup, (n_pontos, dim))
+        lista = pontos.tolist()
+
+        esperado = np.array([por_ponto(p) for p in lista])
+        if not np.allclose(vetorial(pontos), esperado):
+            raise AssertionError(f"{nome} (dim={dim}): versão vetorizada diverge da referência.")
+
+        t_ponto = _cronometrar(lambda: [por_ponto(p) for p in lista], repeticoes)
+        t_vetor = _cronometrar(lambda: vetorial(pontos), repeticoes)
+        resultados.append({
+            "funcao": nome,
+            "dim": dim,
+            "n_pontos": n_pontos,
+            "tempo_por_ponto": t_ponto,
+            "tempo_vetorizado": t_vetor,
+            "ganho": t_ponto / t_vetor,
+        })
+    return resultados
+
+
+def imprimir_tabela(resultados):
+    print(f"{'função':<12} {'dim':>4} {'pontos':>8} {'por ponto (ms)':>15} {'vetorizado (ms)':>16} {'ganho':>8}")
+    for r in resultados:
+        print(f"{r['funcao']:<12} {r['dim']:>4} {r['n_pontos']:>8} "
+              f"{r['tempo_por_ponto'] * 1e3:>15.2f} {r['tempo_vetorizado'] * 1e3:>16.2f} {r['ganho']:>7.1f}x")
+
+
+# ----------------------------
+# Suíte de otimizadores
+# ----------------------------
+ALGORITMOS = ("pso", "abc", "ga")
+
+
+def instancia_mochila(n_itens, semente):
+    """
+    Instância aleatória da mochila usada na suíte e nas varreduras: pesos e
+    valores inteiros em ``[1, 100)`` e capacidade igual à metade do peso total.
+
+    Retorna:
+        tuple: (pesos, valores, capacidade)
+    """
+    rng = np.random.default_rng(semente)
+    pesos = rng.integers(1, 100, n_itens).astype(float)
+    valores = rng.integers(1, 100, n_itens).astype(float)
+    return pesos, valores, pesos.sum() / 2
+
+
+def _medir(executar, repeticoes=5, medir_memoria=True):
+    # Tempo: menor de várias execuções sem tracemalloc (o rastreamento deixa cada alocação mais lenta).
+    # Pico de memória: uma execução à parte com tracemalloc ligado.
+    tempo = math.inf
+    for _ in range(repeticoes):
+        inicio = time.perf_counter()
+        resultado = executar()
+        tempo = min(tempo, time.perf_counter() - inicio)
+    pico = None
+    if medir_memoria:
+        tracemalloc.start()
+        try:
+            executar()
+            pico = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    return resultado, tempo, pico
+
+
+def executar_caso(algoritmo, funcao, dim, tamanho_populacao, semente, geracoes, repeticoes=5):
+    """
+    Executa um caso da suíte e retorna uma linha do relatório.
+
+    Para o GA, ``dim`` é o número de itens de uma instância aleatória da
+    mochila e ``funcao`` é ignorada. O tempo é o menor de ``repeticoes``
+    execuções; o pico de memória vem de uma execução extra com ``tracemalloc``.
+    """
+    if algoritmo == "ga":
+        pesos, valores, capacidade = instancia_mochila(dim, semente)
+
+        def executar():
+            resultado = algoritmo_genetico(pesos, valores, capacidade, tamanho_populacao=tamanho_populacao,
+                                           geracoes=geracoes, semente=semente)
+            return resultado, tamanho_populacao * (geracoes + 1)
+        funcao = "mochila"
+    else:
+        objetivo, (inf, sup), _ = FUNCOES_TESTE[funcao]
+        if algoritmo not in ("pso", "abc"):
+            raise ValueError(f"Algoritmo desconhecido: {algoritmo!r}. Use um de {ALGORITMOS}.")
+
+        def executar():
+            # Contador novo a cada repetição: as avaliações são as de uma execução
+            contador = AvaliadorSerial(objetivo)
+            if algoritmo == "pso":
+                resultado = pso(contador, dimensao=dim, num_particulas=tamanho_populacao, num_iteracoes=geracoes,
+                                limites=(inf, sup), semente=semente, mostrar_prints=False)
+            else:
+                resultado = ABC(contador, num_bees=tamanho_populacao, max_iter=geracoes, dim=dim,
+                                lim_inf=inf, lim_sup=sup, semente=semente).optimize()
+            return resultado, contador.num_avaliacoes
+
+    ((_, fitness, _, _), avaliacoes), tempo, pico = _medir(executar, repeticoes)
+
+    return {
+        "algoritmo": algoritmo,
+        "funcao": funcao,
+        "dim": dim,
+        "populacao": tamanho_populacao,
+        "semente": semente,
+        "geracoes": geracoes,
+        "tempo_s": tempo,
+        "avaliacoes": avaliacoes,
+        "avaliacoes_por_s": avaliacoes / tempo if tempo > 0 else math.inf,
+        "pico_memoria_bytes": pico,
+        "fitness_final": float(fitness),
+    }
+
+
+def executar_suite(algoritmos=ALGORITMOS, funcoes=tuple(FUNCOES_TESTE), dimensoes=(2, 10, 30),
+                   tamanhos_populacao=(30, 300), sementes=(0, 1, 2), geracoes=100, repeticoes=5, mostrar_prints=True):
+    """
+    Executa a grade completa de casos.
+
+    Funções de dimensão fixa (Schaffer N2) só rodam na sua dimensão; o GA roda
+    uma vez por combinação de dimensão (número de itens), população e semente.
+    Cada caso é cronometrado ``repeticoes`` vezes (ver ``executar_caso``).
+
+    Retorna:
+        list of dict: Uma linha por caso (ver ``executar_caso``).
+    """
+    resultados = []
+    for algoritmo in algoritmos:
+        for funcao in (("mochila",) if algoritmo == "ga" else funcoes):
+            dimensao_fixa = None if algoritmo == "ga" else FUNCOES_TESTE[funcao][2]
+            for dim in dimensoes:
+                if dimensao_fixa is not None and dim != dimensao_fixa:
+                    continue
+                for tamanho_populacao in tamanhos_populacao:
+                    for semente in sementes:
+                        linha = executar_caso(algoritmo, funcao, dim, tamanho_populacao, semente, geracoes,
+                                              repeticoes)
+                        resultados.append(linha)
+                        if mostrar_prints:
+                            print(f"{algoritmo:<4} {linha['funcao']:<12} dim={dim:<4} pop={tamanho_populacao:<6} "
+                                  f"semente={semente:<3} {linha['tempo_s'] * 1e3:9.1f} ms "
+                                  f"{linha['avaliacoes_por_s']:12.0f} aval/s "
+                                  f"{linha['pico_memoria_bytes'] / 2**20:8.2f} MiB  "
+                                  f"fitness={linha['fitness_final']:.6g}")
+    return resultados
+
+
+def salvar_relatorio(resultados, arquivo):
+    """Salva os resultados em JSON, com informações do ambiente."""
+    relatorio = {
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "plataforma": platform.platform(),
+        "resultados": resultados,
+    }
+    with open(arquivo, "w") as f:
+        json.dump(relatorio, f, indent=2)
+
+
+def _chave(linha):
+    return (linha["algoritmo"], linha["funcao"], linha["dim"], linha["populacao"], linha["semente"],
+            linha["geracoes"])
+
+
+def comparar_com_referencia(resultados, arquivo_referencia, tolerancia_tempo=0.25, tolerancia_fitness=1e-9):
+    """
+    Compara os resultados com um relatório de referência.
+
+    Há regressão quando o tempo de um caso cresce mais que ``tolerancia_tempo``
+    (fração relativa) ou quando o fitness final piora além de
+    ``tolerancia_fitness`` (relativa; o GA maximiza, os demais minimizam).
+
+    Retorna:
+        list of str: Descrição de cada regressão encontrada (vazia se nenhuma).
+    """
+    with open(arquivo_referencia) as f:
+        referencia = {_chave(linha): linha for linha in json.load(f)["resultados"]}
+
+    regressoes = []
+    for linha in resultados:
+        base = referencia.get(_chave(linha))
+        if base is None:
+            continue
+        caso = "{} {} dim={} pop={} semente={}".format(*_chave(linha)[:5])
+        if linha["tempo_s"] > base["tempo_s"] * (1 + tolerancia_tempo):
+            regressoes.append(f"{caso}: tempo {base['tempo_s']:.4f}s -> {linha['tempo_s']:.4f}s")
+
+        sinal = -1 if linha["algoritmo"] == "ga" else 1
+        piora = sinal * (linha["fitness_final"] - base["fitness_final"])
+        if piora > tolerancia_fitness * max(1.0, abs(base["fitness_final"])):
+            regressoes.append(f"{caso}: fitness {base['fitness_final']:.6g} -> {linha['fitness_final']:.6g}")
+    return regressoes
+
+
+# ----------------------------
+# Paridade do núcleo compilado
+# ----------------------------
+CASOS_PARIDADE = (("pso", "rastrigin", 10), ("pso", "schaffer_n2", 2), ("abc", "rastrigin", 10),
+                  ("abc", "schaffer_n2", 2), ("ga", "mochila", 50))
+
+
+def _executar_com_nucleo(algoritmo, funcao, dim, tamanho_populacao, semente, geracoes, nucleo):
+    if algoritmo == "ga":
+        pesos, valores, capacidade = instancia_mochila(dim, semente)
+        return algoritmo_genetico(pesos, valores, capacidade, tamanho_populacao=tamanho_populacao,
+                                  geracoes=geracoes, semente=semente, nucleo=nucleo)[:2]
+    objetivo, (inf, sup), _ = FUNCOES_TESTE[funcao]
+    if algoritmo == "pso":
+        return pso(objetivo, dimensao=dim, num_particulas=tamanho_populacao, num_iteracoes=geracoes,
+                   limites=(inf, sup), semente=semente, mostrar_prints=False, nucleo=nucleo)[:2]
+    return ABC(objetivo, num_bees=tamanho_populacao, max_iter=geracoes, dim=dim, lim_inf=inf, lim_sup=sup,
+               semente=semente, nucleo=nucleo).optimize()[:2]
+
+
+def conferir_paridade(casos=CASOS_PARIDADE, tamanho_populacao=100, geracoes=100, semente=0, nucleo="numba",
+                      tolerancia=1e-9):
+    """
+    Compara o caminho NumPy com o núcleo compilado para a mesma semente.
+
+    O GA precisa ser idêntico. No PSO e no ABC, o seno e o cosseno compilados
+    podem diferir do NumPy no último bit, então o melhor fitness e a melhor
+    posição são comparados com tolerância relativa ``tolerancia``.
+
+    Parâmetros:
+        casos (tuple): Triplas ``(algoritmo, funcao, dim)``.
+        tamanho_populacao, geracoes, semente: Configuração de cada execução.
+        nucleo (str): Núcleo comparado com ``"numpy"``.
+        tolerancia (float): Diferença relativa aceita no PSO e no ABC.
+
+    Retorna:
+        list of dict: Uma linha por caso com os tempos (o menor de algumas
+        execuções, então sem a compilação), a diferença de fitness e ``ok``.
+    """
+    resultados = []
+    for algoritmo, funcao, dim in casos:
+        execucoes = {}
+        for atual in ("numpy", nucleo):
+            execucoes[atual] = _medir(lambda: _executar_com_nucleo(algoritmo, funcao, dim, tamanho_populacao,
+                                                                   semente, geracoes, atual),
+                                      medir_memoria=False)
+        (posicao_numpy, fitness_numpy), tempo_numpy, _ = execucoes["numpy"]
+        (posicao, fitness), tempo, _ = execucoes[nucleo]
+        if algoritmo == "ga":
+            ok = np.array_equal(posicao, posicao_numpy) and fitness == fitness_numpy
+        else:
+            ok = (np.allclose(posicao, posicao_numpy, rtol=tolerancia, atol=tolerancia)
+                  and math.isclose(fitness, fitness_numpy, rel_tol=tolerancia, abs_tol=tolerancia))
+        resultados.append({
+            "algoritmo": algoritmo,
+            "funcao": funcao,
+            "dim": dim,
+            "tempo_numpy": tempo_numpy,
+            "tempo_compilado": tempo,
+            "diferenca_fitness": abs(float(fitness) - float(fitness_numpy)),
+            "ok": bool(ok),
+        })
+    return resultados
+
+
+def _lista(tipo):
+    return lambda texto: tuple(tipo(item) for item in texto.split(","))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m otimizacao.benchmark", description=__doc__.split("\n\n")[0])
+    subcomandos = parser.add_subparsers(dest="comando")
+
+    subcomandos.add_parser("objetivos", help="Compara funções objetivo ponto a ponto e vetorizadas.")
+
+    suite = subcomandos.add_parser("suite", help="Executa a suíte de otimizadores.")
+    suite.add_argument("--algoritmos", type=_lista(str), default=ALGORITMOS)
+    suite.add_argument("--funcoes", type=_lista(str), default=tuple(FUNCOES_TESTE))
+    suite.add_argument("--dimensoes", type=_lista(int), default=(2, 10, 30))
+    suite.add_argument("--populacoes", type=_lista(int), default=(30, 300))
+    suite.add_argument("--sementes", type=_lista(int), default=(0, 1, 2))
+    suite.add_argument("--geracoes", type=int, default=100)
+    suite.add_argument("--repeticoes", type=int, default=5, help="Execuções por caso; vale o menor tempo.")
+    suite.add_argument("--saida", help="Arquivo JSON do relatório.")
+    suite.add_argument("--referencia", help="Relatório JSON de referência para detectar regressões.")
+    suite.add_argument("--tolerancia-tempo", type=float, default=0.25)
+
+    paridade = subcomandos.add_parser("paridade", help="Confere o núcleo compilado contra o caminho NumPy.")
+    paridade.add_argument("--populacao", type=int, default=100)
+    paridade.add_argument("--geracoes", type=int, default=100)
+    paridade.add_argument("--semente", type=int, default=0)
+
+    args = parser.parse_args(argv)
+    if args.comando in (None, "objetivos"):
+        imprimir_tabela(comparar_objetivos())
+        return 0
+
+    if args.comando == "paridade":
+        if not NUMBA_DISPONIVEL:
+            print("O pacote numba não está instalado: não há núcleo compilado para conferir.", file=sys.stderr)
+            return 1
+        resultados = conferir_paridade(tamanho_populacao=args.populacao, geracoes=args.geracoes,
+                                       semente=args.semente)
+        print(f"{'alg.':<4} {'função':<12} {'dim':>4} {'numpy (ms)':>11} {'numba (ms)':>11} {'dif. fitness':>13}")
+        for r in resultados:
+            print(f"{r['algoritmo']:<4} {r['funcao']:<12} {r['dim']:>4} {r['tempo_numpy'] * 1e3:>11.1f} "
+                  f"{r['tempo_compilado'] * 1e3:>11.1f} {r['diferenca_fitness']:>13.3g}  "
+                  f"{'ok' if r['ok'] else 'DIVERGE'}")
+        return 0 if all(r["ok"] for r in resultados) else 1
+
+    resultados = executar_suite(args.algoritmos, args.funcoes, args.dimensoes, args.populacoes, args.sementes,
+                                args.geracoes, args.repeticoes)
+    if args.saida:
+        salvar_relatorio(resultados, args.saida)
+    if args.referencia:
+        regressoes = comparar_com_referencia(resultados, args.referencia, tolerancia_tempo=args.tolerancia_tempo)
+        if regressoes:
+            print(f"\n{len(regressoes)} regressão(ões) em relação a {args.referencia}:", file=sys.stderr)
+            for regressao in regressoes:
+                print(f"  - {regressao}", file=sys.stderr)
+            return 1
+        print(f"\nSem regressões em relação a {args.referencia}.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,108 @@
+"""
+Cache de fitness com descarte LRU para indivíduos binários.
+
+Cada indivíduo (lista ou vetor de 0/1) é compactado com ``np.packbits`` em
+uma chave ``bytes``, de modo que indivíduos repetidos (muito comuns no GA da
+mochila: torneio, elitismo e a avaliação da população usam os mesmos
+cromossomos) são avaliados uma única vez enquanto estiverem no cache.
+"""
+from collections import OrderedDict
+
+import numpy as np
+
+from otimizacao.objetivos import avaliar_populacao
+
+
+def chave_bits(individuo):
+    """Compacta um indivíduo binário em ``bytes`` (8 genes por byte)."""
+    return np.packbits(np.asarray(individuo, dtype=np.uint8)).tobytes()
+
+
+class CacheFitness:
+    """
+    Memoriza o fitness de indivíduos binários, com capacidade limitada.
+
+    Parâmetros:
+        funcao (callable): Função de fitness (escalar, vetorizada ou um avaliador
+            de ``otimizacao.avaliacao``).
+        capacidade (int): Número máximo de indivíduos guardados; ao exceder,
+            o menos usado recentemente é descartado.
+
+    O cache pode ser usado como ``key`` em ``max``/``sorted`` (avalia um
+    indivíduo) ou com ``avaliar`` (avalia a população inteira, enviando apenas
+    os cromossomos ainda desconhecidos, sem repetição, para ``funcao``).
+    """
+
+    def __init__(self, funcao, capacidade=10_000):
+        if capacidade < 1:
+            raise ValueError("A capacidade do cache deve ser positiva.")
+        self.funcao = funcao
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+        self._valores = OrderedDict()
+
+    def _guardar(self, chave, valor):
+        self._valores[chave] = valor
+        if len(self._valores) > self.capacidade:
+            self._valores.popitem(last=False)
+
+    def __call__(self, individuo):
+        chave = chave_bits(individuo)
+        valor = self._valores.get(chave)
+        if valor is not None:
+            self.acertos += 1
+            self._valores.move_to_end(chave)
+            return valor
+
+        self.falhas += 1
+        valor = float(avaliar_populacao(self.funcao, [individuo])[0])
+        self._guardar(chave, valor)
+        return valor
+
+    def avaliar(self, populacao):
+        """
+        Avalia todos os indivíduos de ``populacao`` usando o cache.
+
+        Retorna:
+            np.ndarray: Vetor com o fitness de cada indivíduo, na mesma ordem.
+        """
+        matriz = np.asarray(populacao, dtype=np.uint8)
+        chaves = [linha.tobytes() for linha in np.packbits(matriz, axis=1)]
+        resultado = np.empty(len(chaves))
+
+        pendentes = {}
+        for i, chave in enumerate(chaves):
+            valor = self._valores.get(chave)
+            if valor is not None:
+                self.acertos += 1
+                self._valores.move_to_end(chave)
+                resultado[i] = valor
+            elif chave in pendentes:
+                # Repetido dentro do próprio lote: avaliado uma vez só
+                self.acertos += 1
+                pendentes[chave].append(i)
+            else:
+                self.falhas += 1
+                pendentes[chave] = [i]
+
+        if pendentes:
+            primeiros = [indices[0] for indices in pendentes.values()]
+            valores = avaliar_populacao(self.funcao, matriz[primeiros])
+            for (chave, indices), valor in zip(pendentes.items(), valores):
+                resultado[indices] = valor
+                self._guardar(chave, float(valor))
+        return resultado
+
+    def estatisticas(self):
+        """Retorna acertos, falhas, taxa de acerto e ocupação do cache."""
+        total = self.acertos + self.falhas
+        return {
+            "acertos": self.acertos,
+            "falhas": self.falhas,
+            "taxa_acerto": self.acertos / total if total else 0.0,
+            "tamanho": len(self._valores),
+        }
+
+    def __len__(self):
+        return len(self._valores)
@@ -0,0 +1,94 @@
+"""
+Checkpoints do estado dos otimizadores em ``.npz``.
+
+``pso``, ``ABC.optimize`` e ``algoritmo_genetico`` aceitam um parâmetro
+``checkpoint``. A cada ``a_cada_geracoes`` gerações e/ou ``a_cada_segundos``
+segundos (e sempre ao final, inclusive numa parada antecipada) o estado
+completo é gravado: arrays da população, melhores, históricos, número da
+geração, o estado do gerador aleatório (``rng.bit_generator.state``) e, com
+``parada``, o dos critérios de parada (``CriteriosParada.estado``). Se o
+arquivo já existir quando o otimizador começa, a execução é retomada a partir
+dele e produz exatamente o mesmo resultado que uma execução sem interrupção:
+
+    checkpoint = Checkpoint("pso.npz", a_cada_segundos=300)
+    pso(funcao, dimensao=30, num_iteracoes=100_000, semente=1, checkpoint=checkpoint)
+
+A gravação é atômica (arquivo temporário + ``os.replace``), então uma
+interrupção durante a escrita mantém o checkpoint anterior intacto. O estado
+de ``callback`` e ``telemetria`` não faz parte do checkpoint.
+"""
+import json
+import os
+import time
+
+import numpy as np
+
+
+class Checkpoint:
+    """
+    Decide quando gravar e grava/lê o estado de um otimizador.
+
+    Parâmetros:
+        arquivo (str): Caminho do ``.npz``.
+        a_cada_geracoes (int | None): Grava a cada N gerações.
+        a_cada_segundos (float | None): Grava quando se passaram T segundos
+            desde a última gravação. Sem nenhum dos dois, grava só ao final.
+    """
+
+    def __init__(self, arquivo, a_cada_geracoes=None, a_cada_segundos=None):
+        self.arquivo = arquivo
+        self.a_cada_geracoes = a_cada_geracoes
+        self.a_cada_segundos = a_cada_segundos
+        self._ultima_gravacao = time.monotonic()
+
+    def deve_salvar(self, geracao, total):
+        """``geracao`` é o número de gerações já concluídas."""
+        if geracao >= total:
+            return True
+        if self.a_cada_geracoes and geracao % self.a_cada_geracoes == 0:
+            return True
+        return bool(self.a_cada_segundos) and time.monotonic() - self._ultima_gravacao >= self.a_cada_segundos
+
+    def salvar(self, algoritmo, geracao, rng, **arrays):
+        """
+        Grava o estado de forma atômica.
+
+        Parâmetros:
+            algoritmo (str): Nome do otimizador (conferido ao carregar).
+            geracao (int): Gerações concluídas.
+            rng (np.random.Generator): Gerador cujo estado é salvo.
+            **arrays: Demais partes do estado (convertidas com ``np.asarray``).
+        """
+        temporario = self.arquivo + ".tmp.npz"
+        np.savez(temporario, _algoritmo=np.array(algoritmo), _geracao=np.array(geracao),
+                 _rng=np.array(json.dumps(rng.bit_generator.state)),
+                 **{nome: np.asarray(valor) for nome, valor in arrays.items()})
+        os.replace(temporario, self.arquivo)
+        self._ultima_gravacao = time.monotonic()
+
+    def carregar(self, algoritmo, rng):
+        """
+        Lê o checkpoint, se existir, e restaura o estado de ``rng``.
+
+        Retorna:
+            dict | None: ``geracao`` e os arrays salvos, ou ``None`` se não houver
+            checkpoint.
+        """
+        if not os.path.exists(self.arquivo):
+            return None
+        with np.load(self.arquivo) as dados:
+            if str(dados["_algoritmo"]) != algoritmo:
+                raise ValueError(f"O checkpoint '{self.arquivo}' é de '{dados['_algoritmo']}', não de '{algoritmo}'.")
+            estado = {nome: dados[nome] for nome in dados.files if not nome.startswith("_")}
+            estado["geracao"] = int(dados["_geracao"])
+            estado_rng = json.loads(str(dados["_rng"]))
+        if estado_rng["bit_generator"] != type(rng.bit_generator).__name__:
+            raise ValueError(f"O checkpoint usa o gerador {estado_rng['bit_generator']}.")
+        rng.bit_generator.state = estado_rng
+        return estado
+
+
+def conferir_forma(estado, nome, forma):
+    """Garante que o checkpoint é da mesma configuração (mesma forma de ``nome``)."""
+    if estado[nome].shape != tuple(forma):
+        raise ValueError(f"Checkpoint incompatível: '{nome}' tem forma {estado[nome].shape}, esperado {tuple(forma)}.")
@@ -0,0 +1,129 @@
+"""
+Linha de comando dos experimentos do trabalho final.
+
+Uso: ``python -m otimizacao <experimento> [opções]``. Com ``--sem-graficos``,
+``--salvar-graficos`` ou ``--relatorio`` nenhuma janela é aberta, o que
+permite rodar em máquinas sem interface gráfica.
+"""
+import argparse
+import sys
+
+
+def _opcoes_graficos(parser):
+    parser.add_argument("--sem-graficos", action="store_true", help="Não abre janelas de gráficos.")
+    parser.add_argument("--salvar-graficos", metavar="PASTA",
+                        help="Salva os gráficos nesta pasta (não abre janelas).")
+    parser.add_argument("--semente", type=int, default=None)
+
+
+def _opcao_relatorio(parser):
+    parser.add_argument("--relatorio", metavar="PASTA",
+                        help="Grava um relatório HTML/PNG nesta pasta (não abre janelas).")
+
+
+def _configurar_graficos(args):
+    """Retorna ``(pasta, mostrar)``; sem janelas, usa o backend Agg."""
+    mostrar = not (args.sem_graficos or args.salvar_graficos or getattr(args, "relatorio", None))
+    if not mostrar:
+        import matplotlib
+        matplotlib.use("Agg")
+    if args.salvar_graficos:
+        import os
+        os.makedirs(args.salvar_graficos, exist_ok=True)
+    return args.salvar_graficos, mostrar
+
+
+def _arquivo(pasta, nome):
+    import os
+    return os.path.join(pasta, nome) if pasta else None
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m otimizacao", description=__doc__.split("\n\n")[0])
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    superficie = subcomandos.add_parser("superficie", help="Gráfico 3D da função de Rastrigin (Parte 1).")
+    _opcoes_graficos(superficie)
+
+    schaffer = subcomandos.add_parser("schaffer", help="PSO/ABC na função de Schaffer N2 com GIF (Parte 1).")
+    schaffer.add_argument("--algoritmo", choices=("PSO", "ABC"), default="PSO")
+    schaffer.add_argument("--iteracoes", type=int, default=100)
+    schaffer.add_argument("--intervalo-quadros", type=int, default=1)
+    schaffer.add_argument("--sem-gif", action="store_true")
+    schaffer.add_argument("--semente", type=int, default=None)
+
+    rastrigin = subcomandos.add_parser("rastrigin", help="PSO/ABC na função de Rastrigin (Parte 2).")
+    rastrigin.add_argument("--algoritmo", choices=("PSO", "ABC"), default="PSO")
+    rastrigin.add_argument("--dim", type=int, default=2)
+    rastrigin.add_argument("--individuos", type=int, default=30)
+    rastrigin.add_argument("--iteracoes", type=int, default=100)
+    _opcoes_graficos(rastrigin)
+    _opcao_relatorio(rastrigin)
+
+    mochila = subcomandos.add_parser("mochila", help="Algoritmo genético no problema da mochila (Parte 2).")
+    mochila.add_argument("--populacao", type=int, default=100)
+    mochila.add_argument("--geracoes", type=int, default=40)
+    mochila.add_argument("--taxa-mutacao", type=float, default=0.8)
+    mochila.add_argument("--backend", choices=("serial", "threads", "processos"), default="serial")
+    mochila.add_argument("--restricao", choices=("zero", "penalidade", "reparo"), default="zero",
+                         help="Tratamento de soluções acima da capacidade.")
+    origem = mochila.add_mutually_exclusive_group()
+    origem.add_argument("--instancia", metavar="ARQUIVO",
+                        help="Lê a instância de um arquivo (.npz, OR-Library, texto ou CSV).")
+    origem.add_argument("--gerar", type=int, metavar="N_ITENS", help="Gera uma instância sintética.")
+    mochila.add_argument("--formato", choices=("auto", "npz", "orlib", "texto", "csv"), default="auto")
+    mochila.add_argument("--capacidade", type=float, nargs="+", default=None,
+                         help="Capacidade de um CSV sem a linha '# capacidade'.")
+    mochila.add_argument("--tipo", default="nao_correlacionada",
+                         choices=("nao_correlacionada", "fracamente_correlacionada", "fortemente_correlacionada",
+                                  "inversa", "subconjunto"),
+                         help="Classe da instância gerada com --gerar.")
+    _opcoes_graficos(mochila)
+    _opcao_relatorio(mochila)
+
+    subcomandos.add_parser("benchmark", help="Benchmarks (repassa as opções para otimizacao.benchmark).",
+                           add_help=False)
+    subcomandos.add_parser("varredura", help="Varreduras de hiperparâmetros (repassa as opções para "
+                           "otimizacao.varredura).", add_help=False)
+
+    args, restantes = parser.parse_known_args(argv)
+    if args.comando == "benchmark":
+        from otimizacao.benchmark import main as main_benchmark
+        return main_benchmark(restantes)
+    if args.comando == "varredura":
+        from otimizacao.varredura import main as main_varredura
+        return main_varredura(restantes)
+    if restantes:
+        parser.error(f"argumentos não reconhecidos: {' '.join(restantes)}")
+
+    from otimizacao import experimentos
+
+    if args.comando == "superficie":
+        pasta, mostrar = _configurar_graficos(args)
+        experimentos.superficie_rastrigin(arquivo=_arquivo(pasta, "superficie_rastrigin.png"), mostrar=mostrar)
+    elif args.comando == "schaffer":
+        experimentos.experimento_schaffer(args.algoritmo, num_iteracoes=args.iteracoes,
+                                          plot_interval=args.intervalo_quadros, salvar_gif=not args.sem_gif,
+                                          semente=args.semente)
+    elif args.comando == "rastrigin":
+        pasta, mostrar = _configurar_graficos(args)
+        experimentos.experimento_rastrigin(args.algoritmo, dim=args.dim, num_individuos=args.individuos,
+                                           max_iter=args.iteracoes, semente=args.semente,
+                                           arquivo=_arquivo(pasta, f"rastrigin_{args.algoritmo.lower()}.png"),
+                                           mostrar=mostrar, relatorio=args.relatorio)
+    elif args.comando == "mochila":
+        pasta, mostrar = _configurar_graficos(args)
+        instancia = None
+        if args.instancia or args.gerar:
+            from otimizacao.instancias import carregar_instancia, gerar_instancia
+            instancia = (carregar_instancia(args.instancia, args.formato, capacidade=args.capacidade)
+                         if args.instancia else gerar_instancia(args.gerar, args.tipo, semente=args.semente))
+        experimentos.experimento_mochila(tamanho_populacao=args.populacao, taxa_mutacao=args.taxa_mutacao,
+                                         geracoes=args.geracoes, backend_avaliacao=args.backend,
+                                         semente=args.semente, pasta_graficos=pasta, mostrar=mostrar,
+                                         restricao=args.restricao, instancia=instancia, relatorio=args.relatorio)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
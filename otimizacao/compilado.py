@@ -0,0 +1,182 @@
+"""
+Núcleos compilados (Numba) dos passos internos dos otimizadores.
+
+Com ``nucleo="numba"`` (ou ``"auto"``), ``pso``/``EnxamePSO``, ``ABC`` e
+``algoritmo_genetico`` trocam as expressões de arrays de cada geração por um
+único laço compilado e paralelo sobre os indivíduos (``numba.prange``), que
+atualiza, avalia e seleciona cada linha sem criar arrays temporários:
+
+- PSO: velocidade, posição, limites, fitness e melhor pessoal;
+- ABC: movimento de vizinhança, fitness e seleção gulosa das funcionárias
+  (as observadoras usam o mesmo laço para gerar e avaliar os candidatos);
+- GA: crossover de um ponto e mutação, escritos direto na próxima população.
+
+Os números aleatórios continuam vindo do ``np.random.Generator`` do
+otimizador, sorteados na mesma ordem do caminho NumPy em buffers
+reaproveitados (``rng.random(out=...)``); para a mesma semente, o resultado
+coincide com o do caminho NumPy a menos de arredondamento nas funções
+trigonométricas (ver ``tests/test_compilado.py`` e
+``python -m otimizacao.benchmark paridade``).
+
+A avaliação embutida só existe para as funções objetivo ``rastrigin`` e
+``schaffer_n2``. Com ``"auto"``, qualquer outra função (ou a ausência do
+Numba) usa o caminho NumPy; com ``"numba"``, esses casos levantam erro.
+"""
+import numpy as np
+
+from otimizacao.objetivos import rastrigin, schaffer_n2
+
+try:
+    import numba
+except ImportError:  # pragma: no cover - depende do ambiente
+    numba = None
+
+NUMBA_DISPONIVEL = numba is not None
+NUCLEOS = ("numpy", "numba", "auto")
+
+_RASTRIGIN = 0
+_SCHAFFER_N2 = 1
+_CODIGOS = {rastrigin: _RASTRIGIN, schaffer_n2: _SCHAFFER_N2}
+
+if NUMBA_DISPONIVEL:
+    _compilar = numba.njit(cache=True)
+    _compilar_paralelo = numba.njit(cache=True, parallel=True)
+    _prange = numba.prange
+else:
+    # Sem Numba os laços continuam válidos (em Python puro), mas não são usados pelos otimizadores
+    def _compilar(funcao):
+        return funcao
+
+    _compilar_paralelo = _compilar
+    _prange = range
+
+
+def nucleo_compilado(nucleo):
+    """
+    Indica se ``nucleo`` seleciona o caminho compilado.
+
+    Levanta ``ValueError`` para um núcleo desconhecido e ``ImportError`` para
+    ``"numba"`` sem o Numba instalado.
+    """
+    if nucleo not in NUCLEOS:
+        raise ValueError(f"nucleo deve ser um de {NUCLEOS}.")
+    if nucleo == "numba" and not NUMBA_DISPONIVEL:
+        raise ImportError("nucleo='numba' exige o pacote numba (pip install numba).")
+    return nucleo != "numpy" and NUMBA_DISPONIVEL
+
+
+def codigo_objetivo(funcao, nucleo):
+    """
+    Código da função objetivo para os núcleos compilados, ou ``None`` para o
+    caminho NumPy.
+
+    Parâmetros:
+        funcao (callable): Função objetivo do otimizador.
+        nucleo (str): ``"numpy"``, ``"numba"`` ou ``"auto"``.
+
+    Retorna:
+        int | None
+    """
+    if not nucleo_compilado(nucleo):
+        return None
+    codigo = _CODIGOS.get(funcao)
+    if codigo is None and nucleo == "numba":
+        raise ValueError("O núcleo compilado só avalia as funções objetivo rastrigin e schaffer_n2.")
+    return codigo
+
+
+@_compilar
+def _avaliar_linha(codigo, x):
+    # Mesmas expressões de otimizacao.objetivos, ponto a ponto
+    if codigo == _RASTRIGIN:
+        total = 0.0
+        for valor in x:
+            total += valor * valor - 10.0 * np.cos(2.0 * np.pi * valor)
+        return 10.0 * x.shape[0] + total
+    x2 = x[0] * x[0]
+    y2 = x[1] * x[1]
+    return 0.5 + (np.sin(x2 - y2) ** 2 - 0.5) / (1.0 + 0.001 * (x2 + y2)) ** 2
+
+
+@_compilar_paralelo
+def passo_pso(codigo, particulas, velocidades, melhores_posicoes, melhores_fitness, lideres, r1, r2,
+              w, c1, c2, inferior, superior, fitness):
+    """
+    Uma geração do PSO (sem o melhor global), in-place.
+
+    Para cada partícula: ``v = w * v + c1 * r1 * (pbest - x) + c2 * r2 *
+    (lider - x)``, ``x = clip(x + v)``, ``fitness[i] = f(x)`` e atualização do
+    melhor pessoal. ``lideres`` tem uma linha por partícula (no gbest, o melhor
+    global repetido com ``np.broadcast_to``).
+    """
+    for i in _prange(particulas.shape[0]):
+        for j in range(particulas.shape[1]):
+            x = particulas[i, j]
+            v = velocidades[i, j] * w
+            v += c1 * r1[i, j] * (melhores_posicoes[i, j] - x)
+            v += c2 * r2[i, j] * (lideres[i, j] - x)
+            velocidades[i, j] = v
+            particulas[i, j] = min(max(x + v, inferior), superior)
+        valor = _avaliar_linha(codigo, particulas[i])
+        fitness[i] = valor
+        if valor < melhores_fitness[i]:
+            melhores_fitness[i] = valor
+            melhores_posicoes[i, :] = particulas[i, :]
+
+
+@_compilar_paralelo
+def vizinhos_abc(codigo, fontes, indices, melhor_posicao, sorteios, inferior, superior, novas, fitness):
+    """
+    Gera e avalia ``len(indices)`` candidatos ``x + phi * (x - melhor)``, com
+    ``phi = -1 + 2 * sorteios`` (o mesmo que ``rng.uniform(-1, 1)``).
+    """
+    for k in _prange(indices.shape[0]):
+        origem = indices[k]
+        for j in range(fontes.shape[1]):
+            x = fontes[origem, j]
+            phi = -1.0 + 2.0 * sorteios[k, j]
+            novas[k, j] = min(max(x + phi * (x - melhor_posicao[j]), inferior), superior)
+        fitness[k] = _avaliar_linha(codigo, novas[k])
+
+
+@_compilar_paralelo
+def funcionarias_abc(codigo, fontes, fitness_fontes, tentativas, melhor_posicao, sorteios, inferior, superior,
+                     novas):
+    """Fase das abelhas funcionárias: um candidato por fonte, com seleção gulosa (in-place)."""
+    for i in _prange(fontes.shape[0]):
+        for j in range(fontes.shape[1]):
+            x = fontes[i, j]
+            phi = -1.0 + 2.0 * sorteios[i, j]
+            novas[i, j] = min(max(x + phi * (x - melhor_posicao[j]), inferior), superior)
+        valor = _avaliar_linha(codigo, novas[i])
+        if valor < fitness_fontes[i]:
+            fontes[i, :] = novas[i, :]
+            fitness_fontes[i] = valor
+            tentativas[i] = 0
+        else:
+            tentativas[i] += 1
+
+
+@_compilar_paralelo
+def filhos_ga(populacao, indices_pais, pontos_corte, genes_mutados, saida):
+    """
+    Crossover de um ponto e mutação, escrevendo os filhos em ``saida``.
+
+    O par ``p`` usa os pais ``indices_pais[2p]`` e ``indices_pais[2p + 1]``; os
+    filhos seguem a ordem de ``crossover_um_ponto`` (primeiros filhos de todos
+    os pares, depois os segundos), e só as ``len(saida)`` primeiras linhas são
+    geradas. ``genes_mutados[k]`` é o gene invertido no filho ``k`` (``-1``
+    para nenhum).
+    """
+    num_pares = pontos_corte.shape[0]
+    for k in _prange(saida.shape[0]):
+        par = k if k < num_pares else k - num_pares
+        antes = indices_pais[2 * par]
+        depois = indices_pais[2 * par + 1]
+        if k >= num_pares:
+            antes, depois = depois, antes
+        corte = pontos_corte[par]
+        for j in range(populacao.shape[1]):
+            saida[k, j] = populacao[antes, j] if j < corte else populacao[depois, j]
+        if genes_mutados[k] >= 0:
+            saida[k, genes_mutados[k]] = not saida[k, genes_mutados[k]]
@@ -0,0 +1,307 @@
+"""
+Experimentos do trabalho final (Partes 1 e 2).
+
+Cada experimento é uma função chamada pelos scripts das pastas do trabalho e
+pela linha de comando (``python -m otimizacao <experimento>``). Nada é
+executado na importação, e matplotlib/seaborn só são importados quando um
+gráfico é de fato gerado. Com ``relatorio=PASTA``, os experimentos de PSO/ABC
+e da mochila gravam um relatório HTML/PNG sem abrir janelas (ver
+``otimizacao.relatorio``).
+"""
+import numpy as np
+
+from otimizacao.abelhas import ABC
+from otimizacao.objetivos import rastrigin, schaffer_n2
+from otimizacao.paisagem import grade_superficie
+from otimizacao.pso import pso
+
+# Instância do problema da mochila usada na Parte 2
+ITENS_EXEMPLO = [
+    {"peso": 2, "valor": 3},
+    {"peso": 3, "valor": 4},
+    {"peso": 4, "valor": 5},
+    {"peso": 5, "valor": 8},
+    {"peso": 9, "valor": 10},
+    {"peso": 6, "valor": 7},
+    {"peso": 7, "valor": 9},
+    {"peso": 8, "valor": 11},
+    {"peso": 10, "valor": 13},
+    {"peso": 12, "valor": 15}
+]
+CAPACIDADE_EXEMPLO = 30
+# Instâncias maiores que isso rodam sem solução exata, histórico de escolhas e gráficos
+ITENS_DETALHADOS = 1000
+
+
+# ----------------------------
+# Gráficos (importação tardia do matplotlib)
+# ----------------------------
+def _finalizar(fig, arquivo, mostrar):
+    import matplotlib.pyplot as plt
+
+    if arquivo:
+        fig.savefig(arquivo, dpi=150, bbox_inches='tight')
+    if mostrar:
+        plt.show()
+    else:
+        plt.close(fig)
+
+
+def grafico_superficie(funcao, limites, resolucao=100, solucao=None, valor_solucao=None, rotulo_solucao=None,
+                       cmap="coolwarm", arquivo=None, mostrar=True):
+    """
+    Desenha a superfície 3D de uma função de duas variáveis.
+
+    Parâmetros:
+        funcao (callable): Função objetivo (vetorizada ou escalar).
+        limites (tuple): Limites (inferior, superior) dos eixos x e y.
+        resolucao (int): Pontos por eixo na grade (em cache, ver ``otimizacao.paisagem``).
+        solucao, valor_solucao: Ponto ``[x, y]`` e valor destacados em vermelho (opcional).
+        rotulo_solucao (str | None): Legenda do ponto destacado.
+        cmap (str): Mapa de cores da superfície.
+        arquivo (str | None): Se informado, salva a figura nesse caminho.
+        mostrar (bool): Abre a janela interativa (``plt.show()``).
+    """
+    import matplotlib.pyplot as plt
+    from matplotlib.ticker import LinearLocator
+
+    x, Z = grade_superficie(funcao, limites, resolucao)
+    X, Y = np.meshgrid(x, x)
+
+    fig, ax = plt.subplots(subplot_kw={"projection": "3d"})
+    surf = ax.plot_surface(X, Y, Z, cmap=cmap, linewidth=0, antialiased=False)
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.set_zlabel('z')
+    ax.set_zlim(np.min(Z), np.max(Z))
+    ax.zaxis.set_major_locator(LinearLocator(10))
+    ax.zaxis.set_major_formatter('{x:.02f}')
+    fig.colorbar(surf, shrink=0.5, aspect=5)
+
+    if solucao is not None:
+        ax.scatter(solucao[0], solucao[1], valor_solucao, color='red', label=rotulo_solucao)
+        if rotulo_solucao:
+            ax.legend()
+
+    _finalizar(fig, arquivo, mostrar)
+
+
+def grafico_evolucao_ga(melhores_fitness, arquivo=None, mostrar=True):
+    import matplotlib.pyplot as plt
+
+    fig = plt.figure()
+    plt.plot(melhores_fitness)
+    plt.xlabel("Geração")
+    plt.ylabel("Melhor Fitness")
+    plt.title("Evolução do Algoritmo Genético")
+    _finalizar(fig, arquivo, mostrar)
+
+
+def grafico_heatmap_itens(historico_escolhas, arquivo=None, mostrar=True):
+    import matplotlib.pyplot as plt
+    import seaborn as sns
+
+    geracoes, n_itens = historico_escolhas.shape
+    fig = plt.figure(figsize=(10, 6))
+    sns.heatmap(historico_escolhas.T, cmap="YlGnBu", xticklabels=range(geracoes), yticklabels=range(n_itens))
+    plt.xlabel("Geração")
+    plt.ylabel("Índice do Item")
+    plt.title("Heatmap da Frequência de Escolha dos Itens")
+    _finalizar(fig, arquivo, mostrar)
+
+
+# ----------------------------
+# Parte 1 - Funções tridimensionais
+# ----------------------------
+def superficie_rastrigin(arquivo=None, mostrar=True):
+    """Gráfico 3D da função de Rastrigin em [-5.12, 5.12]^2."""
+    grafico_superficie(rastrigin, (-5.12, 5.12), arquivo=arquivo, mostrar=mostrar)
+
+
+def pso_com_animacao(funcao_custo, dimensao=2, num_particulas=100, num_iteracoes=100, w=0.5, c1=1, c2=2,
+                     limites=(-100, 100), plot_interval=1, salvar_gif=True, mostrar_prints=True, semente=None,
+                     arquivo_gif='convergencia_pso.gif'):
+    """
+    ``pso`` que, ao final, gera o GIF de convergência com um quadro a cada
+    ``plot_interval`` gerações.
+    """
+    from otimizacao.renderizacao import GravadorQuadros, salvar_animacao
+
+    gravador = GravadorQuadros(intervalo=plot_interval, total_geracoes=num_iteracoes)
+    resultado = pso(funcao_custo, dimensao=dimensao, num_particulas=num_particulas, num_iteracoes=num_iteracoes,
+                    w=w, c1=c1, c2=c2, limites=limites, semente=semente, mostrar_prints=mostrar_prints,
+                    callback=gravador if salvar_gif else None)
+
+    # Criar GIF após todas as iterações (a superfície é calculada uma única vez)
+    if len(gravador):
+        salvar_animacao(gravador, arquivo_gif, funcao_custo, limites, duracao_ms=100)
+        print(f"GIF salvo como '{arquivo_gif}'.")
+
+    return resultado
+
+
+def abc_com_animacao(abc_optimizer, plot_interval=1, salvar_gif=True, arquivo_gif='convergencia_abc.gif'):
+    """``ABC.optimize`` que, ao final, gera o GIF de convergência."""
+    from otimizacao.renderizacao import GravadorQuadros, salvar_animacao
+
+    gravador = GravadorQuadros(intervalo=plot_interval, total_geracoes=abc_optimizer.max_iter)
+    resultado = abc_optimizer.optimize(callback=gravador if salvar_gif else None)
+
+    # Criar GIF após todas as iterações
+    if len(gravador):
+        salvar_animacao(gravador, arquivo_gif, abc_optimizer.cost_func,
+                        (abc_optimizer.lim_inf, abc_optimizer.lim_sup), titulo="Geração ABC", duracao_ms=200)
+        print(f"GIF salvo como '{arquivo_gif}'.")
+
+    return resultado
+
+
+def otimizar_por_algoritmo(algoritmo='PSO', num_iteracoes=100, plot_interval=1, salvar_gif=True, semente=None):
+    """Otimiza a função de Schaffer N2 com PSO ou ABC e gera o GIF de convergência."""
+    if algoritmo == 'PSO':
+        solucao, melhor_valor, historico_melhor, historico_pior = pso_com_animacao(
+            funcao_custo=schaffer_n2,
+            num_iteracoes=num_iteracoes,
+            plot_interval=plot_interval,
+            salvar_gif=salvar_gif,
+            mostrar_prints=False,
+            semente=semente,
+        )
+    elif algoritmo == 'ABC':
+        abc_optimizer = ABC(schaffer_n2, num_bees=30, max_iter=num_iteracoes, dim=2, lim_inf=-100, lim_sup=100,
+                            semente=semente)
+        solucao, melhor_valor, historico_melhor, historico_pior = abc_com_animacao(
+            abc_optimizer, plot_interval=plot_interval, salvar_gif=salvar_gif)
+    else:
+        raise ValueError("Algoritmo não reconhecido. Escolha 'PSO' ou 'ABC'.")
+
+    return solucao, melhor_valor
+
+
+def experimento_schaffer(algoritmo='PSO', num_iteracoes=100, plot_interval=1, salvar_gif=True, semente=None):
+    solucao, melhor_valor = otimizar_por_algoritmo(algoritmo, num_iteracoes=num_iteracoes,
+                                                   plot_interval=plot_interval, salvar_gif=salvar_gif,
+                                                   semente=semente)
+    print("\n== Resultado Final ==")
+    print("Melhor solução encontrada:", solucao)
+    print("Valor da função de Schaffer:", melhor_valor)
+    return solucao, melhor_valor
+
+
+# ----------------------------
+# Parte 2 - Meta-heurísticas na função de Rastrigin
+# ----------------------------
+def experimento_rastrigin(algoritmo='PSO', dim=2, num_individuos=30, max_iter=100, semente=None,
+                          arquivo=None, mostrar=True, relatorio=None):
+    """
+    Otimiza a função de Rastrigin com PSO ou ABC e desenha a solução sobre a superfície.
+
+    Com ``relatorio`` (uma pasta), grava as curvas de convergência e as posições
+    finais em ``relatorio/index.html`` em vez de abrir janelas.
+    """
+    from otimizacao.renderizacao import GravadorQuadros
+
+    limites = (-5.12, 5.12)
+    gravador = GravadorQuadros(intervalo=max_iter, total_geracoes=max_iter) if relatorio else None
+    if algoritmo == 'PSO':
+        solucao, fitness, historico_melhor, historico_pior = pso(
+            rastrigin, dimensao=dim, num_particulas=num_individuos, num_iteracoes=max_iter, limites=limites,
+            semente=semente, mostrar_prints=False, callback=gravador)
+        print('Solução:', solucao)
+        print('Fitness:', fitness)
+        rotulo = 'Melhor solução PSO'
+    elif algoritmo == 'ABC':
+        abc_optimizer = ABC(rastrigin, num_bees=num_individuos, max_iter=max_iter, dim=dim,
+                            lim_inf=limites[0], lim_sup=limites[1], semente=semente)
+        solucao, fitness, historico_melhor, historico_pior = abc_optimizer.optimize(callback=gravador)
+        print("Melhor solução encontrada pelo ABC:", solucao)
+        print("Valor da função (fitness) na solução:", fitness)
+        rotulo = 'Solução do ABC'
+    else:
+        raise ValueError("Algoritmo não reconhecido. Escolha 'PSO' ou 'ABC'.")
+
+    if relatorio:
+        from otimizacao.relatorio import dados_execucao, gerar_relatorio
+
+        execucao = dados_execucao(f"{algoritmo} Rastrigin {dim}D", historico_melhor, historico_pior,
+                                  posicoes=gravador.quadros[-1][1] if len(gravador) else None,
+                                  melhor_posicao=solucao, melhor_fitness=fitness, funcao=rastrigin, limites=limites,
+                                  semente=semente)
+        print("Relatório:", gerar_relatorio([execucao], relatorio, titulo=f"{algoritmo} na função de Rastrigin",
+                                            num_trabalhadores=1))
+    elif dim == 2 and (mostrar or arquivo):
+        grafico_superficie(rastrigin, limites, solucao=solucao, valor_solucao=fitness, rotulo_solucao=rotulo,
+                           cmap='viridis', arquivo=arquivo, mostrar=mostrar)
+    return solucao, fitness
+
+
+# ----------------------------
+# Parte 2 - Problema da mochila com GA
+# ----------------------------
+def experimento_mochila(itens=ITENS_EXEMPLO, capacidade_mochila=CAPACIDADE_EXEMPLO, tamanho_populacao=100,
+                        taxa_mutacao=0.8, geracoes=40, num_elitismo=2, backend_avaliacao="serial",
+                        capacidade_cache=10_000, comparar_exato=True, mostrar_prints=True, semente=None,
+                        pasta_graficos=None, mostrar=True, restricao="zero", instancia=None, relatorio=None):
+    """
+    Resolve a mochila com o GA, compara com a solução exata e gera os gráficos
+    de evolução do fitness e de frequência de escolha dos itens.
+
+    ``instancia`` (a tupla ``(pesos, valores, capacidade)`` de
+    ``otimizacao.instancias``) substitui ``itens`` e ``capacidade_mochila``.
+    Acima de ``ITENS_DETALHADOS`` itens não há comparação exata, histórico de
+    escolhas nem heatmap, e a solução é resumida em vez de impressa item a item.
+    Com ``relatorio`` (uma pasta), os gráficos vão para ``relatorio/index.html``
+    em vez de janelas.
+    """
+    from otimizacao.avaliacao import criar_avaliador
+    from otimizacao.genetico import FitnessMochila, algoritmo_genetico, itens_para_arrays
+
+    if instancia is None:
+        pesos, valores = itens_para_arrays(itens)
+    else:
+        pesos, valores, capacidade_mochila = instancia
+    detalhado = len(pesos) <= ITENS_DETALHADOS
+
+    # Evolução da população: população matricial, operadores em lote (otimizacao/genetico.py)
+    fitness = FitnessMochila(pesos, valores, capacidade_mochila, penalizar=restricao == "penalidade")
+    with criar_avaliador(fitness, backend_avaliacao) as avaliador:
+        melhor_individuo, melhor_fitness, melhores_fitness, historico_escolhas = algoritmo_genetico(
+            pesos, valores, capacidade_mochila,
+            tamanho_populacao=tamanho_populacao,
+            taxa_mutacao=taxa_mutacao,
+            geracoes=geracoes,
+            num_elitismo=num_elitismo,
+            funcao_fitness=avaliador,
+            capacidade_cache=capacidade_cache,
+            mostrar_prints=mostrar_prints,
+            comparar_exato=comparar_exato and detalhado and np.ndim(pesos) == 1,
+            semente=semente,
+            restricao=restricao,
+            guardar_historico=detalhado,
+        )
+
+    # Melhor solução encontrada
+    if detalhado:
+        print("Melhor solução encontrada:", melhor_individuo.tolist())
+    else:
+        print(f"Melhor solução encontrada: {int(melhor_individuo.sum())} de {len(pesos)} itens")
+    print("Valor total da mochila:", melhor_fitness)
+    print("Peso total da mochila:", pesos.T @ melhor_individuo)
+
+    if relatorio:
+        from otimizacao.relatorio import dados_execucao, gerar_relatorio
+
+        execucao = dados_execucao("GA mochila", melhores_fitness, historico_escolhas=historico_escolhas,
+                                  melhor_fitness=melhor_fitness, itens=len(pesos), semente=semente)
+        print("Relatório:", gerar_relatorio([execucao], relatorio, titulo="Algoritmo genético na mochila",
+                                            num_trabalhadores=1))
+    elif detalhado and (mostrar or pasta_graficos):
+        import os
+
+        def caminho(nome):
+            return os.path.join(pasta_graficos, nome) if pasta_graficos else None
+
+        grafico_evolucao_ga(melhores_fitness, arquivo=caminho("evolucao_ga.png"), mostrar=mostrar)
+        grafico_heatmap_itens(historico_escolhas, arquivo=caminho("heatmap_itens.png"), mostrar=mostrar)
+
+    return melhor_individuo, melhor_fitness
@@ -0,0 +1,476 @@
+"""
+Algoritmo Genético (GA) para o problema da mochila, com população matricial.
+
+A população inteira é uma matriz booleana ``(tamanho_populacao, n_itens)``:
+
+- peso e valor de todos os indivíduos saem de um produto matriz-vetor;
+- seleção por torneio, crossover de um ponto, mutação e a frequência de
+  escolha dos itens são operações em lote, sem laços em Python por gene ou
+  por indivíduo.
+
+Os pesos podem ter várias dimensões de recurso (peso, volume, ...): uma
+matriz ``(n_itens, k)`` com uma capacidade por coluna. Indivíduos que
+excedem alguma capacidade são tratados conforme ``restricao``: fitness zero
+(``"zero"``, o comportamento original), penalidade proporcional ao excesso
+(``"penalidade"``) ou reparo guloso pela razão valor/peso (``"reparo"``),
+que mantém toda a população viável.
+
+Com ``nucleo="numba"``, crossover e mutação são feitos em um único laço
+compilado que escreve os filhos direto na próxima população (ver
+``otimizacao.compilado``).
+"""
+import numpy as np
+
+from otimizacao.cache import CacheFitness
+from otimizacao.checkpoint import conferir_forma
+from otimizacao.compilado import filhos_ga, nucleo_compilado
+from otimizacao.mochila_exata import gap_otimalidade, resolver_exato
+from otimizacao.objetivos import avaliar_populacao, vetorizada
+from otimizacao.telemetria import escolher_cronometro, metricas_geracao
+
+# Elementos (linhas x itens) convertidos para float por vez nos produtos em bloco
+_ELEMENTOS_POR_BLOCO = 1 << 22
+
+RESTRICOES = ("zero", "penalidade", "reparo")
+# Itens percorridos na fase de complemento do reparo entre dois filtros de folga
+_ITENS_POR_FILTRO = 32
+
+
+def itens_para_arrays(itens):
+    """Converte a lista de dicionários ``{"peso", "valor"}`` em vetores NumPy."""
+    pesos = np.array([item["peso"] for item in itens], dtype=float)
+    valores = np.array([item["valor"] for item in itens], dtype=float)
+    return pesos, valores
+
+
+def somar_selecionados(populacao, vetor):
+    """
+    Calcula ``populacao @ vetor`` em blocos de linhas.
+
+    ``vetor`` pode ser uma matriz ``(n_itens, k)`` para somar ``k`` atributos
+    (ex.: peso e valor) em uma única passada pela população. Evita converter a
+    matriz booleana inteira para ``float`` de uma só vez, mantendo a memória
+    extra limitada mesmo para populações muito grandes.
+    """
+    n_individuos, n_itens = populacao.shape
+    linhas = max(1, _ELEMENTOS_POR_BLOCO // max(1, n_itens))
+    resultado = np.empty((n_individuos,) + np.shape(vetor)[1:])
+    for inicio in range(0, n_individuos, linhas):
+        fim = min(inicio + linhas, n_individuos)
+        resultado[inicio:fim] = populacao[inicio:fim] @ vetor
+    return resultado
+
+
+def restricoes_como_matriz(pesos, capacidade):
+    """Pesos como matriz ``(n_itens, k)`` e capacidades como vetor ``(k,)``."""
+    pesos = np.asarray(pesos, dtype=float)
+    pesos = pesos.reshape(len(pesos), -1)
+    capacidade = np.broadcast_to(np.asarray(capacidade, dtype=float), (pesos.shape[1],))
+    return pesos, capacidade
+
+
+def densidade_maxima(pesos, valores):
+    """Maior valor por unidade de cada recurso (usada como coeficiente da penalidade)."""
+    pesos = np.asarray(pesos, dtype=float).reshape(len(valores), -1)
+    valores = np.asarray(valores, dtype=float)[:, np.newaxis]
+    razoes = np.divide(valores, pesos, out=np.zeros_like(pesos), where=pesos > 0)
+    return razoes.max(axis=0)
+
+
+def fitness_mochila(populacao, pesos, valores, capacidade, penalizar=False):
+    """
+    Fitness de cada indivíduo: valor total, ou 0 se exceder a capacidade.
+
+    Parâmetros:
+        populacao (np.ndarray): Matriz booleana ``(n_individuos, n_itens)``.
+        pesos (np.ndarray): Peso de cada item, ou matriz ``(n_itens, k)`` com
+            ``k`` recursos.
+        valores (np.ndarray): Valor de cada item.
+        capacidade (float | array-like): Capacidade da mochila (uma por recurso).
+        penalizar (bool): Em vez de zerar, subtrai de indivíduos inviáveis o
+            excesso de cada recurso vezes a maior densidade de valor desse
+            recurso (``densidade_maxima``).
+
+    Retorna:
+        np.ndarray: Vetor com o fitness de cada indivíduo.
+    """
+    populacao = np.atleast_2d(populacao)
+    pesos, capacidade = restricoes_como_matriz(pesos, capacidade)
+    totais = somar_selecionados(populacao, np.column_stack([pesos, valores]))
+    cargas, valor_total = totais[:, :-1], totais[:, -1].copy()
+    excesso = np.maximum(cargas - capacidade, 0.0)
+    if penalizar:
+        valor_total -= excesso @ densidade_maxima(pesos, valores)
+    else:
+        valor_total[excesso.any(axis=1)] = 0  # Penalização para soluções inválidas
+    return valor_total
+
+
+class FitnessMochila:
+    """
+    ``fitness_mochila`` com a instância fixada, como função vetorizada.
+
+    Por ser uma classe de módulo, pode ser enviada a outros processos
+    (ex.: ``criar_avaliador(FitnessMochila(...), "processos")``).
+    """
+
+    vetorizada = True
+
+    def __init__(self, pesos, valores, capacidade, penalizar=False):
+        self.pesos = np.asarray(pesos, dtype=float)
+        self.valores = np.asarray(valores, dtype=float)
+        self.capacidade = capacidade
+        self.penalizar = penalizar
+
+    def __call__(self, populacao):
+        return fitness_mochila(populacao, self.pesos, self.valores, self.capacidade, self.penalizar)
+
+
+def ordem_reparo(pesos, valores, capacidade):
+    """
+    Índices dos itens em ordem crescente de razão valor/peso (ordem de remoção).
+
+    Com vários recursos, o peso de um item é a soma dos pesos normalizados
+    pelas capacidades, ``sum_k pesos[i, k] / capacidade[k]``.
+    """
+    pesos, capacidade = restricoes_como_matriz(pesos, capacidade)
+    peso_normalizado = (pesos / np.where(capacidade > 0, capacidade, 1.0)).sum(axis=1)
+    razao = np.divide(np.asarray(valores, dtype=float), peso_normalizado,
+                      out=np.full(len(pesos), np.inf), where=peso_normalizado > 0)
+    return np.argsort(razao, kind="stable")
+
+
+def reparar_mochila(populacao, pesos, valores, capacidade, ordem=None, completar=True):
+    """
+    Torna viáveis todos os indivíduos da população (in-place), de forma gulosa.
+
+    1. Remoção: cada indivíduo inviável perde seus itens de pior razão
+       valor/peso até caber em todas as capacidades. O ponto de corte de toda
+       a população sai de uma soma acumulada na ordem de ``ordem_reparo``.
+    2. Complemento (``completar``): percorrendo os itens da melhor para a pior
+       razão, cada item que ainda cabe é incluído em todos os indivíduos com
+       folga para ele (um passo vetorizado por item).
+
+    Parâmetros:
+        populacao (np.ndarray): Matriz booleana ``(n_individuos, n_itens)``.
+        pesos, valores, capacidade: Como em ``fitness_mochila``.
+        ordem (np.ndarray | None): Ordem de remoção pré-calculada por
+            ``ordem_reparo`` (recalculada se ``None``).
+        completar (bool): Executa a fase de complemento.
+
+    Retorna:
+        np.ndarray: A própria ``populacao``, reparada.
+    """
+    pesos, capacidade = restricoes_como_matriz(pesos, capacidade)
+    if ordem is None:
+        ordem = ordem_reparo(pesos, valores, capacidade)
+    n_itens = len(ordem)
+    pesos_ordenados = pesos[ordem]
+    posicao_original = np.empty_like(ordem)
+    posicao_original[ordem] = np.arange(n_itens)
+    linhas_por_bloco = max(1, _ELEMENTOS_POR_BLOCO // max(1, n_itens))
+
+    cargas = somar_selecionados(populacao, pesos)
+    inviaveis = np.flatnonzero((cargas > capacidade).any(axis=1))
+    while len(inviaveis):
+        for inicio in range(0, len(inviaveis), linhas_por_bloco):
+            linhas = inviaveis[inicio:inicio + linhas_por_bloco]
+            selecionados = populacao[linhas][:, ordem]
+            excesso = cargas[linhas] - capacidade
+            corte = np.zeros(len(linhas), dtype=np.int64)
+            for recurso in np.flatnonzero((excesso > 0).any(axis=0)):
+                removido = np.cumsum(selecionados * pesos_ordenados[:, recurso], axis=1)
+                basta = removido >= excesso[:, recurso, np.newaxis]
+                posicao = np.where(basta.any(axis=1), basta.argmax(axis=1), n_itens - 1)
+                corte = np.maximum(corte, np.where(excesso[:, recurso] > 0, posicao + 1, 0))
+            selecionados &= np.arange(n_itens) >= corte[:, np.newaxis]
+            populacao[linhas] = selecionados[:, posicao_original]
+        # Recalcula as cargas dos reparados (arredondamentos podem exigir outra passada)
+        cargas[inviaveis] = somar_selecionados(populacao[inviaveis], pesos)
+        inviaveis = inviaveis[(cargas[inviaveis] > capacidade).any(axis=1)]
+
+    if completar:
+        folga = capacidade - cargas
+        candidatos = ordem[::-1]  # melhor razão primeiro
+        while len(candidatos):
+            # A folga só diminui: itens que não cabem na maior folga de nenhum indivíduo são descartados
+            candidatos = candidatos[(pesos[candidatos] <= folga.max(axis=0)).all(axis=1)]
+            for item in candidatos[:_ITENS_POR_FILTRO]:
+                cabe = ~populacao[:, item] & (folga >= pesos[item]).all(axis=1)
+                populacao[cabe, item] = True
+                folga[cabe] -= pesos[item]
+            candidatos = candidatos[_ITENS_POR_FILTRO:]
+    return populacao
+
+
+def selecao_torneio(fitness, quantidade, tamanho_torneio, rng):
+    """Retorna os índices dos vencedores de ``quantidade`` torneios simultâneos."""
+    competidores = rng.integers(0, len(fitness), (quantidade, tamanho_torneio))
+    vencedores = np.argmax(fitness[competidores], axis=1)
+    return competidores[np.arange(quantidade), vencedores]
+
+
+def crossover_um_ponto(pais1, pais2, rng):
+    """Crossover de um ponto para todos os pares de uma vez; gera dois filhos por par."""
+    n_itens = pais1.shape[1]
+    pontos_corte = rng.integers(1, n_itens, len(pais1)) if n_itens > 1 else np.ones(len(pais1), dtype=int)
+    antes_do_corte = np.arange(n_itens) < pontos_corte[:, np.newaxis]
+    filhos1 = np.where(antes_do_corte, pais1, pais2)
+    filhos2 = np.where(antes_do_corte, pais2, pais1)
+    return np.concatenate([filhos1, filhos2])
+
+
+def mutacao(filhos, taxa_mutacao, rng):
+    """Com probabilidade ``taxa_mutacao``, inverte um gene aleatório de cada filho (in-place)."""
+    mutantes = np.flatnonzero(rng.random(len(filhos)) < taxa_mutacao)
+    genes = rng.integers(0, filhos.shape[1], len(mutantes))
+    filhos[mutantes, genes] ^= True
+    return filhos
+
+
+def _indices_elite(fitness, num_elitismo):
+    if not num_elitismo:
+        return np.empty(0, dtype=int)
+    return np.argpartition(-fitness, num_elitismo - 1)[:num_elitismo]
+
+
+def sorteios_reproducao(num_pares, n_itens, taxa_mutacao, rng):
+    """
+    Sorteia os pontos de corte e os genes mutados de uma geração, na mesma
+    ordem de ``crossover_um_ponto`` seguido de ``mutacao``.
+
+    Retorna:
+        tuple: (pontos_corte ``(num_pares,)``, genes_mutados ``(2 * num_pares,)``,
+        com ``-1`` nos filhos sem mutação).
+    """
+    pontos_corte = rng.integers(1, n_itens, num_pares) if n_itens > 1 else np.ones(num_pares, dtype=int)
+    mutantes = np.flatnonzero(rng.random(2 * num_pares) < taxa_mutacao)
+    genes_mutados = np.full(2 * num_pares, -1, dtype=np.int64)
+    genes_mutados[mutantes] = rng.integers(0, n_itens, len(mutantes))
+    return pontos_corte, genes_mutados
+
+
+def algoritmo_genetico(pesos, valores, capacidade, tamanho_populacao=100, taxa_mutacao=0.8, geracoes=40,
+                       num_elitismo=2, tamanho_torneio=3, funcao_fitness=None, capacidade_cache=None,
+                       semente=None, mostrar_prints=False, comparar_exato=False, telemetria=None,
+                       guardar_historico=True, checkpoint=None, parada=None, perfil=None, restricao="zero",
+                       nucleo="numpy", substituto=None):
+    """
+    Resolve o problema da mochila 0/1 com um algoritmo genético.
+
+    Parâmetros:
+        pesos (array-like): Peso de cada item, ou matriz ``(n_itens, k)`` para
+            ``k`` recursos (peso, volume, ...).
+        valores (array-like): Valor de cada item.
+        capacidade (float | array-like): Capacidade da mochila (uma por recurso).
+        tamanho_populacao (int): Número de indivíduos (constante entre gerações).
+        taxa_mutacao (float): Probabilidade de um filho sofrer mutação de um gene.
+        geracoes (int): Número de gerações.
+        num_elitismo (int): Melhores indivíduos copiados para a geração seguinte.
+        tamanho_torneio (int): Competidores por torneio.
+        funcao_fitness (callable | None): Fitness alternativo que recebe a matriz
+            da população (ex.: um avaliador de ``otimizacao.avaliacao``). O padrão
+            é ``fitness_mochila``, calculado por produto matriz-vetor.
+        capacidade_cache (int | None): Se informado, o fitness (``funcao_fitness``
+            ou o padrão) passa por um ``CacheFitness`` com essa capacidade.
+        semente (int | np.random.Generator | None): Semente ou gerador aleatório.
+        mostrar_prints (bool): Imprime o melhor fitness (e o cache) por geração.
+        comparar_exato (bool): Ao final, resolve a instância de forma exata
+            (``otimizacao.mochila_exata.resolver_exato``) e imprime o gap de
+            otimalidade da solução do GA.
+        telemetria (TelemetriaCSV | TelemetriaAnel | None): Destino das métricas
+            de cada geração (ver ``otimizacao.telemetria``).
+        guardar_historico (bool): Se falso, ``melhores_fitness`` fica vazio e
+            ``historico_escolhas`` é ``None`` (memória constante em execuções longas).
+        checkpoint (Checkpoint | None): Grava o estado periodicamente e, se o
+            arquivo já existir, retoma a execução a partir dele
+            (ver ``otimizacao.checkpoint``). O conteúdo do cache não é salvo.
+        parada (CriteriosParada | None): Critérios de parada antecipada,
+            verificados ao fim de cada geração (maximizando); o critério atingido fica em
+            ``parada.motivo`` (ver ``otimizacao.parada``).
+        perfil (CronometroFases | None): Acumula o tempo de cada fase
+            (``perfil.resumo()``). Sem ``perfil`` nem ``telemetria``, as fases
+            não são cronometradas.
+        restricao (str): Tratamento de indivíduos inviáveis: ``"zero"``
+            (fitness 0), ``"penalidade"`` (``fitness_mochila(...,
+            penalizar=True)``) ou ``"reparo"`` (``reparar_mochila`` na população
+            inicial e nos filhos, de modo que toda avaliação é de um indivíduo
+            viável). ``"penalidade"`` só afeta o fitness padrão; com
+            ``funcao_fitness``, a penalidade fica a cargo dessa função.
+        nucleo (str): ``"numpy"`` (padrão), ``"numba"`` (crossover e mutação em
+            um laço compilado, sem a matriz de pais nem os filhos temporários)
+            ou ``"auto"`` (Numba quando disponível). O resultado é o mesmo para
+            a mesma semente.
+        substituto (Substituto | None): Modelo substituto (distância de Hamming
+            entre cromossomos) que envia ao fitness real só a fração mais
+            promissora de cada população; os demais indivíduos recebem o fitness
+            previsto. A solução final é escolhida pelo fitness real (ver
+            ``otimizacao.substituto``).
+
+    Retorna:
+        tuple: (melhor_individuo, melhor_fitness, melhores_fitness, historico_escolhas),
+        em que ``historico_escolhas[g, i]`` é quantos indivíduos da geração ``g``
+        levam o item ``i``.
+    """
+    if restricao not in RESTRICOES:
+        raise ValueError(f"restricao deve ser uma de {RESTRICOES}.")
+    multiplos_recursos = np.ndim(pesos) == 2
+    if comparar_exato and multiplos_recursos:
+        raise ValueError("comparar_exato só está disponível para uma única restrição de capacidade.")
+    rng = np.random.default_rng(semente)
+    pesos = np.asarray(pesos, dtype=float)
+    valores = np.asarray(valores, dtype=float)
+    n_itens = len(pesos)
+    penalizar = restricao == "penalidade"
+    ordem = ordem_reparo(pesos, valores, capacidade) if restricao == "reparo" else None
+    compilado = nucleo_compilado(nucleo)
+
+    if funcao_fitness is None:
+        @vetorizada
+        def funcao_fitness(populacao):
+            return fitness_mochila(populacao, pesos, valores, capacidade, penalizar)
+
+    cache = None
+    if capacidade_cache:
+        cache = CacheFitness(funcao_fitness, capacidade=capacidade_cache)
+        avaliar = cache.avaliar
+    else:
+        def avaliar(populacao):
+            return avaliar_populacao(funcao_fitness, populacao)
+
+    avaliar_real = avaliar
+    if substituto is not None:
+        @vetorizada
+        def avaliar_lote(populacao):
+            return avaliar_real(populacao)
+
+        def avaliar(populacao):
+            return substituto.avaliar(avaliar_lote, populacao, maximizar=True)
+
+    num_elitismo = min(num_elitismo, tamanho_populacao)
+    num_pares = -(-(tamanho_populacao - num_elitismo) // 2)
+    historico_escolhas = np.zeros((geracoes, n_itens)) if guardar_historico else None
+    melhores_fitness = []
+    cronometro = escolher_cronometro(perfil, telemetria)
+
+    inicio = 0
+    estado = checkpoint.carregar("ga", rng) if checkpoint is not None else None
+    if estado is None:
+        # Inicialização da população
+        populacao = rng.random((tamanho_populacao, n_itens)) < 0.5
+        if ordem is not None:
+            reparar_mochila(populacao, pesos, valores, capacidade, ordem)
+    else:
+        conferir_forma(estado, "populacao", (tamanho_populacao, n_itens))
+        inicio = estado["geracao"]
+        populacao = estado["populacao"]
+        melhores_fitness = estado["melhores_fitness"].tolist()
+        if guardar_historico:
+            historico_escolhas[:inicio] = estado["historico_escolhas"][:inicio]
+        if substituto is not None:
+            substituto.restaurar(estado)
+    if parada is not None:
+        parada.iniciar(maximizar=True)
+        if estado is not None:
+            parada.restaurar(estado)
+    geracoes_executadas = inicio
+    # No núcleo compilado, duas matrizes de população se alternam entre as gerações
+    proxima = np.empty_like(populacao) if compilado else None
+
+    # Só as avaliações reais contam: com cache, as falhas; com substituto, os envios ao fitness
+    contar_avaliacoes = None
+    if cache is not None:
+        def contar_avaliacoes():
+            return cache.falhas
+    elif substituto is not None:
+        def contar_avaliacoes():
+            return substituto.avaliacoes_reais
+
+    # Um checkpoint gravado na parada antecipada devolve o resultado sem novas gerações
+    fim = inicio if parada is not None and parada.motivo is not None else geracoes
+    for geracao in range(inicio, fim):
+        cronometro.reiniciar()
+        avaliacoes_antes = contar_avaliacoes() if contar_avaliacoes is not None else 0
+        fitness = avaliar(populacao)
+        avaliacoes = tamanho_populacao if contar_avaliacoes is None else contar_avaliacoes() - avaliacoes_antes
+        cronometro.marcar("avaliacao")
+        melhor_geracao = fitness.max()
+        if guardar_historico:
+            melhores_fitness.append(melhor_geracao)
+            historico_escolhas[geracao] = populacao.sum(axis=0)
+        populacao_avaliada = populacao  # usada na diversidade da telemetria
+
+        # Seleção por torneio: dois pais por par de filhos
+        indices_pais = selecao_torneio(fitness, 2 * num_pares, tamanho_torneio, rng)
+        cronometro.marcar("selecao")
+
+        if compilado:
+            pontos_corte, genes_mutados = sorteios_reproducao(num_pares, n_itens, taxa_mutacao, rng)
+            filhos = proxima[num_elitismo:]
+            filhos_ga(populacao, indices_pais, pontos_corte, genes_mutados, filhos)
+            cronometro.marcar("reproducao")
+            if ordem is not None:
+                reparar_mochila(filhos, pesos, valores, capacidade, ordem)
+                cronometro.marcar("reparo")
+            proxima[:num_elitismo] = populacao[_indices_elite(fitness, num_elitismo)]
+            populacao, proxima = proxima, populacao
+            cronometro.marcar("elitismo")
+        else:
+            pais = populacao[indices_pais]
+
+            # Crossover e mutação em lote
+            filhos = crossover_um_ponto(pais[0::2], pais[1::2], rng)
+            cronometro.marcar("crossover")
+            mutacao(filhos, taxa_mutacao, rng)
+            cronometro.marcar("mutacao")
+            if ordem is not None:
+                reparar_mochila(filhos, pesos, valores, capacidade, ordem)
+                cronometro.marcar("reparo")
+
+            # Elitismo: mantém os melhores indivíduos da geração anterior
+            elite = _indices_elite(fitness, num_elitismo)
+            populacao = np.concatenate([populacao[elite], filhos[:tamanho_populacao - num_elitismo]])
+            cronometro.marcar("elitismo")
+
+        if telemetria is not None:
+            telemetria.registrar(metricas_geracao(geracao + 1, melhor_geracao, fitness, populacao_avaliada,
+                                                  avaliacoes, cronometro, maximizar=True))
+
+        if mostrar_prints:
+            mensagem = f"[Geração {geracao + 1}] melhor fitness = {melhor_geracao:g}"
+            if cache is not None:
+                estatisticas = cache.estatisticas()
+                mensagem += (f" | cache: {estatisticas['acertos']} acertos, {estatisticas['falhas']} falhas "
+                             f"({100 * estatisticas['taxa_acerto']:.1f}% de acerto)")
+            if substituto is not None:
+                mensagem += f" | substituto: {substituto.estatisticas()['economizadas']} avaliações economizadas"
+            print(mensagem)
+
+        parar = parada is not None and parada.verificar(geracao + 1, melhor_geracao, populacao_avaliada,
+                                                        avaliacoes)
+
+        if checkpoint is not None and (parar or checkpoint.deve_salvar(geracao + 1, geracoes)):
+            checkpoint.salvar("ga", geracao + 1, rng, populacao=populacao, melhores_fitness=melhores_fitness,
+                              historico_escolhas=historico_escolhas[:geracao + 1] if guardar_historico
+                              else np.empty((0, n_itens)), **(parada.estado() if parada is not None else {}),
+                              **(substituto.estado() if substituto is not None else {}))
+
+        geracoes_executadas = geracao + 1
+        if parar:
+            if mostrar_prints:
+                print(f"Parada antecipada na geração {geracao + 1}: {parada.motivo}")
+            break
+
+    if guardar_historico:
+        historico_escolhas = historico_escolhas[:geracoes_executadas]
+
+    # Melhor solução encontrada (com penalidade, só indivíduos viáveis contam)
+    fitness = fitness_mochila(populacao, pesos, valores, capacidade) if penalizar else avaliar_real(populacao)
+    indice_melhor = np.argmax(fitness)
+
+    if comparar_exato:
+        _, valor_otimo = resolver_exato(pesos, valores, capacidade)
+        print(f"Solução exata: {valor_otimo:g} | GA: {fitness[indice_melhor]:g} | "
+              f"gap de otimalidade: {100 * gap_otimalidade(fitness[indice_melhor], valor_otimo):.2f}%")
+
+    return populacao[indice_melhor].astype(int), fitness[indice_melhor], melhores_fitness, historico_escolhas
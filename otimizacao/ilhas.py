@@ -0,0 +1,184 @@
+"""
+Modelo de ilhas para PSO e ABC com migração periódica e assíncrona.
+
+Cada ilha é um enxame (``EnxamePSO``) ou uma colônia (``ABC``) independente,
+executado em um processo próprio. A cada ``intervalo_migracao`` gerações,
+cada ilha envia suas ``num_migrantes`` melhores soluções às vizinhas e
+incorpora as que já chegaram na sua caixa de entrada, substituindo seus
+piores indivíduos. As caixas de entrada são ``multiprocessing.Queue``
+(pipes): o envio não bloqueia e a leitura só consome o que já chegou, então
+uma ilha lenta nunca segura as rápidas.
+
+Topologias:
+
+- ``"anel"``: a ilha ``i`` envia para a ilha ``i + 1`` (módulo ``num_ilhas``).
+- ``"completa"``: cada ilha envia para todas as outras.
+
+Com ``paralelo=False`` as ilhas rodam intercaladas no processo atual, com
+migração síncrona; o resultado é então determinístico para a mesma semente.
+"""
+import multiprocessing
+import queue
+
+import numpy as np
+
+from otimizacao.abelhas import ABC
+from otimizacao.pso import EnxamePSO
+
+TOPOLOGIAS = ("anel", "completa")
+
+
+def vizinhos(topologia, num_ilhas):
+    """Lista, para cada ilha, os índices das ilhas para as quais ela envia migrantes."""
+    if topologia == "anel":
+        return [[(i + 1) % num_ilhas] if num_ilhas > 1 else [] for i in range(num_ilhas)]
+    if topologia == "completa":
+        return [[j for j in range(num_ilhas) if j != i] for i in range(num_ilhas)]
+    raise ValueError(f"Topologia desconhecida: {topologia!r}. Use uma de {TOPOLOGIAS}.")
+
+
+def _criar_ilha(algoritmo, funcao_custo, dimensao, tamanho, limites, semente, parametros):
+    if algoritmo == "pso":
+        return EnxamePSO(funcao_custo, dimensao=dimensao, num_particulas=tamanho, limites=limites,
+                         semente=semente, **parametros)
+    if algoritmo == "abc":
+        return ABC(funcao_custo, num_bees=tamanho, dim=dimensao, lim_inf=limites[0], lim_sup=limites[1],
+                   semente=semente, **parametros)
+    raise ValueError(f"Algoritmo desconhecido: {algoritmo!r}. Use 'pso' ou 'abc'.")
+
+
+def _melhor(ilha):
+    if isinstance(ilha, EnxamePSO):
+        return ilha.melhor_global, ilha.melhor_fitness_global
+    return ilha.best_position, ilha.best_fitness
+
+
+def _incorporar(ilha, chegadas, num_migrantes):
+    # Entre todos os migrantes recebidos, ficam os num_migrantes melhores
+    posicoes = np.concatenate([p for p, _ in chegadas])
+    fitness = np.concatenate([f for _, f in chegadas])
+    melhores = np.argsort(fitness, kind="stable")[:num_migrantes]
+    ilha.receber_migrantes(posicoes[melhores], fitness[melhores])
+    return len(melhores)
+
+
+def _executar_ilha(indice, configuracao, semente, caixa_entrada, caixas_vizinhas, resultados):
+    (algoritmo, funcao_custo, dimensao, tamanho, limites, parametros, geracoes, intervalo_migracao,
+     num_migrantes) = configuracao
+    # Migrantes não entregues podem ser descartados ao fim da execução
+    for caixa in caixas_vizinhas:
+        caixa.cancel_join_thread()
+
+    ilha = _criar_ilha(algoritmo, funcao_custo, dimensao, tamanho, limites, semente, parametros)
+    historico_melhor = []
+    recebidos = 0
+    for geracao in range(geracoes):
+        ilha.passo()
+        historico_melhor.append(_melhor(ilha)[1])
+        if (geracao + 1) % intervalo_migracao == 0:
+            migrantes = ilha.emigrantes(num_migrantes)
+            for caixa in caixas_vizinhas:
+                caixa.put(migrantes)
+            chegadas = []
+            while True:
+                try:
+                    chegadas.append(caixa_entrada.get_nowait())
+                except queue.Empty:
+                    break
+            if chegadas:
+                recebidos += _incorporar(ilha, chegadas, num_migrantes)
+
+    posicao, fitness = _melhor(ilha)
+    resultados.put({"ilha": indice, "melhor_posicao": posicao, "melhor_fitness": fitness,
+                    "historico_melhor": historico_melhor, "migrantes_recebidos": recebidos})
+
+
+def _executar_sequencial(configuracao, sementes, destinos):
+    (algoritmo, funcao_custo, dimensao, tamanho, limites, parametros, geracoes, intervalo_migracao,
+     num_migrantes) = configuracao
+    ilhas = [_criar_ilha(algoritmo, funcao_custo, dimensao, tamanho, limites, semente, parametros)
+             for semente in sementes]
+    historicos = [[] for _ in ilhas]
+    recebidos = [0] * len(ilhas)
+    for geracao in range(geracoes):
+        for ilha, historico in zip(ilhas, historicos):
+            ilha.passo()
+            historico.append(_melhor(ilha)[1])
+        if (geracao + 1) % intervalo_migracao == 0:
+            caixas = [[] for _ in ilhas]
+            for origem, ilha in enumerate(ilhas):
+                migrantes = ilha.emigrantes(num_migrantes)
+                for destino in destinos[origem]:
+                    caixas[destino].append(migrantes)
+            for indice, (ilha, chegadas) in enumerate(zip(ilhas, caixas)):
+                if chegadas:
+                    recebidos[indice] += _incorporar(ilha, chegadas, num_migrantes)
+
+    return [{"ilha": indice, "melhor_posicao": _melhor(ilha)[0], "melhor_fitness": _melhor(ilha)[1],
+             "historico_melhor": historicos[indice], "migrantes_recebidos": recebidos[indice]}
+            for indice, ilha in enumerate(ilhas)]
+
+
+def executar_ilhas(algoritmo, funcao_custo, num_ilhas=4, dimensao=2, tamanho_ilha=30, geracoes=100,
+                   intervalo_migracao=10, num_migrantes=1, topologia="anel", limites=(-5.12, 5.12),
+                   semente=None, parametros=None, paralelo=True):
+    """
+    Otimiza ``funcao_custo`` com várias ilhas de PSO ou ABC e migração periódica.
+
+    Parâmetros:
+        algoritmo (str): ``"pso"`` ou ``"abc"``.
+        funcao_custo (callable): Função objetivo (precisa ser serializável com
+            pickle quando os processos são criados com ``spawn``).
+        num_ilhas (int): Número de ilhas (um processo por ilha).
+        dimensao (int): Número de variáveis de decisão.
+        tamanho_ilha (int): Partículas ou fontes de alimento por ilha.
+        geracoes (int): Gerações de cada ilha.
+        intervalo_migracao (int): Gerações entre migrações.
+        num_migrantes (int): Soluções enviadas (e aceitas) por migração.
+        topologia (str): ``"anel"`` ou ``"completa"``.
+        limites (tuple): Limites (inferior, superior) de cada coordenada.
+        semente (int | None): Semente raiz; cada ilha recebe um gerador
+            derivado de ``np.random.SeedSequence(semente).spawn``.
+        parametros (dict | None): Parâmetros extras de ``EnxamePSO`` (``w``,
+            ``c1``, ``c2``) ou de ``ABC`` (``limite_abandono``).
+        paralelo (bool): Um processo por ilha com migração assíncrona; se
+            falso, ilhas intercaladas no processo atual.
+
+    Retorna:
+        tuple: (melhor_posicao, melhor_fitness, por_ilha), em que ``por_ilha`` é
+        a lista com ``melhor_fitness``, ``historico_melhor`` e
+        ``migrantes_recebidos`` de cada ilha.
+    """
+    destinos = vizinhos(topologia, num_ilhas)
+    sementes = np.random.SeedSequence(semente).spawn(num_ilhas)
+    configuracao = (algoritmo, funcao_custo, dimensao, tamanho_ilha, limites, dict(parametros or {}), geracoes,
+                    intervalo_migracao, num_migrantes)
+
+    if not paralelo:
+        por_ilha = _executar_sequencial(configuracao, sementes, destinos)
+    else:
+        contexto = multiprocessing.get_context()
+        caixas = [contexto.Queue() for _ in range(num_ilhas)]
+        resultados = contexto.Queue()
+        processos = [contexto.Process(target=_executar_ilha,
+                                      args=(indice, configuracao, sementes[indice], caixas[indice],
+                                            [caixas[j] for j in destinos[indice]], resultados))
+                     for indice in range(num_ilhas)]
+        for processo in processos:
+            processo.start()
+        try:
+            # Lê os resultados antes do join para não travar em um pipe cheio
+            por_ilha = []
+            while len(por_ilha) < num_ilhas:
+                try:
+                    por_ilha.append(resultados.get(timeout=1.0))
+                except queue.Empty:
+                    if any(processo.exitcode not in (None, 0) for processo in processos):
+                        raise RuntimeError("Uma das ilhas terminou com erro.") from None
+            por_ilha.sort(key=lambda r: r["ilha"])
+        finally:
+            for processo in processos:
+                processo.join()
+
+    melhor = min(por_ilha, key=lambda r: r["melhor_fitness"])
+    return melhor["melhor_posicao"], melhor["melhor_fitness"], por_ilha
@@ -0,0 +1,290 @@
+"""
+Instâncias do problema da mochila: leitura de arquivos e geração sintética.
+
+Uma instância é a tupla ``(pesos, valores, capacidade)`` aceita por
+``algoritmo_genetico``: ``pesos`` é um vetor ``(n_itens,)`` ou, com vários
+recursos, uma matriz ``(n_itens, k)``; ``capacidade`` é um número ou um vetor
+``(k,)``.
+
+Formatos lidos por ``carregar_instancia``:
+
+- ``"npz"``: arquivo de ``salvar_instancia`` (``np.savez`` sem compressão). Os
+  arrays são mapeados direto do arquivo (``np.memmap``), então abrir uma
+  instância com milhões de itens não lê os dados: o custo é constante e as
+  páginas são carregadas sob demanda.
+- ``"orlib"``: formato da OR-Library para a mochila multidimensional
+  (``mknap1.txt``, ``mknapcb*.txt``): número de problemas e, para cada um,
+  ``n m ótimo``, os ``n`` valores, a matriz ``m x n`` de pesos e as ``m``
+  capacidades.
+- ``"texto"``: ``n capacidade`` na primeira linha e ``valor peso`` em cada
+  linha seguinte (formato das instâncias de Pisinger).
+- ``"csv"``: cabeçalho com a coluna ``valor`` e uma ou mais colunas
+  ``peso*``; a capacidade vem do parâmetro ``capacidade`` ou de uma linha
+  ``# capacidade = 30`` (``30, 20`` para vários recursos) antes do cabeçalho.
+
+Os formatos de texto são lidos por inteiro; com ``cache=True`` a primeira
+leitura grava ``<arquivo>.instancia.npz`` e as seguintes usam o mapeamento.
+
+``gerar_instancia`` produz instâncias aleatórias com semente nas classes
+clássicas de Pisinger (não correlacionada, fracamente e fortemente
+correlacionada, inversa e soma de subconjuntos).
+"""
+import argparse
+import os
+import sys
+import zipfile
+
+import numpy as np
+
+FORMATOS = ("auto", "npz", "orlib", "texto", "csv")
+TIPOS = ("nao_correlacionada", "fracamente_correlacionada", "fortemente_correlacionada", "inversa", "subconjunto")
+
+
+# ----------------------------
+# NPZ mapeado em memória
+# ----------------------------
+def salvar_instancia(arquivo, pesos, valores, capacidade):
+    """
+    Grava a instância em ``.npz`` sem compressão (``float64`` contíguo), o
+    formato que ``carregar_instancia`` mapeia em memória.
+    """
+    np.savez(arquivo, pesos=np.ascontiguousarray(pesos, dtype=np.float64),
+             valores=np.ascontiguousarray(valores, dtype=np.float64),
+             capacidade=np.asarray(capacidade, dtype=np.float64))
+
+
+def _mapear_npz(arquivo):
+    # np.load ignora mmap_mode em .npz; membros sem compressão são mapeados a partir do deslocamento no zip
+    arrays = {}
+    with zipfile.ZipFile(arquivo) as pacote, open(arquivo, "rb") as f:
+        for membro in pacote.infolist():
+            nome = membro.filename[:-len(".npy")]
+            if membro.compress_type != zipfile.ZIP_STORED:
+                with pacote.open(membro) as dados:
+                    arrays[nome] = np.lib.format.read_array(dados)
+                continue
+            # Cabeçalho local do zip: 30 bytes fixos + nome + campo extra
+            f.seek(membro.header_offset + 26)
+            tamanho_nome, tamanho_extra = np.frombuffer(f.read(4), dtype="<u2")
+            f.seek(membro.header_offset + 30 + int(tamanho_nome) + int(tamanho_extra))
+            versao = np.lib.format.read_magic(f)
+            if versao == (1, 0):
+                forma, fortran, dtype = np.lib.format.read_array_header_1_0(f)
+            else:
+                forma, fortran, dtype = np.lib.format.read_array_header_2_0(f)
+            if forma == () or 0 in forma:
+                with pacote.open(membro) as dados:
+                    arrays[nome] = np.lib.format.read_array(dados)
+            else:
+                arrays[nome] = np.memmap(arquivo, dtype=dtype, mode="r", offset=f.tell(), shape=forma,
+                                         order="F" if fortran else "C")
+    return arrays
+
+
+def _instancia_de_arrays(arrays, arquivo):
+    faltando = {"pesos", "valores", "capacidade"} - set(arrays)
+    if faltando:
+        raise ValueError(f"'{arquivo}' não tem os arrays {sorted(faltando)}.")
+    capacidade = arrays["capacidade"]
+    return arrays["pesos"], arrays["valores"], capacidade[()] if capacidade.ndim == 0 else np.asarray(capacidade)
+
+
+# ----------------------------
+# Formatos de texto
+# ----------------------------
+def _ler_orlib(arquivo, problema):
+    numeros = np.fromfile(arquivo, sep=" ")
+    posicao = 1
+    for indice in range(int(numeros[0])):
+        n_itens, n_recursos = int(numeros[posicao]), int(numeros[posicao + 1])
+        posicao += 3
+        if indice == problema:
+            valores = numeros[posicao:posicao + n_itens]
+            posicao += n_itens
+            pesos = numeros[posicao:posicao + n_recursos * n_itens].reshape(n_recursos, n_itens)
+            posicao += n_recursos * n_itens
+            capacidade = numeros[posicao:posicao + n_recursos]
+            if n_recursos == 1:
+                return pesos[0].copy(), valores.copy(), capacidade[0]
+            return np.ascontiguousarray(pesos.T), valores.copy(), capacidade.copy()
+        posicao += n_itens * (n_recursos + 1) + n_recursos
+    raise ValueError(f"'{arquivo}' tem {int(numeros[0])} problema(s); problema={problema} não existe.")
+
+
+def _ler_texto(arquivo):
+    numeros = np.fromfile(arquivo, sep=" ")
+    n_itens = int(numeros[0])
+    pares = numeros[2:2 + 2 * n_itens].reshape(n_itens, 2)
+    return np.ascontiguousarray(pares[:, 1]), np.ascontiguousarray(pares[:, 0]), numeros[1]
+
+
+def _ler_csv(arquivo, capacidade):
+    with open(arquivo) as f:
+        linha = f.readline()
+        while linha.startswith("#"):
+            comentario = linha.lstrip("#").strip()
+            if comentario.startswith("capacidade") and capacidade is None:
+                texto = comentario.split("=", 1)[1] if "=" in comentario else comentario.split(":", 1)[1]
+                capacidade = [float(parte) for parte in texto.split(",")]
+            linha = f.readline()
+        colunas = [coluna.strip().lower() for coluna in linha.split(",")]
+        colunas_peso = [i for i, coluna in enumerate(colunas) if coluna.startswith("peso")]
+        if "valor" not in colunas or not colunas_peso:
+            raise ValueError(f"'{arquivo}' precisa das colunas 'valor' e 'peso' (ou 'peso_1', 'peso_2', ...).")
+        if capacidade is None:
+            raise ValueError(f"'{arquivo}' não informa a capacidade; use o parâmetro capacidade.")
+        # Outras colunas (nome, código do produto, ...) são ignoradas
+        dados = np.loadtxt(f, delimiter=",", ndmin=2, usecols=[colunas.index("valor")] + colunas_peso)
+    valores = np.ascontiguousarray(dados[:, 0])
+    pesos = np.ascontiguousarray(dados[:, 1] if len(colunas_peso) == 1 else dados[:, 1:])
+    capacidade = np.asarray(capacidade, dtype=float).reshape(-1)
+    return pesos, valores, capacidade[0] if len(capacidade) == 1 else capacidade
+
+
+def detectar_formato(arquivo):
+    """
+    Formato pela extensão (``.npz``, ``.csv``) ou, nos demais arquivos, pela
+    primeira linha: só o número de problemas (OR-Library) ou ``n capacidade``.
+    """
+    extensao = os.path.splitext(arquivo)[1].lower()
+    if extensao == ".npz":
+        return "npz"
+    if extensao == ".csv":
+        return "csv"
+    with open(arquivo) as f:
+        return "orlib" if len(f.readline().split()) == 1 else "texto"
+
+
+def carregar_instancia(arquivo, formato="auto", capacidade=None, problema=0, cache=False):
+    """
+    Lê uma instância da mochila.
+
+    Parâmetros:
+        arquivo (str): Caminho do arquivo.
+        formato (str): Um de ``FORMATOS`` (``"auto"`` usa ``detectar_formato``).
+        capacidade (float | array-like | None): Capacidade (obrigatória no CSV
+            sem a linha ``# capacidade``; ignorada nos demais formatos).
+        problema (int): Índice do problema em arquivos da OR-Library com vários.
+        cache (bool): Nos formatos de texto, grava e reutiliza uma cópia
+            ``.npz`` mapeável ao lado do arquivo (refeita se o original mudar).
+
+    Retorna:
+        tuple: (pesos, valores, capacidade); no ``.npz``, ``pesos`` e
+        ``valores`` são ``np.memmap`` somente leitura.
+    """
+    if formato not in FORMATOS:
+        raise ValueError(f"formato deve ser um de {FORMATOS}.")
+    if formato == "auto":
+        formato = detectar_formato(arquivo)
+    if formato == "npz":
+        return _instancia_de_arrays(_mapear_npz(arquivo), arquivo)
+
+    arquivo_cache = f"{arquivo}.instancia.npz" if problema == 0 else f"{arquivo}.{problema}.instancia.npz"
+    if cache and os.path.exists(arquivo_cache) and os.path.getmtime(arquivo_cache) >= os.path.getmtime(arquivo):
+        return _instancia_de_arrays(_mapear_npz(arquivo_cache), arquivo_cache)
+
+    if formato == "orlib":
+        instancia = _ler_orlib(arquivo, problema)
+    elif formato == "texto":
+        instancia = _ler_texto(arquivo)
+    else:
+        instancia = _ler_csv(arquivo, capacidade)
+    if cache:
+        temporario = f"{arquivo_cache}.{os.getpid()}.tmp.npz"
+        salvar_instancia(temporario, *instancia)
+        os.replace(temporario, arquivo_cache)
+    return instancia
+
+
+# ----------------------------
+# Instâncias sintéticas
+# ----------------------------
+def gerar_instancia(n_itens, tipo="nao_correlacionada", semente=None, amplitude=1000, fracao_capacidade=0.5,
+                    num_recursos=1):
+    """
+    Gera uma instância aleatória nas classes de Pisinger.
+
+    Com ``R = amplitude`` e pesos ``w ~ U{1, ..., R}``:
+
+    - ``"nao_correlacionada"``: ``v ~ U{1, ..., R}``;
+    - ``"fracamente_correlacionada"``: ``v ~ w + U{-R/10, ..., R/10}`` (mínimo 1);
+    - ``"fortemente_correlacionada"``: ``v = w + R/10``;
+    - ``"inversa"``: ``v ~ U{1, ..., R}`` e ``w = v + R/10``;
+    - ``"subconjunto"``: ``v = w``.
+
+    Com vários recursos, a correlação é com o peso médio do item.
+
+    Parâmetros:
+        n_itens (int): Número de itens.
+        tipo (str): Um de ``TIPOS``.
+        semente (int | np.random.Generator | None): Semente ou gerador aleatório.
+        amplitude (int): Maior peso (``R``).
+        fracao_capacidade (float): Capacidade como fração da soma dos pesos
+            (de cada recurso).
+        num_recursos (int): Número de recursos; com mais de um, ``pesos`` é uma
+            matriz ``(n_itens, num_recursos)``.
+
+    Retorna:
+        tuple: (pesos, valores, capacidade)
+    """
+    if tipo not in TIPOS:
+        raise ValueError(f"tipo deve ser um de {TIPOS}.")
+    rng = np.random.default_rng(semente)
+    forma = (n_itens,) if num_recursos == 1 else (n_itens, num_recursos)
+    pesos = rng.integers(1, amplitude + 1, forma).astype(float)
+    referencia = pesos if num_recursos == 1 else pesos.mean(axis=1)
+    decimo = amplitude // 10
+
+    if tipo == "nao_correlacionada":
+        valores = rng.integers(1, amplitude + 1, n_itens).astype(float)
+    elif tipo == "fracamente_correlacionada":
+        valores = np.maximum(referencia + rng.integers(-decimo, decimo + 1, n_itens), 1.0)
+    elif tipo == "fortemente_correlacionada":
+        valores = referencia + decimo
+    elif tipo == "inversa":
+        valores = rng.integers(1, amplitude + 1, n_itens).astype(float)
+        # Com vários recursos, desloca os pesos de cada item para que a média seja v + R/10
+        alvo = valores + decimo
+        pesos = alvo if num_recursos == 1 else np.maximum(pesos + (alvo - referencia)[:, np.newaxis], 1.0)
+    else:
+        valores = referencia.copy()
+
+    capacidade = np.floor(fracao_capacidade * pesos.sum(axis=0))
+    return pesos, valores, capacidade
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m otimizacao.instancias", description=__doc__.split("\n\n")[0])
+    subcomandos = parser.add_subparsers(dest="comando", required=True)
+
+    gerar = subcomandos.add_parser("gerar", help="Gera uma instância sintética em .npz.")
+    gerar.add_argument("saida")
+    gerar.add_argument("--itens", type=int, required=True)
+    gerar.add_argument("--tipo", choices=TIPOS, default="nao_correlacionada")
+    gerar.add_argument("--semente", type=int, default=0)
+    gerar.add_argument("--amplitude", type=int, default=1000)
+    gerar.add_argument("--fracao-capacidade", type=float, default=0.5)
+    gerar.add_argument("--recursos", type=int, default=1)
+
+    converter = subcomandos.add_parser("converter", help="Converte OR-Library, texto ou CSV para .npz.")
+    converter.add_argument("entrada")
+    converter.add_argument("saida")
+    converter.add_argument("--formato", choices=FORMATOS, default="auto")
+    converter.add_argument("--capacidade", type=float, nargs="+", default=None)
+    converter.add_argument("--problema", type=int, default=0)
+
+    args = parser.parse_args(argv)
+    if args.comando == "gerar":
+        instancia = gerar_instancia(args.itens, args.tipo, semente=args.semente, amplitude=args.amplitude,
+                                    fracao_capacidade=args.fracao_capacidade, num_recursos=args.recursos)
+    else:
+        instancia = carregar_instancia(args.entrada, args.formato, capacidade=args.capacidade,
+                                       problema=args.problema)
+    salvar_instancia(args.saida, *instancia)
+    pesos, _, capacidade = instancia
+    print(f"{args.saida}: {len(pesos)} itens, capacidade {capacidade}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
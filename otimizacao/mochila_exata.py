@@ -0,0 +1,179 @@
+"""
+Solvers exatos do problema da mochila 0/1, usados para validar o GA
+(Passo 6.3: comparar a solução obtida com a solução exata).
+
+- ``mochila_programacao_dinamica``: programação dinâmica com um único vetor
+  1D de ``capacidade + 1`` posições, atualizado item a item. A reconstrução
+  dos itens usa um bitset compactado (``np.packbits``) com uma linha por item,
+  8 vezes menor que uma tabela booleana e 64 vezes menor que a tabela 2D de
+  valores.
+- ``mochila_branch_and_bound``: busca em profundidade com limitante da
+  relaxação fracionária (Dantzig), indicada para capacidades grandes ou pesos
+  não inteiros.
+"""
+import numpy as np
+
+# Tamanho máximo (em bytes) do bitset de reconstrução aceito pelo modo "auto"
+LIMITE_MEMORIA_PD = 256 * 1024 * 1024
+
+
+def _validar(pesos, valores, capacidade):
+    pesos = np.asarray(pesos, dtype=float)
+    valores = np.asarray(valores, dtype=float)
+    if pesos.shape != valores.shape or pesos.ndim != 1:
+        raise ValueError("Pesos e valores devem ser vetores 1D do mesmo tamanho.")
+    if np.any(pesos < 0) or capacidade < 0:
+        raise ValueError("Pesos e capacidade devem ser não negativos.")
+    return pesos, valores
+
+
+def mochila_programacao_dinamica(pesos, valores, capacidade):
+    """
+    Resolve a mochila 0/1 por programação dinâmica (pesos inteiros).
+
+    Parâmetros:
+        pesos (array-like): Pesos inteiros dos itens.
+        valores (array-like): Valores dos itens.
+        capacidade (int): Capacidade da mochila.
+
+    Retorna:
+        tuple: (escolha, valor_otimo), em que ``escolha`` é um vetor 0/1 na
+        ordem original dos itens.
+    """
+    pesos, valores = _validar(pesos, valores, capacidade)
+    if np.any(pesos != np.floor(pesos)):
+        raise ValueError("A programação dinâmica exige pesos inteiros; use mochila_branch_and_bound.")
+    capacidade = int(capacidade)
+    pesos_int = pesos.astype(np.int64)
+    n_itens = len(pesos)
+
+    melhor = np.zeros(capacidade + 1)
+    escolhido = np.zeros(capacidade + 1, dtype=bool)
+    bits = np.zeros((n_itens, (capacidade + 8) // 8), dtype=np.uint8)
+
+    for i in range(n_itens):
+        w, v = pesos_int[i], valores[i]
+        if w > capacidade or v <= 0:
+            continue
+        # O lado direito usa os valores da linha anterior, preservando a semântica 0/1
+        candidato = melhor[:capacidade + 1 - w] + v
+        escolhido[:] = False
+        escolhido[w:] = candidato > melhor[w:]
+        np.maximum(melhor[w:], candidato, out=melhor[w:])
+        bits[i] = np.packbits(escolhido)
+
+    # Reconstrução: percorre os itens de trás para frente consultando o bitset
+    escolha = np.zeros(n_itens, dtype=int)
+    c = capacidade
+    for i in range(n_itens - 1, -1, -1):
+        if (bits[i, c >> 3] >> (7 - (c & 7))) & 1:
+            escolha[i] = 1
+            c -= pesos_int[i]
+    return escolha, melhor[capacidade]
+
+
+def mochila_branch_and_bound(pesos, valores, capacidade, max_nos=None):
+    """
+    Resolve a mochila 0/1 por branch-and-bound com limitante fracionário.
+
+    Os itens são ordenados por valor/peso; o limitante de cada nó é a solução
+    da relaxação fracionária dos itens restantes, obtida com somas acumuladas
+    e uma busca binária (O(log n) por nó).
+
+    Parâmetros:
+        pesos (array-like): Pesos dos itens (podem ser reais).
+        valores (array-like): Valores dos itens.
+        capacidade (float): Capacidade da mochila.
+        max_nos (int | None): Limite de nós explorados; ao atingi-lo, retorna a
+            melhor solução encontrada até então (não necessariamente ótima).
+
+    Retorna:
+        tuple: (escolha, valor_otimo), em que ``escolha`` é um vetor 0/1 na
+        ordem original dos itens.
+    """
+    pesos, valores = _validar(pesos, valores, capacidade)
+    n_itens = len(pesos)
+
+    # Itens de valor não positivo nunca melhoram a solução
+    uteis = np.flatnonzero((valores > 0) & (pesos <= capacidade))
+    with np.errstate(divide="ignore"):
+        razao = np.where(pesos[uteis] > 0, valores[uteis] / pesos[uteis], np.inf)
+    ordem = uteis[np.argsort(-razao, kind="stable")]
+    w = pesos[ordem]
+    v = valores[ordem]
+    n = len(ordem)
+    peso_acumulado = np.concatenate([[0.0], np.cumsum(w)])
+    valor_acumulado = np.concatenate([[0.0], np.cumsum(v)])
+
+    def limitante(k, peso, valor):
+        # Itens k..j-1 cabem inteiros; o item j entra fracionado
+        restante = capacidade - peso
+        j = int(np.searchsorted(peso_acumulado, peso_acumulado[k] + restante, side="right")) - 1
+        limite = valor + valor_acumulado[j] - valor_acumulado[k]
+        if j < n:
+            limite += (restante - (peso_acumulado[j] - peso_acumulado[k])) * v[j] / w[j]
+        return limite
+
+    # Solução inicial gulosa
+    melhor_valor, melhor_escolhas, peso = 0.0, 0, 0.0
+    for k in range(n):
+        if peso + w[k] <= capacidade:
+            peso += w[k]
+            melhor_valor += v[k]
+            melhor_escolhas |= 1 << k
+
+    # Busca em profundidade; as escolhas de cada nó são um bitmask (int)
+    pilha = [(0, 0.0, 0.0, 0)]
+    nos = 0
+    while pilha:
+        k, peso, valor, escolhas = pilha.pop()
+        nos += 1
+        if max_nos is not None and nos > max_nos:
+            break
+        if k == n:
+            if valor > melhor_valor:
+                melhor_valor, melhor_escolhas = valor, escolhas
+            continue
+        if limitante(k, peso, valor) <= melhor_valor:
+            continue
+        # Empilha "sem o item" antes para explorar primeiro o ramo "com o item"
+        pilha.append((k + 1, peso, valor, escolhas))
+        if peso + w[k] <= capacidade:
+            pilha.append((k + 1, peso + w[k], valor + v[k], escolhas | (1 << k)))
+
+    escolha = np.zeros(n_itens, dtype=int)
+    for k in range(n):
+        if (melhor_escolhas >> k) & 1:
+            escolha[ordem[k]] = 1
+    return escolha, melhor_valor
+
+
+def resolver_exato(pesos, valores, capacidade, metodo="auto"):
+    """
+    Resolve a mochila 0/1 de forma exata.
+
+    Parâmetros:
+        metodo (str): ``"pd"`` (programação dinâmica), ``"bb"`` (branch-and-bound)
+            ou ``"auto"``: programação dinâmica quando os pesos são inteiros e o
+            bitset cabe em ``LIMITE_MEMORIA_PD``; caso contrário, branch-and-bound.
+
+    Retorna:
+        tuple: (escolha, valor_otimo)
+    """
+    if metodo == "auto":
+        pesos_arr = np.asarray(pesos, dtype=float)
+        inteiros = np.all(pesos_arr == np.floor(pesos_arr))
+        memoria = len(pesos_arr) * (int(capacidade) + 8) // 8
+        metodo = "pd" if inteiros and memoria <= LIMITE_MEMORIA_PD else "bb"
+    if metodo == "pd":
+        return mochila_programacao_dinamica(pesos, valores, capacidade)
+    if metodo == "bb":
+        return mochila_branch_and_bound(pesos, valores, capacidade)
+    raise ValueError(f"Método exato desconhecido: {metodo!r}. Use 'auto', 'pd' ou 'bb'.")
+
+
+def gap_otimalidade(valor_obtido, valor_otimo):
+    """Diferença relativa entre o valor obtido e o ótimo (0 = solução ótima)."""
+    if valor_otimo == 0:
+        return 0.0
+    return (valor_otimo - valor_obtido) / valor_otimo
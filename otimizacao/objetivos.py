@@ -0,0 +1,176 @@
+"""
+Funções objetivo vetorizadas usadas pelas meta-heurísticas.
+
+Cada função recebe uma matriz de pontos com formato ``(n_pontos, dim)`` e
+devolve um vetor com os ``n_pontos`` valores de fitness calculados em uma
+única chamada NumPy. As versões escalares antigas (``funcao_rastrigin`` e
+``funcao_schaffer_np``) continuam disponíveis para compatibilidade.
+"""
+import numpy as np
+
+
+def vetorizada(funcao):
+    """
+    Marca uma função objetivo como capaz de avaliar uma população inteira.
+
+    Os otimizadores verificam o atributo ``vetorizada`` para decidir se
+    chamam a função uma única vez com a matriz de pontos ou uma vez por ponto.
+    """
+    funcao.vetorizada = True
+    return funcao
+
+
+def como_matriz(pontos):
+    """
+    Converte a entrada para uma matriz ``float`` de formato ``(n_pontos, dim)``.
+
+    Um vetor 1D é interpretado como um único ponto.
+    """
+    pontos = np.asarray(pontos, dtype=float)
+    if pontos.ndim == 1:
+        pontos = pontos[np.newaxis, :]
+    if pontos.ndim != 2:
+        raise ValueError("A entrada deve ter formato (n_pontos, dim).")
+    return pontos
+
+
+def avaliar_populacao(funcao, pontos):
+    """
+    Avalia a função objetivo em todas as linhas de ``pontos``.
+
+    Parâmetros:
+        funcao (callable): Função objetivo. Se estiver marcada com
+            ``@vetorizada`` é chamada uma única vez; caso contrário é chamada
+            ponto a ponto.
+        pontos (array-like): Matriz ``(n_pontos, dim)``.
+
+    Retorna:
+        np.ndarray: Vetor com ``n_pontos`` valores de fitness.
+    """
+    pontos = como_matriz(pontos)
+    if getattr(funcao, "vetorizada", False):
+        return np.asarray(funcao(pontos), dtype=float).reshape(len(pontos))
+    return np.array([funcao(p) for p in pontos], dtype=float)
+
+
+@vetorizada
+def rastrigin(pontos):
+    """
+    Função de Rastrigin para qualquer dimensão.
+
+    f(x) = 10 * d + soma(x_i^2 - 10 * cos(2 * pi * x_i))
+
+    Parâmetros:
+        pontos (array-like): Matriz ``(n_pontos, dim)``.
+
+    Retorna:
+        np.ndarray: Vetor com ``n_pontos`` valores.
+    """
+    pontos = como_matriz(pontos)
+    termos = pontos * pontos - 10.0 * np.cos(2.0 * np.pi * pontos)
+    return 10.0 * pontos.shape[1] + termos.sum(axis=1)
+
+
+@vetorizada
+def schaffer_n2(pontos):
+    """
+    Função de Schaffer N. 2 (apenas duas dimensões).
+
+    f(x, y) = 0.5 + (sin^2(x^2 - y^2) - 0.5) / (1 + 0.001 * (x^2 + y^2))^2
+
+    Parâmetros:
+        pontos (array-like): Matriz ``(n_pontos, 2)``.
+
+    Retorna:
+        np.ndarray: Vetor com ``n_pontos`` valores.
+    """
+    pontos = como_matriz(pontos)
+    if pontos.shape[1] != 2:
+        raise ValueError("A função de Schaffer N2 exige pontos com exatamente duas coordenadas [x, y].")
+    x2 = pontos[:, 0] ** 2
+    y2 = pontos[:, 1] ** 2
+    numerador = np.sin(x2 - y2) ** 2 - 0.5
+    denominador = (1.0 + 0.001 * (x2 + y2)) ** 2
+    return 0.5 + numerador / denominador
+
+
+@vetorizada
+def sphere(pontos):
+    """Função esfera: f(x) = soma(x_i^2)."""
+    pontos = como_matriz(pontos)
+    return np.einsum("ij,ij->i", pontos, pontos)
+
+
+@vetorizada
+def rosenbrock(pontos):
+    """Função de Rosenbrock: f(x) = soma(100 * (x_{i+1} - x_i^2)^2 + (1 - x_i)^2)."""
+    pontos = como_matriz(pontos)
+    atual, proximo = pontos[:, :-1], pontos[:, 1:]
+    return (100.0 * (proximo - atual ** 2) ** 2 + (1.0 - atual) ** 2).sum(axis=1)
+
+
+@vetorizada
+def ackley(pontos):
+    """Função de Ackley (a = 20, b = 0.2, c = 2 * pi)."""
+    pontos = como_matriz(pontos)
+    dim = pontos.shape[1]
+    quadrados = np.einsum("ij,ij->i", pontos, pontos) / dim
+    cossenos = np.cos(2.0 * np.pi * pontos).sum(axis=1) / dim
+    return -20.0 * np.exp(-0.2 * np.sqrt(quadrados)) - np.exp(cossenos) + 20.0 + np.e
+
+
+@vetorizada
+def griewank(pontos):
+    """Função de Griewank: f(x) = 1 + soma(x_i^2) / 4000 - prod(cos(x_i / sqrt(i)))."""
+    pontos = como_matriz(pontos)
+    raizes = np.sqrt(np.arange(1, pontos.shape[1] + 1))
+    return 1.0 + np.einsum("ij,ij->i", pontos, pontos) / 4000.0 - np.cos(pontos / raizes).prod(axis=1)
+
+
+# Domínio usual de cada função de teste: (função, limites, dimensão fixa ou None)
+FUNCOES_TESTE = {
+    "rastrigin": (rastrigin, (-5.12, 5.12), None),
+    "schaffer_n2": (schaffer_n2, (-100.0, 100.0), 2),
+    "sphere": (sphere, (-5.12, 5.12), None),
+    "rosenbrock": (rosenbrock, (-5.0, 10.0), None),
+    "ackley": (ackley, (-32.768, 32.768), None),
+    "griewank": (griewank, (-600.0, 600.0), None),
+}
+
+
+# ----------------------------
+# Versões escalares (compatibilidade)
+# ----------------------------
+def funcao_rastrigin(lista_x):
+    """
+    Calcula o valor da função de Rastrigin para uma lista de entradas.
+
+    Parâmetros:
+        lista_x (list of float): Lista de valores de entrada para a função de Rastrigin.
+
+    Retorna:
+        float: O valor da função de Rastrigin calculado para a entrada fornecida.
+
+    Observações:
+        - Se a lista estiver vazia, a função retorna -1.
+    """
+    if not isinstance(lista_x, list):
+        raise TypeError("A entrada deve ser uma lista de números.")
+
+    if len(lista_x) == 0:
+        return -1
+
+    for x in lista_x:
+        if not isinstance(x, (int, float)):
+            raise ValueError("Todos os elementos da lista devem ser números.")
+
+    return float(rastrigin(lista_x)[0])
+
+
+def funcao_schaffer_np(lista_x):
+    """
+    Calcula o valor da função de Schaffer N. 2 para um único ponto [x, y].
+    """
+    if len(lista_x) != 2:
+        raise ValueError("A entrada deve ter exatamente dois elementos [x, y].")
+    return float(schaffer_n2(lista_x)[0])
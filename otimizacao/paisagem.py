@@ -0,0 +1,117 @@
+"""
+Grades de superfície (paisagens) de funções de duas variáveis, com cache em disco.
+
+``grade_superficie`` avalia a função em uma grade ``resolucao x resolucao``
+em blocos de linhas (cada bloco é uma única chamada vetorizada), escrevendo
+direto em um ``.npy`` mapeado em memória. O arquivo fica em cache, com nome
+derivado da função, dos limites, da resolução e do ``dtype``; chamadas
+seguintes (outros quadros, outras execuções, outros processos) apenas abrem o
+arquivo com ``mmap_mode="r"``. Assim uma grade 4096 x 4096 não precisa caber
+na memória nem ser recalculada.
+
+A pasta do cache é ``$OTIMIZACAO_CACHE`` ou ``~/.cache/otimizacao/paisagens``.
+A chave inclui o valor da função em alguns pontos de teste, de modo que
+alterar a implementação da função invalida o cache.
+"""
+import hashlib
+import os
+
+import numpy as np
+
+from otimizacao.objetivos import avaliar_populacao
+
+PONTOS_POR_BLOCO = 1 << 20
+
+
+def pasta_cache_padrao():
+    return os.environ.get("OTIMIZACAO_CACHE",
+                          os.path.join(os.path.expanduser("~"), ".cache", "otimizacao", "paisagens"))
+
+
+def _nome_funcao(funcao):
+    nome = getattr(funcao, "__qualname__", type(funcao).__qualname__)
+    return f"{getattr(funcao, '__module__', '')}.{nome}"
+
+
+def _cacheavel(funcao):
+    # Funções locais e lambdas podem ter o mesmo nome e comportamentos diferentes
+    return "<" not in _nome_funcao(funcao)
+
+
+def chave_grade(funcao, limites, resolucao, dtype):
+    """Identificador da grade: nome da função, limites, resolução, dtype e valores de teste."""
+    inferior, superior = float(limites[0]), float(limites[1])
+    teste = np.array([[inferior, inferior], [superior, superior], [inferior, superior],
+                      [(inferior + superior) / 2, (inferior + superior) / 3]])
+    resumo = hashlib.sha1()
+    resumo.update(repr((_nome_funcao(funcao), inferior, superior, int(resolucao), np.dtype(dtype).str)).encode())
+    resumo.update(avaliar_populacao(funcao, teste).tobytes())
+    return resumo.hexdigest()[:16]
+
+
+def avaliar_grade(funcao, limites, resolucao, saida=None, dtype=np.float64, pontos_por_bloco=PONTOS_POR_BLOCO):
+    """
+    Avalia ``funcao`` na grade em blocos de linhas.
+
+    Parâmetros:
+        funcao (callable): Função objetivo de duas variáveis.
+        limites (tuple): Limites (inferior, superior) dos eixos x e y.
+        resolucao (int): Pontos por eixo.
+        saida (np.ndarray | None): Matriz ``(resolucao, resolucao)`` a preencher
+            (ex.: um ``np.memmap``); se ``None``, uma nova é alocada.
+        dtype: Tipo da matriz alocada.
+        pontos_por_bloco (int): Pontos avaliados por chamada.
+
+    Retorna:
+        np.ndarray: ``Z[i, j] = f(x[j], x[i])``, a mesma convenção de
+        ``np.meshgrid(x, x)``.
+    """
+    x = np.linspace(limites[0], limites[1], resolucao)
+    if saida is None:
+        saida = np.empty((resolucao, resolucao), dtype=dtype)
+    linhas_por_bloco = max(1, pontos_por_bloco // resolucao)
+    pontos = np.empty((linhas_por_bloco * resolucao, 2))
+    pontos[:, 0] = np.tile(x, linhas_por_bloco)
+
+    for inicio in range(0, resolucao, linhas_por_bloco):
+        fim = min(inicio + linhas_por_bloco, resolucao)
+        bloco = pontos[:(fim - inicio) * resolucao]
+        bloco[:, 1] = np.repeat(x[inicio:fim], resolucao)
+        saida[inicio:fim] = avaliar_populacao(funcao, bloco).reshape(fim - inicio, resolucao)
+    return saida
+
+
+def grade_superficie(funcao, limites, resolucao=200, usar_cache=True, pasta_cache=None, dtype=np.float64):
+    """
+    Grade da superfície de ``funcao``, reaproveitada do cache em disco quando possível.
+
+    Parâmetros:
+        funcao (callable): Função objetivo de duas variáveis.
+        limites (tuple): Limites (inferior, superior) dos eixos x e y.
+        resolucao (int): Pontos por eixo.
+        usar_cache (bool): Se falso, a grade é calculada em memória. Lambdas e
+            funções locais nunca usam o cache.
+        pasta_cache (str | None): Pasta do cache (padrão: ``pasta_cache_padrao()``).
+        dtype: ``np.float32`` reduz pela metade o arquivo de grades grandes.
+
+    Retorna:
+        tuple: ``(x, Z)``, com o eixo ``x`` (usado nos dois eixos) e a matriz
+        ``Z`` (somente leitura e mapeada em memória quando vem do cache).
+    """
+    x = np.linspace(limites[0], limites[1], resolucao)
+    if not (usar_cache and _cacheavel(funcao)):
+        return x, avaliar_grade(funcao, limites, resolucao, dtype=dtype)
+
+    pasta = pasta_cache or pasta_cache_padrao()
+    os.makedirs(pasta, exist_ok=True)
+    nome = getattr(funcao, "__name__", type(funcao).__name__)
+    arquivo = os.path.join(pasta, f"{nome}-{resolucao}-{chave_grade(funcao, limites, resolucao, dtype)}.npy")
+
+    if not os.path.exists(arquivo):
+        temporario = f"{arquivo}.{os.getpid()}.tmp"
+        saida = np.lib.format.open_memmap(temporario, mode="w+", dtype=dtype, shape=(resolucao, resolucao))
+        avaliar_grade(funcao, limites, resolucao, saida=saida)
+        saida.flush()
+        del saida
+        os.replace(temporario, arquivo)
+    return x, np.load(arquivo, mmap_mode="r")
@@ -0,0 +1,150 @@
+"""
+Critérios de parada antecipada compartilhados pelos otimizadores.
+
+``pso``, ``ABC.optimize`` e ``algoritmo_genetico`` aceitam um parâmetro
+``parada`` e chamam ``parada.verificar`` uma vez por geração; a execução
+termina na primeira geração em que algum critério é atingido. O critério que
+disparou fica em ``parada.motivo`` (e a geração em ``parada.geracao``):
+
+    parada = CriteriosParada(fitness_alvo=1e-8, estagnacao=50, max_avaliacoes=100_000)
+    pso(rastrigin, dimensao=10, num_iteracoes=10_000, parada=parada)
+    print(parada.motivo, parada.geracao)
+
+Os critérios são verificados ao fim da geração, então ``max_avaliacoes`` e
+``tempo_maximo`` podem ser ultrapassados em até uma geração.
+
+Com ``checkpoint``, o estado dos critérios (avaliações e tempo já gastos,
+gerações sem melhora e a janela da tolerância) é gravado junto com o do
+otimizador e restaurado ao retomar, de modo que os orçamentos valem para a
+execução inteira e não para cada trecho.
+"""
+import time
+from collections import deque
+
+import numpy as np
+
+from otimizacao.telemetria import diversidade
+
+MOTIVOS = ("fitness_alvo", "estagnacao", "tolerancia_relativa", "diversidade", "max_avaliacoes", "tempo_maximo")
+
+
+class CriteriosParada:
+    """
+    Conjunto de critérios de parada; os que ficarem como ``None`` são ignorados.
+
+    Parâmetros:
+        fitness_alvo (float | None): Para quando o melhor fitness atinge o alvo
+            (``<=`` na minimização, ``>=`` na maximização).
+        estagnacao (int | None): Para após N gerações seguidas sem melhora do
+            melhor fitness.
+        tolerancia_relativa (float | None): Para quando a melhora relativa do
+            melhor fitness nas últimas ``janela_tolerancia`` gerações é menor
+            que a tolerância.
+        janela_tolerancia (int): Janela usada por ``tolerancia_relativa``.
+        diversidade_minima (float | None): Para quando a distância média das
+            posições ao centróide (``telemetria.diversidade``) cai abaixo do valor.
+        max_avaliacoes (int | None): Orçamento de avaliações da função objetivo.
+        tempo_maximo (float | None): Orçamento de tempo de parede, em segundos.
+    """
+
+    def __init__(self, fitness_alvo=None, estagnacao=None, tolerancia_relativa=None, janela_tolerancia=10,
+                 diversidade_minima=None, max_avaliacoes=None, tempo_maximo=None):
+        self.fitness_alvo = fitness_alvo
+        self.estagnacao = estagnacao
+        self.tolerancia_relativa = tolerancia_relativa
+        self.janela_tolerancia = janela_tolerancia
+        self.diversidade_minima = diversidade_minima
+        self.max_avaliacoes = max_avaliacoes
+        self.tempo_maximo = tempo_maximo
+        self.iniciar()
+
+    def iniciar(self, avaliacoes_iniciais=0, maximizar=False):
+        """Zera o estado; chamado pelo otimizador antes da primeira geração."""
+        self.maximizar = maximizar
+        self.motivo = None
+        self.geracao = None
+        self.num_avaliacoes = avaliacoes_iniciais
+        self._inicio = time.perf_counter()
+        self._melhor = None
+        self._sem_melhora = 0
+        self._janela = deque(maxlen=self.janela_tolerancia + 1)
+
+    def estado(self):
+        """Estado acumulado dos critérios (para ``Checkpoint.salvar``)."""
+        return {
+            "parada_num_avaliacoes": self.num_avaliacoes,
+            "parada_tempo_decorrido": time.perf_counter() - self._inicio,
+            "parada_melhor": np.nan if self._melhor is None else self._melhor,
+            "parada_sem_melhora": self._sem_melhora,
+            "parada_janela": np.array(self._janela, dtype=float),
+            "parada_motivo": "" if self.motivo is None else self.motivo,
+            "parada_geracao": -1 if self.geracao is None else self.geracao,
+        }
+
+    def restaurar(self, estado):
+        """
+        Continua a partir do estado gravado por ``estado``; chamado depois de
+        ``iniciar``. Um checkpoint gravado sem critérios de parada é ignorado.
+        Se a execução gravada já tinha parado, ``motivo`` e ``geracao`` voltam
+        preenchidos e o otimizador devolve o resultado sem novas gerações.
+        """
+        if "parada_num_avaliacoes" not in estado:
+            return
+        self.num_avaliacoes = int(estado["parada_num_avaliacoes"])
+        self._inicio = time.perf_counter() - float(estado["parada_tempo_decorrido"])
+        melhor = float(estado["parada_melhor"])
+        self._melhor = None if np.isnan(melhor) else melhor
+        self._sem_melhora = int(estado["parada_sem_melhora"])
+        self._janela.extend(estado["parada_janela"].tolist())
+        if "parada_motivo" in estado and str(estado["parada_motivo"]):
+            self.motivo = str(estado["parada_motivo"])
+            self.geracao = int(estado["parada_geracao"])
+
+    def _melhorou(self, melhor):
+        if self._melhor is None:
+            return True
+        return melhor > self._melhor if self.maximizar else melhor < self._melhor
+
+    def verificar(self, geracao, melhor, posicoes, avaliacoes):
+        """
+        Atualiza o estado com a geração concluída e testa os critérios.
+
+        Parâmetros:
+            geracao (int): Número de gerações concluídas.
+            melhor (float): Melhor fitness encontrado até agora.
+            posicoes (np.ndarray): População atual (usada só pela diversidade).
+            avaliacoes (int): Avaliações feitas nesta geração.
+
+        Retorna:
+            bool: Verdadeiro se algum critério foi atingido (ver ``motivo``).
+        """
+        self.num_avaliacoes += avaliacoes
+        melhor = float(melhor)
+        if self._melhorou(melhor):
+            self._melhor = melhor
+            self._sem_melhora = 0
+        else:
+            self._sem_melhora += 1
+        self._janela.append(melhor)
+
+        if self.fitness_alvo is not None and (melhor >= self.fitness_alvo if self.maximizar
+                                              else melhor <= self.fitness_alvo):
+            return self._parar("fitness_alvo", geracao)
+        if self.estagnacao is not None and self._sem_melhora >= self.estagnacao:
+            return self._parar("estagnacao", geracao)
+        if self.tolerancia_relativa is not None and len(self._janela) == self._janela.maxlen:
+            anterior = self._janela[0]
+            if abs(anterior - melhor) <= self.tolerancia_relativa * max(abs(anterior), 1e-300):
+                return self._parar("tolerancia_relativa", geracao)
+        if self.diversidade_minima is not None and diversidade(posicoes) < self.diversidade_minima:
+            return self._parar("diversidade", geracao)
+        if self.max_avaliacoes is not None and self.num_avaliacoes >= self.max_avaliacoes:
+            return self._parar("max_avaliacoes", geracao)
+        if self.tempo_maximo is not None and time.perf_counter() - self._inicio >= self.tempo_maximo:
+            return self._parar("tempo_maximo", geracao)
+        return False
+
+    def _parar(self, motivo, geracao):
+        self.motivo = motivo
+        self.geracao = geracao
+        return True
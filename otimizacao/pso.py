@@ -0,0 +1,357 @@
+"""
+Algoritmo PSO - Particle Swarm Optimization (versão vetorizada).
+
+Todo o enxame é atualizado com uma única expressão de arrays por geração:
+os coeficientes aleatórios r1 e r2 são sorteados como matrizes
+``(num_particulas, dimensao)`` a partir de um ``np.random.Generator`` e os
+melhores pessoais são atualizados por máscaras booleanas. Com
+``nucleo="numba"`` a geração inteira roda em um laço compilado
+(ver ``otimizacao.compilado``). Além do gbest, ``topologia`` seleciona
+vizinhanças lbest (ver ``otimizacao.topologias``), e ``substituto`` faz a
+triagem das partículas antes da função objetivo (ver ``otimizacao.substituto``).
+"""
+import numpy as np
+
+from otimizacao.checkpoint import conferir_forma
+from otimizacao.compilado import codigo_objetivo, passo_pso
+from otimizacao.objetivos import avaliar_populacao
+from otimizacao.telemetria import CRONOMETRO_NULO, escolher_cronometro, metricas_geracao
+from otimizacao.topologias import criar_topologia
+
+
+class EnxamePSO:
+    """
+    Estado de um enxame avançado uma geração por ``passo()``.
+
+    ``pso`` usa esta classe no seu laço; ela também serve para quem precisa
+    intercalar outras operações entre as gerações (ex.: migração no modelo de
+    ilhas de ``otimizacao.ilhas``).
+
+    Parâmetros:
+        funcao_custo, dimensao, num_particulas, w, c1, c2, limites, semente, nucleo, topologia, substituto:
+            Como em ``pso``.
+        inicializar (bool): Sorteia e avalia o enxame inicial. Use ``False``
+            para restaurar um estado salvo com ``restaurar``.
+    """
+
+    def __init__(self, funcao_custo, dimensao=2, num_particulas=100, w=0.5, c1=1, c2=2, limites=(-100, 100),
+                 semente=None, inicializar=True, nucleo="numpy", topologia="gbest", substituto=None):
+        self.funcao_custo = funcao_custo
+        self.dimensao = dimensao
+        self.num_particulas = num_particulas
+        self.w, self.c1, self.c2 = w, c1, c2
+        self.limite_inferior, self.limite_superior = limites
+        self.rng = np.random.default_rng(semente)
+        self.fitness_atual = None
+        self.topologia = criar_topologia(topologia)
+        self._melhorou = True
+        self.substituto = substituto
+        if substituto is not None and nucleo == "numba":
+            raise ValueError("O núcleo compilado avalia todas as partículas; não use nucleo='numba' com substituto.")
+        self._codigo = codigo_objetivo(funcao_custo, nucleo) if substituto is None else None
+        if self._codigo is not None:
+            forma = (num_particulas, dimensao)
+            self._r1, self._r2, self._fitness = np.empty(forma), np.empty(forma), np.empty(num_particulas)
+        if inicializar:
+            self.inicializar()
+
+    def inicializar(self):
+        self.particulas = self.rng.uniform(self.limite_inferior, self.limite_superior,
+                                           (self.num_particulas, self.dimensao))
+        self.velocidades = np.zeros((self.num_particulas, self.dimensao))
+        self.melhores_posicoes = self.particulas.copy()
+        if self.substituto is None:
+            self.melhores_fitness = avaliar_populacao(self.funcao_custo, self.particulas)
+        else:
+            self.melhores_fitness = self.substituto.avaliar_reais(self.funcao_custo, self.particulas)
+        indice_melhor = np.argmin(self.melhores_fitness)
+        self.melhor_global = self.melhores_posicoes[indice_melhor].copy()
+        self.melhor_fitness_global = self.melhores_fitness[indice_melhor]
+
+    def estado(self):
+        """Arrays que descrevem o enxame (para ``Checkpoint.salvar``)."""
+        estado = {"particulas": self.particulas, "velocidades": self.velocidades,
+                  "melhores_posicoes": self.melhores_posicoes, "melhores_fitness": self.melhores_fitness,
+                  "melhor_global": self.melhor_global, "melhor_fitness_global": self.melhor_fitness_global,
+                  "melhorou": self._melhorou}
+        if hasattr(self.topologia, "estado"):
+            estado.update(self.topologia.estado())
+        if self.substituto is not None:
+            estado.update(self.substituto.estado())
+        return estado
+
+    def restaurar(self, estado):
+        conferir_forma(estado, "particulas", (self.num_particulas, self.dimensao))
+        self.particulas = estado["particulas"]
+        self.velocidades = estado["velocidades"]
+        self.melhores_posicoes = estado["melhores_posicoes"]
+        self.melhores_fitness = estado["melhores_fitness"]
+        self.melhor_global = estado["melhor_global"]
+        self.melhor_fitness_global = estado["melhor_fitness_global"][()]
+        # A topologia aleatória sorteia novos vizinhos quando a última geração não melhorou o melhor global
+        self._melhorou = bool(estado["melhorou"])
+        if hasattr(self.topologia, "restaurar"):
+            self.topologia.restaurar(estado)
+        if self.substituto is not None:
+            self.substituto.restaurar(estado)
+
+    def passo(self, cronometro=CRONOMETRO_NULO):
+        """
+        Executa uma geração e retorna o fitness atual das partículas.
+
+        No núcleo compilado o vetor retornado é um buffer reescrito a cada geração.
+        """
+        if self._codigo is not None:
+            return self._passo_compilado(cronometro)
+        particulas, velocidades = self.particulas, self.velocidades
+        r1 = self.rng.random((self.num_particulas, self.dimensao))
+        r2 = self.rng.random((self.num_particulas, self.dimensao))
+
+        # v = w * v + c1 * r1 * (pbest - x) + c2 * r2 * (lider - x), sem laços em Python
+        velocidades *= self.w
+        velocidades += self.c1 * r1 * (self.melhores_posicoes - particulas)
+        velocidades += self.c2 * r2 * (self.lideres() - particulas)
+        particulas += velocidades
+        np.clip(particulas, self.limite_inferior, self.limite_superior, out=particulas)
+        cronometro.marcar("atualizacao")
+
+        if self.substituto is None:
+            fitness_atual = avaliar_populacao(self.funcao_custo, particulas)
+        else:
+            # Partículas não avaliadas recebem um valor que não melhora o melhor pessoal
+            fitness_atual = self.substituto.avaliar(self.funcao_custo, particulas, self.melhores_fitness)
+        cronometro.marcar("avaliacao")
+        self.atualizar_melhores(fitness_atual)
+        cronometro.marcar("melhores")
+        self.fitness_atual = fitness_atual
+        return fitness_atual
+
+    def lideres(self):
+        """Posição seguida pelas partículas: o melhor global (gbest) ou o líder da vizinhança de cada uma."""
+        if self.topologia is None:
+            return self.melhor_global
+        indices = self.topologia.lideres(self.particulas, self.melhores_fitness, self.rng, self._melhorou)
+        return self.melhores_posicoes[indices]
+
+    def _passo_compilado(self, cronometro):
+        # Mesmos sorteios, na mesma ordem, do caminho NumPy
+        self.rng.random(out=self._r1)
+        self.rng.random(out=self._r2)
+        lideres = np.broadcast_to(self.lideres(), self.particulas.shape)
+        passo_pso(self._codigo, self.particulas, self.velocidades, self.melhores_posicoes, self.melhores_fitness,
+                  lideres, self._r1, self._r2, float(self.w), float(self.c1), float(self.c2),
+                  float(self.limite_inferior), float(self.limite_superior), self._fitness)
+        cronometro.marcar("atualizacao")
+        self._atualizar_global()
+        cronometro.marcar("melhores")
+        self.fitness_atual = self._fitness
+        return self._fitness
+
+    def atualizar_melhores(self, fitness_atual):
+        melhorou = fitness_atual < self.melhores_fitness
+        self.melhores_posicoes[melhorou] = self.particulas[melhorou]
+        self.melhores_fitness[melhorou] = fitness_atual[melhorou]
+        self._atualizar_global()
+
+    def _atualizar_global(self):
+        indice_melhor = np.argmin(self.melhores_fitness)
+        self._melhorou = self.melhores_fitness[indice_melhor] < self.melhor_fitness_global
+        if self._melhorou:
+            self.melhor_global = self.melhores_posicoes[indice_melhor].copy()
+            self.melhor_fitness_global = self.melhores_fitness[indice_melhor]
+
+    def emigrantes(self, quantidade):
+        """As ``quantidade`` melhores posições pessoais e seus fitness."""
+        indices = np.argsort(self.melhores_fitness, kind="stable")[:quantidade]
+        return self.melhores_posicoes[indices].copy(), self.melhores_fitness[indices].copy()
+
+    def receber_migrantes(self, posicoes, fitness):
+        """Substitui as partículas de pior melhor pessoal pelos imigrantes (com velocidade zero)."""
+        quantidade = min(len(fitness), self.num_particulas)
+        piores = np.argsort(self.melhores_fitness, kind="stable")[::-1][:quantidade]
+        self.particulas[piores] = posicoes[:quantidade]
+        self.velocidades[piores] = 0.0
+        self.melhores_posicoes[piores] = posicoes[:quantidade]
+        self.melhores_fitness[piores] = fitness[:quantidade]
+        self._atualizar_global()
+
+
+def pso(funcao_custo, dimensao=2, num_particulas=100, num_iteracoes=100, w=0.5, c1=1, c2=2,
+        limites=(-100, 100), semente=None, mostrar_prints=True, callback=None, telemetria=None,
+        guardar_historico=True, checkpoint=None, parada=None, perfil=None, nucleo="numpy", topologia="gbest",
+        substituto=None):
+    """
+    Minimiza ``funcao_custo`` com um enxame de partículas.
+
+    Parâmetros:
+        funcao_custo (callable): Função objetivo. Funções marcadas com
+            ``@vetorizada`` avaliam o enxame inteiro em uma única chamada.
+        dimensao (int): Número de variáveis de decisão.
+        num_particulas (int): Tamanho do enxame.
+        num_iteracoes (int): Número de gerações.
+        w (float): Peso de inércia.
+        c1 (float): Coeficiente cognitivo (atração ao melhor pessoal).
+        c2 (float): Coeficiente social (atração ao melhor global).
+        limites (tuple): Limites (inferior, superior) de cada coordenada.
+        semente (int | np.random.Generator | None): Semente ou gerador aleatório.
+        mostrar_prints (bool): Imprime o melhor e o pior indivíduo a cada geração.
+        callback (callable | None): Chamada como ``callback(geracao, particulas,
+            fitness_atual)`` ao fim de cada geração (ex.: para gerar gráficos).
+        telemetria (TelemetriaCSV | TelemetriaAnel | None): Destino das métricas
+            de cada geração (ver ``otimizacao.telemetria``).
+        guardar_historico (bool): Se falso, ``historico_melhor`` e
+            ``historico_pior`` não são acumulados (memória constante em execuções
+            longas; use ``telemetria`` para acompanhar a convergência).
+        checkpoint (Checkpoint | None): Grava o estado periodicamente e, se o
+            arquivo já existir, retoma a execução a partir dele
+            (ver ``otimizacao.checkpoint``).
+        parada (CriteriosParada | None): Critérios de parada antecipada,
+            verificados ao fim de cada geração; o critério atingido fica em
+            ``parada.motivo`` (ver ``otimizacao.parada``).
+        perfil (CronometroFases | None): Acumula o tempo de cada fase
+            (``perfil.resumo()``). Sem ``perfil`` nem ``telemetria``, as fases
+            não são cronometradas.
+        nucleo (str): ``"numpy"`` (padrão), ``"numba"`` (geração em um laço
+            compilado e paralelo; só para ``rastrigin`` e ``schaffer_n2``) ou
+            ``"auto"`` (Numba quando disponível e aplicável). Ver
+            ``otimizacao.compilado``.
+        topologia (str | objeto): ``"gbest"`` (padrão: todas seguem o melhor
+            global), ``"anel"``, ``"von_neumann"``, ``"aleatoria"``,
+            ``"euclidiana"`` ou uma instância de ``otimizacao.topologias``
+            (ex.: ``TopologiaEuclidiana(k=5)``).
+        substituto (Substituto | None): Modelo substituto que envia à
+            ``funcao_custo`` só a fração mais promissora das partículas de cada
+            geração; as avaliações economizadas ficam em
+            ``substituto.estatisticas()`` (ver ``otimizacao.substituto``).
+
+    Retorna:
+        tuple: (melhor_global, melhor_fitness_global, historico_melhor, historico_pior)
+    """
+    enxame = EnxamePSO(funcao_custo, dimensao=dimensao, num_particulas=num_particulas, w=w, c1=c1, c2=c2,
+                       limites=limites, semente=semente, inicializar=False, nucleo=nucleo,
+                       topologia=topologia, substituto=substituto)
+    estado = checkpoint.carregar("pso", enxame.rng) if checkpoint is not None else None
+
+    if estado is None:
+        inicio = 0
+        historico_melhor = []
+        historico_pior = []
+        enxame.inicializar()
+    else:
+        enxame.restaurar(estado)
+        inicio = estado["geracao"]
+        historico_melhor = estado["historico_melhor"].tolist()
+        historico_pior = estado["historico_pior"].tolist()
+    if parada is not None:
+        parada.iniciar(num_particulas)
+        if estado is not None:
+            parada.restaurar(estado)
+    cronometro = escolher_cronometro(perfil, telemetria)
+
+    # Um checkpoint gravado na parada antecipada devolve o resultado sem novas gerações
+    fim = inicio if parada is not None and parada.motivo is not None else num_iteracoes
+    for geracao in range(inicio, fim):
+        cronometro.reiniciar()
+        avaliacoes_antes = substituto.avaliacoes_reais if substituto is not None else 0
+        fitness_atual = enxame.passo(cronometro)
+        avaliacoes = num_particulas if substituto is None else substituto.avaliacoes_reais - avaliacoes_antes
+        indice_pior = np.argmax(fitness_atual)
+        pior_fitness = fitness_atual[indice_pior]
+
+        if guardar_historico:
+            historico_melhor.append(enxame.melhor_fitness_global)
+            historico_pior.append(pior_fitness)
+
+        if callback is not None:
+            callback(geracao, enxame.particulas, fitness_atual)
+            cronometro.marcar("callback")
+
+        if telemetria is not None:
+            telemetria.registrar(metricas_geracao(geracao + 1, enxame.melhor_fitness_global, fitness_atual,
+                                                  enxame.particulas, avaliacoes, cronometro))
+
+        if mostrar_prints:
+            print(f"[Geração {geracao + 1}]")
+            print(f"  Melhor indivíduo: posição = {enxame.melhor_global}, "
+                  f"fitness = {enxame.melhor_fitness_global:.6f}")
+            print(f"  Pior  indivíduo: posição = {enxame.particulas[indice_pior]}, fitness = {pior_fitness:.6f}")
+            print("-" * 60)
+
+        parar = parada is not None and parada.verificar(geracao + 1, enxame.melhor_fitness_global,
+                                                        enxame.particulas, avaliacoes)
+
+        if checkpoint is not None and (parar or checkpoint.deve_salvar(geracao + 1, num_iteracoes)):
+            checkpoint.salvar("pso", geracao + 1, enxame.rng, historico_melhor=historico_melhor,
+                              historico_pior=historico_pior, **enxame.estado(),
+                              **(parada.estado() if parada is not None else {}))
+
+        if parar:
+            if mostrar_prints:
+                print(f"Parada antecipada na geração {geracao + 1}: {parada.motivo}")
+            break
+
+    return enxame.melhor_global, enxame.melhor_fitness_global, historico_melhor, historico_pior
+
+
+def pso_empilhado(funcao_custo, geradores, dimensao=2, num_particulas=30, num_iteracoes=100, w=0.5, c1=1, c2=2,
+                  limites=(-100, 100)):
+    """
+    Executa vários enxames independentes empilhados em um único array.
+
+    As ``K = len(geradores)`` execuções compartilham as operações de arrays:
+    as posições ficam em um tensor ``(K, num_particulas, dimensao)`` e a função
+    objetivo é chamada uma única vez por geração com as ``K * num_particulas``
+    partículas. Cada enxame sorteia seus números do próprio gerador, na mesma
+    ordem de ``pso``, então cada resultado é idêntico ao de
+    ``pso(..., semente=geradores[k])``.
+
+    Parâmetros:
+        funcao_custo (callable): Função objetivo (de preferência ``@vetorizada``).
+        geradores (list of np.random.Generator): Um gerador por enxame.
+        dimensao, num_particulas, num_iteracoes, limites: Como em ``pso``.
+        w, c1, c2 (float | array-like): Coeficientes; um valor por enxame ou um
+            valor comum a todos.
+
+    Retorna:
+        tuple: (melhores_globais ``(K, dimensao)``, melhores_fitness ``(K,)``)
+    """
+    num_enxames = len(geradores)
+    limite_inferior, limite_superior = limites
+    forma = (num_particulas, dimensao)
+    w, c1, c2 = (np.broadcast_to(np.asarray(c, dtype=float).reshape(-1, 1, 1), (num_enxames, 1, 1))
+                 for c in (w, c1, c2))
+
+    particulas = np.stack([rng.uniform(limite_inferior, limite_superior, forma) for rng in geradores])
+    velocidades = np.zeros_like(particulas)
+    melhores_posicoes = particulas.copy()
+    melhores_fitness = avaliar_populacao(funcao_custo, particulas.reshape(-1, dimensao)).reshape(num_enxames, -1)
+    enxames = np.arange(num_enxames)
+    indice_melhor = np.argmin(melhores_fitness, axis=1)
+    melhor_global = melhores_posicoes[enxames, indice_melhor].copy()
+    melhor_fitness_global = melhores_fitness[enxames, indice_melhor].copy()
+    r1 = np.empty_like(particulas)
+    r2 = np.empty_like(particulas)
+
+    for _ in range(num_iteracoes):
+        for k, rng in enumerate(geradores):
+            r1[k] = rng.random(forma)
+            r2[k] = rng.random(forma)
+
+        velocidades *= w
+        velocidades += c1 * r1 * (melhores_posicoes - particulas)
+        velocidades += c2 * r2 * (melhor_global[:, np.newaxis, :] - particulas)
+        particulas += velocidades
+        np.clip(particulas, limite_inferior, limite_superior, out=particulas)
+
+        fitness_atual = avaliar_populacao(funcao_custo, particulas.reshape(-1, dimensao)).reshape(num_enxames, -1)
+        melhorou = fitness_atual < melhores_fitness
+        melhores_posicoes[melhorou] = particulas[melhorou]
+        melhores_fitness[melhorou] = fitness_atual[melhorou]
+
+        indice_melhor = np.argmin(melhores_fitness, axis=1)
+        candidatos = melhores_fitness[enxames, indice_melhor]
+        avancou = candidatos < melhor_fitness_global
+        melhor_global[avancou] = melhores_posicoes[enxames[avancou], indice_melhor[avancou]]
+        melhor_fitness_global[avancou] = candidatos[avancou]
+
+    return melhor_global, melhor_fitness_global
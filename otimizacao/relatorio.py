@@ -0,0 +1,429 @@
+"""
+Relatórios estáticos (PNG + HTML) de execuções e varreduras, sem janelas.
+
+Em vez de abrir janelas com ``plt.show()``, os dados de cada execução
+(históricos de melhor e pior fitness, ``historico_escolhas`` do GA, posições
+finais) são reunidos com ``dados_execucao`` e ``gerar_relatorio`` grava uma
+pasta com um ``index.html`` e as figuras em PNG:
+
+- por execução: ``convergencia`` (melhor e pior por geração), ``escolhas``
+  (frequência de escolha dos itens por geração) e ``posicoes`` (posições
+  finais sobre o mapa de cores da função, quando ela tem duas variáveis);
+- por relatório, com mais de uma execução: a mediana e o intervalo
+  interquartil do melhor fitness de cada grupo e a distribuição do fitness
+  final por grupo.
+
+As figuras usam diretamente o backend Agg (``Figure`` + ``FigureCanvasAgg``,
+sem ``pyplot``), então nada depende de um display. As execuções são
+divididas em lotes renderizados em um pool de processos; cada processo cria
+suas figuras uma vez e, a cada execução, só troca os dados dos gráficos (as
+superfície de uma mesma função é calculada e montada uma única vez), de modo
+que centenas de execuções levam poucos segundos.
+``gerar_relatorio_em_segundo_plano`` devolve um ``Future`` e não bloqueia o
+otimizador.
+
+Uso na linha de comando, para o CSV de uma varredura
+(``otimizacao.varredura``)::
+
+    python -m otimizacao.relatorio resultados.csv --saida relatorio_varredura
+"""
+import argparse
+import html
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+
+import numpy as np
+
+from otimizacao.paisagem import grade_superficie
+
+# Até este número de execuções o HTML mostra as figuras de cada uma; acima disso, só links
+EXECUCOES_COM_IMAGENS = 20
+# Lotes por processo (lotes menores equilibram melhor execuções de tamanhos diferentes)
+_LOTES_POR_TRABALHADOR = 4
+# Compressão rápida do PNG: no mapa da função, a codificação com o nível padrão custa mais que o desenho
+_OPCOES_PNG = {"pil_kwargs": {"compress_level": 1}}
+
+
+def dados_execucao(nome, historico_melhor=None, historico_pior=None, historico_escolhas=None, posicoes=None,
+                   melhor_posicao=None, melhor_fitness=None, funcao=None, limites=None, grupo=None, **metadados):
+    """
+    Reúne os dados de uma execução para ``gerar_relatorio``.
+
+    Parâmetros:
+        nome (str): Identificação da execução (também usada nos nomes dos PNGs).
+        historico_melhor, historico_pior (list | None): Melhor e pior fitness por geração.
+        historico_escolhas (np.ndarray | None): Matriz ``(geracoes, n_itens)`` do GA.
+        posicoes (np.ndarray | None): Posições finais ``(n, dim)`` (ex.: o
+            último quadro de um ``GravadorQuadros``).
+        melhor_posicao, melhor_fitness: Melhor solução encontrada.
+        funcao (callable | None): Função objetivo de duas variáveis, usada no
+            fundo do gráfico de posições (precisa ser serializável com pickle).
+        limites (tuple | None): Limites (inferior, superior) dos eixos.
+        grupo (str | None): Execuções do mesmo grupo (ex.: uma configuração de
+            uma varredura) são resumidas juntas.
+        **metadados: Colunas extras da tabela do HTML (ex.: ``semente=3``).
+
+    Retorna:
+        dict
+    """
+    def vetor(valores):
+        return None if valores is None else np.asarray(valores, dtype=float)
+
+    return {
+        "nome": str(nome),
+        "historico_melhor": vetor(historico_melhor),
+        "historico_pior": vetor(historico_pior),
+        "historico_escolhas": vetor(historico_escolhas),
+        "posicoes": vetor(posicoes),
+        "melhor_posicao": vetor(melhor_posicao),
+        "melhor_fitness": None if melhor_fitness is None else float(melhor_fitness),
+        "funcao": funcao,
+        "limites": limites,
+        "grupo": nome if grupo is None else str(grupo),
+        "metadados": metadados,
+    }
+
+
+# ----------------------------
+# Figuras (executadas nos processos do pool)
+# ----------------------------
+def _ajustar_escala(ax, valores):
+    # Escala log quando o fitness é positivo e varia várias ordens de grandeza (ex.: sphere convergindo a zero)
+    valores = np.concatenate([np.ravel(v) for v in valores])
+    valores = valores[np.isfinite(valores)]
+    positivos = len(valores) and valores.min() > 0
+    ax.set_yscale("log" if positivos and valores.max() / valores.min() > 1e3 else "linear")
+
+
+class _Figuras:
+    """Figuras Agg reaproveitadas entre as execuções de um lote."""
+
+    def __init__(self, dpi, resolucao):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+
+        self.dpi = dpi
+        self.resolucao = resolucao
+
+        self.fig_convergencia = Figure(figsize=(6, 4), dpi=dpi)
+        FigureCanvasAgg(self.fig_convergencia)
+        self.ax_convergencia = self.fig_convergencia.add_subplot(111)
+        self.linha_melhor, = self.ax_convergencia.plot([], [], label="Melhor")
+        self.linha_pior, = self.ax_convergencia.plot([], [], label="Pior", alpha=0.7)
+        self.ax_convergencia.set_xlabel("Geração")
+        self.ax_convergencia.set_ylabel("Fitness")
+        self.ax_convergencia.grid(alpha=0.3)
+        # Posição fixa: loc="best" procura a melhor posição a cada figura
+        self.ax_convergencia.legend(loc="upper right")
+
+        self.fig_escolhas = Figure(figsize=(8, 5), dpi=dpi)
+        FigureCanvasAgg(self.fig_escolhas)
+        self.ax_escolhas = self.fig_escolhas.add_subplot(111)
+        self.imagem_escolhas = self.ax_escolhas.imshow(np.zeros((1, 1)), aspect="auto", cmap="YlGnBu",
+                                                       interpolation="nearest", origin="lower")
+        self.fig_escolhas.colorbar(self.imagem_escolhas, ax=self.ax_escolhas, label="Indivíduos")
+        self.ax_escolhas.set_xlabel("Geração")
+        self.ax_escolhas.set_ylabel("Índice do Item")
+
+        self.fig_posicoes = Figure(figsize=(6, 5), dpi=dpi)
+        FigureCanvasAgg(self.fig_posicoes)
+        self.ax_posicoes = self.fig_posicoes.add_subplot(111)
+        self._fundo = None
+        self._montar_posicoes(None, None)
+
+    def _montar_posicoes(self, funcao, limites):
+        # Fundo montado uma vez por (função, limites); depois só os pontos mudam. A superfície vai como
+        # imagem (imshow), não como contourf: o fundo é redesenhado em cada PNG e a imagem é bem mais barata
+        self.ax_posicoes.clear()
+        if funcao is not None:
+            x, Z = grade_superficie(funcao, limites, self.resolucao)
+            self.ax_posicoes.imshow(Z, extent=(x[0], x[-1], x[0], x[-1]), origin="lower", cmap="viridis",
+                                    aspect="auto", interpolation="bilinear")
+        self.pontos = self.ax_posicoes.scatter([], [], s=12, color="black", label="Posições finais")
+        self.melhor, = self.ax_posicoes.plot([], [], linestyle="", marker="*", markersize=14, color="red",
+                                             label="Melhor solução")
+        self.ax_posicoes.set_xlabel("x")
+        self.ax_posicoes.set_ylabel("y")
+        self.ax_posicoes.legend(loc="upper right")
+        self._fundo = (funcao, limites)
+
+    def convergencia(self, execucao, arquivo):
+        melhor, pior = execucao["historico_melhor"], execucao["historico_pior"]
+        self.linha_melhor.set_data(np.arange(1, len(melhor) + 1), melhor)
+        if pior is None:
+            self.linha_pior.set_data([], [])
+        else:
+            self.linha_pior.set_data(np.arange(1, len(pior) + 1), pior)
+        _ajustar_escala(self.ax_convergencia, [melhor] if pior is None else [melhor, pior])
+        self.ax_convergencia.relim()
+        self.ax_convergencia.autoscale_view()
+        self.ax_convergencia.set_title(f"Convergência - {execucao['nome']}")
+        self.fig_convergencia.savefig(arquivo, **_OPCOES_PNG)
+
+    def escolhas(self, execucao, arquivo):
+        historico = execucao["historico_escolhas"]
+        geracoes, n_itens = historico.shape
+        self.imagem_escolhas.set_data(historico.T)
+        self.imagem_escolhas.set_extent((-0.5, geracoes - 0.5, -0.5, n_itens - 0.5))
+        self.imagem_escolhas.set_clim(historico.min(), max(historico.max(), historico.min() + 1))
+        self.ax_escolhas.set_title(f"Frequência de escolha dos itens - {execucao['nome']}")
+        self.fig_escolhas.savefig(arquivo, **_OPCOES_PNG)
+
+    def posicoes(self, execucao, arquivo):
+        posicoes = execucao["posicoes"]
+        funcao = execucao["funcao"] if posicoes.shape[1] == 2 and execucao["limites"] is not None else None
+        limites = execucao["limites"] if funcao is not None else None
+        if self._fundo[0] is not funcao or self._fundo[1] != limites:
+            self._montar_posicoes(funcao, limites)
+        self.pontos.set_offsets(posicoes[:, :2])
+        melhor = execucao["melhor_posicao"]
+        self.melhor.set_data(([melhor[0]], [melhor[1]]) if melhor is not None and len(melhor) >= 2 else ([], []))
+        if funcao is None:
+            self.ax_posicoes.ignore_existing_data_limits = True
+            self.ax_posicoes.update_datalim(posicoes[:, :2])
+            self.ax_posicoes.autoscale_view()
+        self.ax_posicoes.set_title(f"Posições finais - {execucao['nome']}")
+        self.fig_posicoes.savefig(arquivo, **_OPCOES_PNG)
+
+
+def _renderizar_lote(pasta, lote, dpi, resolucao):
+    # Retorna, para cada execução do lote, os PNGs gerados (caminhos relativos à pasta)
+    figuras = _Figuras(dpi, resolucao)
+    gerados = []
+    for prefixo, execucao in lote:
+        arquivos = {}
+        if execucao["historico_melhor"] is not None and len(execucao["historico_melhor"]):
+            arquivos["convergencia"] = f"{prefixo}_convergencia.png"
+            figuras.convergencia(execucao, os.path.join(pasta, arquivos["convergencia"]))
+        if execucao["historico_escolhas"] is not None and execucao["historico_escolhas"].size:
+            arquivos["escolhas"] = f"{prefixo}_escolhas.png"
+            figuras.escolhas(execucao, os.path.join(pasta, arquivos["escolhas"]))
+        posicoes = execucao["posicoes"]
+        if posicoes is not None and posicoes.ndim == 2 and posicoes.shape[1] >= 2:
+            arquivos["posicoes"] = f"{prefixo}_posicoes.png"
+            figuras.posicoes(execucao, os.path.join(pasta, arquivos["posicoes"]))
+        gerados.append(arquivos)
+    return gerados
+
+
+def _curvas_alinhadas(historicos):
+    # Execuções com parada antecipada são estendidas com o último valor
+    comprimento = max(len(h) for h in historicos)
+    return np.array([np.pad(h, (0, comprimento - len(h)), mode="edge") for h in historicos])
+
+
+def _renderizar_resumo(pasta, grupos, dpi):
+    """Figuras do relatório inteiro; ``grupos`` mapeia o grupo em (históricos de melhor, fitness finais)."""
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    arquivos = {}
+    com_historico = {nome: historicos for nome, (historicos, _) in grupos.items() if historicos}
+    if com_historico:
+        fig = Figure(figsize=(8, 5), dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        for nome, historicos in com_historico.items():
+            curvas = _curvas_alinhadas(historicos)
+            geracoes = np.arange(1, curvas.shape[1] + 1)
+            q1, mediana, q3 = np.percentile(curvas, [25, 50, 75], axis=0)
+            linha, = ax.plot(geracoes, mediana, label=f"{nome} (n={len(curvas)})")
+            ax.fill_between(geracoes, q1, q3, color=linha.get_color(), alpha=0.2)
+        _ajustar_escala(ax, [h for historicos in com_historico.values() for h in historicos])
+        ax.set_xlabel("Geração")
+        ax.set_ylabel("Melhor fitness (mediana e intervalo interquartil)")
+        ax.grid(alpha=0.3)
+        if len(com_historico) <= 15:
+            ax.legend(loc="best", fontsize="small")
+        arquivos["convergencia"] = "resumo_convergencia.png"
+        fig.savefig(os.path.join(pasta, arquivos["convergencia"]), **_OPCOES_PNG)
+
+    finais = {nome: valores for nome, (_, valores) in grupos.items() if valores}
+    if finais:
+        fig = Figure(figsize=(max(6.0, 0.5 * len(finais)), 5), dpi=dpi)
+        FigureCanvasAgg(fig)
+        ax = fig.add_subplot(111)
+        ax.boxplot(list(finais.values()))
+        ax.set_xticks(np.arange(1, len(finais) + 1))
+        inclinar = len(finais) > 6
+        ax.set_xticklabels(list(finais), rotation=45 if inclinar else 0, ha="right" if inclinar else "center",
+                           fontsize="small")
+        ax.set_ylabel("Fitness final")
+        ax.grid(alpha=0.3, axis="y")
+        fig.tight_layout()
+        arquivos["distribuicao"] = "resumo_distribuicao.png"
+        fig.savefig(os.path.join(pasta, arquivos["distribuicao"]), **_OPCOES_PNG)
+    return arquivos
+
+
+# ----------------------------
+# HTML
+# ----------------------------
+def _prefixo(indice, nome):
+    return f"{indice:04d}_" + re.sub(r"[^\w.-]+", "_", nome).strip("_")[:60]
+
+
+def _formatar(valor):
+    if isinstance(valor, float):
+        return f"{valor:.6g}"
+    return html.escape(str(valor))
+
+
+def _escrever_html(pasta, titulo, execucoes, gerados, resumo):
+    colunas = sorted({chave for execucao in execucoes for chave in execucao["metadados"]})
+    com_imagens = len(execucoes) <= EXECUCOES_COM_IMAGENS
+    partes = [
+        "<!DOCTYPE html>",
+        '<html lang="pt-BR"><head><meta charset="utf-8">',
+        f"<title>{html.escape(titulo)}</title>",
+        "<style>body{font-family:sans-serif;margin:2em}table{border-collapse:collapse}"
+        "td,th{border:1px solid #ccc;padding:4px 8px;text-align:left}img{max-width:100%;margin:4px}</style>",
+        f"</head><body><h1>{html.escape(titulo)}</h1>",
+        f"<p>{len(execucoes)} execução(ões).</p>",
+    ]
+    if resumo:
+        partes.append("<h2>Resumo</h2>")
+        partes.extend(f'<img src="{arquivo}" alt="{nome}">' for nome, arquivo in resumo.items())
+
+    partes.append("<h2>Execuções</h2><table><tr><th>Execução</th><th>Grupo</th><th>Melhor fitness</th>"
+                  + "".join(f"<th>{html.escape(coluna)}</th>" for coluna in colunas) + "<th>Figuras</th></tr>")
+    for execucao, arquivos in zip(execucoes, gerados):
+        melhor = execucao["melhor_fitness"]
+        if melhor is None and execucao["historico_melhor"] is not None and len(execucao["historico_melhor"]):
+            melhor = float(execucao["historico_melhor"][-1])
+        links = " ".join(f'<a href="{arquivo}">{nome}</a>' for nome, arquivo in arquivos.items())
+        partes.append(f"<tr><td>{html.escape(execucao['nome'])}</td><td>{html.escape(execucao['grupo'])}</td>"
+                      f"<td>{'' if melhor is None else _formatar(melhor)}</td>"
+                      + "".join(f"<td>{_formatar(execucao['metadados'].get(coluna, ''))}</td>" for coluna in colunas)
+                      + f"<td>{links}</td></tr>")
+    partes.append("</table>")
+
+    if com_imagens:
+        for execucao, arquivos in zip(execucoes, gerados):
+            if arquivos:
+                partes.append(f"<h3>{html.escape(execucao['nome'])}</h3>")
+                partes.extend(f'<img src="{arquivo}" alt="{nome}">' for nome, arquivo in arquivos.items())
+    partes.append("</body></html>")
+
+    caminho = os.path.join(pasta, "index.html")
+    with open(caminho, "w", encoding="utf-8") as f:
+        f.write("\n".join(partes))
+    return caminho
+
+
+# ----------------------------
+# Geração do relatório
+# ----------------------------
+def gerar_relatorio(execucoes, pasta, titulo="Relatório de execuções", num_trabalhadores=None, dpi=80,
+                    resolucao=100):
+    """
+    Renderiza as figuras das execuções e grava ``pasta/index.html``.
+
+    Parâmetros:
+        execucoes (list of dict): Saídas de ``dados_execucao``.
+        pasta (str): Pasta do relatório (criada se não existir).
+        titulo (str): Título da página.
+        num_trabalhadores (int | None): Processos de renderização (padrão:
+            número de CPUs, no máximo um por lote); com 1, renderiza no
+            processo atual.
+        dpi (int): Resolução das figuras.
+        resolucao (int): Pontos por eixo do mapa da função (grade em cache,
+            ver ``otimizacao.paisagem``).
+
+    Retorna:
+        str: Caminho do ``index.html``.
+    """
+    if not execucoes:
+        raise ValueError("Nenhuma execução para o relatório.")
+    os.makedirs(pasta, exist_ok=True)
+    prefixadas = [(_prefixo(indice, execucao["nome"]), execucao) for indice, execucao in enumerate(execucoes)]
+
+    grupos = {}
+    for execucao in execucoes:
+        historicos, finais = grupos.setdefault(execucao["grupo"], ([], []))
+        if execucao["historico_melhor"] is not None and len(execucao["historico_melhor"]):
+            historicos.append(execucao["historico_melhor"])
+            finais.append(float(execucao["historico_melhor"][-1]))
+        elif execucao["melhor_fitness"] is not None:
+            finais.append(execucao["melhor_fitness"])
+
+    num_trabalhadores = num_trabalhadores or os.cpu_count() or 1
+    num_lotes = min(len(prefixadas), num_trabalhadores * _LOTES_POR_TRABALHADOR)
+    lotes = [prefixadas[i::num_lotes] for i in range(num_lotes)]
+    resumo = {}
+    if num_trabalhadores == 1:
+        por_lote = [_renderizar_lote(pasta, lote, dpi, resolucao) for lote in lotes]
+        if len(execucoes) > 1:
+            resumo = _renderizar_resumo(pasta, grupos, dpi)
+    else:
+        with ProcessPoolExecutor(max_workers=min(num_trabalhadores, num_lotes + 1)) as executor:
+            futuros = [executor.submit(_renderizar_lote, pasta, lote, dpi, resolucao) for lote in lotes]
+            futuro_resumo = executor.submit(_renderizar_resumo, pasta, grupos, dpi) if len(execucoes) > 1 else None
+            por_lote = [futuro.result() for futuro in futuros]
+            if futuro_resumo is not None:
+                resumo = futuro_resumo.result()
+
+    # Os lotes foram montados intercalados (execuções i, i + num_lotes, ...); volta à ordem original
+    gerados = [None] * len(execucoes)
+    for indice_lote, arquivos_lote in enumerate(por_lote):
+        for posicao, arquivos in enumerate(arquivos_lote):
+            gerados[indice_lote + posicao * num_lotes] = arquivos
+    return _escrever_html(pasta, titulo, execucoes, gerados, resumo)
+
+
+_coordenador = None
+
+
+def gerar_relatorio_em_segundo_plano(execucoes, pasta, **opcoes):
+    """
+    Agenda ``gerar_relatorio`` e retorna imediatamente.
+
+    Os relatórios agendados são gerados um de cada vez, em uma thread que só
+    coordena o pool de processos; o otimizador segue rodando.
+
+    Retorna:
+        concurrent.futures.Future: Resolve para o caminho do ``index.html``.
+    """
+    global _coordenador
+    if _coordenador is None:
+        _coordenador = ThreadPoolExecutor(max_workers=1)
+    return _coordenador.submit(gerar_relatorio, execucoes, pasta, **opcoes)
+
+
+def relatorio_varredura(resultados, pasta, titulo="Relatório da varredura", **opcoes):
+    """
+    Relatório de uma varredura de ``otimizacao.varredura`` (uma linha por execução).
+
+    Cada configuração vira um grupo; como as varreduras não guardam os
+    históricos, o resumo mostra a distribuição do fitness final.
+    """
+    execucoes = [dados_execucao(f"#{linha['id']}", melhor_fitness=linha["fitness_final"],
+                                grupo=f"config {linha['configuracao']}", algoritmo=linha["algoritmo"],
+                                objetivo=linha["funcao"], dim=linha["dim"], populacao=linha["populacao"],
+                                geracoes=linha["geracoes"],
+                                parametros=linha["parametros"], tempo_s=linha["tempo_s"])
+                 for linha in resultados]
+    return gerar_relatorio(execucoes, pasta, titulo=titulo, **opcoes)
+
+
+def main(argv=None):
+    from otimizacao.varredura import carregar_resultados
+
+    parser = argparse.ArgumentParser(prog="python -m otimizacao.relatorio",
+                                     description="Relatório HTML/PNG de uma varredura salva em CSV.")
+    parser.add_argument("resultados", help="CSV de resultados de otimizacao.varredura.")
+    parser.add_argument("--saida", default="relatorio", help="Pasta do relatório.")
+    parser.add_argument("--trabalhadores", type=int, default=None)
+    args = parser.parse_args(argv)
+
+    resultados = carregar_resultados(args.resultados)
+    if not resultados:
+        parser.error(f"nenhum resultado em {args.resultados!r}")
+    print(relatorio_varredura(resultados, args.saida, num_trabalhadores=args.trabalhadores))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
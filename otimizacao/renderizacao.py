@@ -0,0 +1,162 @@
+"""
+Renderização das animações de convergência (GIF/MP4).
+
+Durante a execução o otimizador só registra instantâneos leves das posições
+e do fitness (``GravadorQuadros``). A renderização acontece depois, em uma
+única figura reaproveitada: a superfície, os eixos e a barra de cores são
+desenhados uma vez e, a cada quadro, apenas os dados do gráfico de dispersão
+são atualizados. Os quadros vão direto para o escritor de animação do
+matplotlib (Pillow para GIF, FFmpeg para MP4), sem PNGs temporários em disco.
+
+``salvar_animacao_em_segundo_plano`` executa a renderização em um pool de
+processos, liberando o processo principal enquanto o arquivo é gerado.
+
+O matplotlib só é importado quando uma animação é de fato renderizada.
+"""
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from otimizacao.paisagem import grade_superficie
+
+
+class GravadorQuadros:
+    """
+    Callback de otimizador que guarda um instantâneo a cada ``intervalo`` gerações.
+
+    Compatível com o parâmetro ``callback`` de ``pso`` e ``ABC.optimize``.
+    A última geração é sempre registrada quando ``total_geracoes`` é informado.
+    """
+
+    def __init__(self, intervalo=1, total_geracoes=None, dtype=np.float32):
+        self.intervalo = intervalo
+        self.total_geracoes = total_geracoes
+        self.dtype = dtype
+        self.quadros = []
+
+    def __call__(self, geracao, posicoes, fitness):
+        ultima = self.total_geracoes is not None and geracao + 1 == self.total_geracoes
+        if (geracao + 1) % self.intervalo == 0 or ultima:
+            self.quadros.append((geracao, np.array(posicoes, dtype=self.dtype), np.array(fitness, dtype=self.dtype)))
+
+    def __len__(self):
+        return len(self.quadros)
+
+
+def _superficie(funcao_objetivo, limites, resolucao):
+    # Grade em cache no disco (otimizacao/paisagem.py), reaproveitada entre animações e execuções
+    x, Z = grade_superficie(funcao_objetivo, limites, resolucao)
+    X, Y = np.meshgrid(x, x)
+    return X, Y, Z
+
+
+class RenderizadorSuperficie:
+    """
+    Figura 3D reaproveitada entre quadros: superfície da função + partículas.
+
+    Parâmetros:
+        funcao_objetivo (callable): Função objetivo de duas variáveis.
+        limites (tuple): Limites (inferior, superior) dos eixos x e y.
+        resolucao (int): Pontos por eixo na grade da superfície.
+        tamanho (tuple): Tamanho da figura em polegadas.
+        dpi (int): Resolução dos quadros.
+    """
+
+    def __init__(self, funcao_objetivo, limites, resolucao=200, tamanho=(12, 8), dpi=100):
+        from matplotlib import cm
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import LinearLocator
+
+        X, Y, Z = _superficie(funcao_objetivo, limites, resolucao)
+
+        self.dpi = dpi
+        self.fig = Figure(figsize=tamanho, dpi=dpi)
+        FigureCanvasAgg(self.fig)
+        self.ax = self.fig.add_subplot(111, projection='3d')
+        surf = self.ax.plot_surface(X, Y, Z, cmap=cm.coolwarm, linewidth=0, antialiased=True, alpha=0.7)
+
+        self.ax.set_xlabel("X", fontsize=12)
+        self.ax.set_ylabel("Y", fontsize=12)
+        self.ax.set_zlabel("Z", fontsize=12)
+        self.ax.set_zlim(np.min(Z), np.max(Z))
+        self.ax.zaxis.set_major_locator(LinearLocator(10))
+        self.fig.colorbar(surf, shrink=0.5, aspect=8)
+
+        self.particulas, = self.ax.plot([], [], [], linestyle='', marker='o', color='black', markersize=5)
+
+    def atualizar(self, posicoes, fitness, titulo):
+        """Atualiza apenas os dados das partículas e o título."""
+        self.particulas.set_data_3d(posicoes[:, 0], posicoes[:, 1], fitness)
+        self.ax.set_title(titulo, fontsize=14)
+
+    def fechar(self):
+        self.fig.clear()
+
+
+def _escritor(arquivo, fps):
+    from matplotlib import animation
+
+    if arquivo.lower().endswith(".gif"):
+        return animation.PillowWriter(fps=fps)
+    if arquivo.lower().endswith(".mp4"):
+        return animation.FFMpegWriter(fps=fps)
+    raise ValueError(f"Formato de animação não suportado: {arquivo!r} (use .gif ou .mp4).")
+
+
+def salvar_animacao(quadros, arquivo, funcao_objetivo, limites, titulo="Geração", duracao_ms=100,
+                    resolucao=200, dpi=100):
+    """
+    Renderiza os instantâneos em uma animação GIF/MP4.
+
+    Parâmetros:
+        quadros (list | GravadorQuadros): Instantâneos ``(geracao, posicoes, fitness)``.
+        arquivo (str): Caminho do arquivo de saída (``.gif`` ou ``.mp4``).
+        funcao_objetivo (callable): Função usada para desenhar a superfície.
+        limites (tuple): Limites (inferior, superior) dos eixos x e y.
+        titulo (str): Prefixo do título de cada quadro.
+        duracao_ms (int): Duração de cada quadro, em milissegundos.
+        resolucao (int): Pontos por eixo na grade da superfície.
+        dpi (int): Resolução dos quadros.
+
+    Retorna:
+        str: O caminho do arquivo gerado.
+    """
+    if isinstance(quadros, GravadorQuadros):
+        quadros = quadros.quadros
+    if not quadros:
+        raise ValueError("Nenhum quadro para renderizar.")
+
+    renderizador = RenderizadorSuperficie(funcao_objetivo, limites, resolucao=resolucao, dpi=dpi)
+    escritor = _escritor(arquivo, fps=1000 / duracao_ms)
+    try:
+        with escritor.saving(renderizador.fig, arquivo, dpi):
+            for geracao, posicoes, fitness in quadros:
+                renderizador.atualizar(posicoes, fitness, f"{titulo} {geracao + 1}")
+                escritor.grab_frame()
+    finally:
+        renderizador.fechar()
+    return arquivo
+
+
+_pool_renderizacao = None
+
+
+def salvar_animacao_em_segundo_plano(quadros, arquivo, funcao_objetivo, limites, num_trabalhadores=None, **opcoes):
+    """
+    Agenda ``salvar_animacao`` em um pool de processos e retorna imediatamente.
+
+    O pool é criado na primeira chamada e compartilhado pelas seguintes, de
+    modo que várias animações (por exemplo, PSO e ABC) são renderizadas em
+    paralelo. A função objetivo precisa ser serializável com pickle.
+
+    Retorna:
+        concurrent.futures.Future: Resolve para o caminho do arquivo gerado.
+    """
+    global _pool_renderizacao
+    if isinstance(quadros, GravadorQuadros):
+        quadros = quadros.quadros
+    if _pool_renderizacao is None:
+        _pool_renderizacao = ProcessPoolExecutor(max_workers=num_trabalhadores or min(4, os.cpu_count() or 1))
+    return _pool_renderizacao.submit(salvar_animacao, quadros, arquivo, funcao_objetivo, limites, **opcoes)
@@ -0,0 +1,270 @@
+"""
+Triagem por modelo substituto para funções objetivo caras.
+
+``Substituto`` guarda um arquivo com todos os pontos já avaliados pela função
+objetivo real e ajusta sobre ele um modelo barato (k vizinhos mais próximos
+ou RBF local). A cada lote de candidatos, ``avaliar``:
+
+1. prevê o fitness de cada candidato com o modelo;
+2. ordena os candidatos pelo ganho previsto sobre ``referencia`` (o fitness
+   que o candidato precisa vencer: o melhor pessoal no PSO, a fonte de
+   alimento no ABC) e envia só a fração ``fracao`` mais promissora para a
+   função real;
+3. devolve, para os demais, um valor que nunca vence a referência
+   (``max(previsto, referencia)`` na minimização), de modo que o otimizador os
+   trata como tentativas sem melhora. Sem ``referencia`` (GA), os demais
+   recebem o valor previsto, limitado a ficar abaixo do melhor valor real do
+   lote (o melhor indivíduo reportado é sempre um avaliado de verdade).
+
+Candidatos que já estão no arquivo (distância zero, comum no GA binário)
+recebem o valor guardado, sem nova avaliação. O uso é o mesmo nos três
+otimizadores::
+
+    substituto = Substituto(fracao=0.3)
+    pso(funcao_cara, dimensao=5, substituto=substituto)
+    print(substituto.estatisticas())   # avaliações reais e economizadas
+
+O arquivo é limitado a ``capacidade_arquivo`` pontos (os mais antigos são
+substituídos). Com ``checkpoint``, o arquivo e os contadores são gravados
+junto com o estado do otimizador (``estado``/``restaurar``), e a execução
+retomada faz as mesmas previsões e as mesmas avaliações reais que uma
+execução sem interrupção.
+"""
+import math
+
+import numpy as np
+
+from otimizacao.objetivos import avaliar_populacao
+
+MODELOS = ("knn", "rbf")
+
+# Elementos (candidatos x pontos do arquivo) por bloco na busca de vizinhos
+_ELEMENTOS_POR_BLOCO = 1 << 22
+
+
+class Substituto:
+    """
+    Arquivo de pontos avaliados e modelo substituto usado na triagem.
+
+    Parâmetros:
+        fracao (float): Fração dos candidatos de cada lote (ainda não
+            arquivados) enviada à função objetivo real, em ``(0, 1]``.
+        modelo (str): ``"knn"`` (média dos ``k`` vizinhos mais próximos
+            ponderada pelo inverso do quadrado da distância) ou ``"rbf"``
+            (interpolação cúbica com termo constante sobre os ``k`` vizinhos).
+        k (int): Vizinhos usados em cada previsão.
+        minimo_arquivo (int | None): Enquanto o arquivo tiver menos pontos que
+            isso, todos os candidatos são avaliados de verdade. O padrão é ``2 * k``.
+        capacidade_arquivo (int): Número máximo de pontos guardados.
+    """
+
+    def __init__(self, fracao=0.5, modelo="knn", k=8, minimo_arquivo=None, capacidade_arquivo=5000):
+        if not 0 < fracao <= 1:
+            raise ValueError("fracao deve estar no intervalo (0, 1].")
+        if modelo not in MODELOS:
+            raise ValueError(f"modelo deve ser um de {MODELOS}.")
+        if k < 1 or capacidade_arquivo < 1:
+            raise ValueError("k e capacidade_arquivo devem ser positivos.")
+        self.fracao = fracao
+        self.modelo = modelo
+        self.k = k
+        self.minimo_arquivo = 2 * k if minimo_arquivo is None else minimo_arquivo
+        self.capacidade_arquivo = capacidade_arquivo
+        self.avaliacoes_reais = 0
+        self.previstas = 0
+        self.repetidas = 0
+        self.tamanho = 0
+        self._proximo = 0
+        self.pontos = None
+
+    # ----------------------------
+    # Arquivo
+    # ----------------------------
+    def registrar(self, pontos, valores):
+        """Acrescenta pontos avaliados ao arquivo (substituindo os mais antigos quando cheio)."""
+        pontos = np.asarray(pontos, dtype=float)
+        valores = np.asarray(valores, dtype=float)
+        if self.pontos is None:
+            capacidade = min(self.capacidade_arquivo, max(64, len(pontos)))
+            self.pontos = np.empty((capacidade, pontos.shape[1]))
+            self.valores = np.empty(capacidade)
+            self.quadrados = np.empty(capacidade)
+        # Só os últimos capacidade_arquivo pontos do lote podem ficar
+        pontos = pontos[-self.capacidade_arquivo:]
+        valores = valores[-self.capacidade_arquivo:]
+
+        if self.tamanho + len(pontos) > len(self.pontos) and len(self.pontos) < self.capacidade_arquivo:
+            # Crescimento geométrico enquanto o arquivo não atinge a capacidade
+            capacidade = min(self.capacidade_arquivo, max(2 * len(self.pontos), self.tamanho + len(pontos)))
+            for nome in ("pontos", "valores", "quadrados"):
+                antigo = getattr(self, nome)
+                novo = np.empty((capacidade,) + antigo.shape[1:])
+                novo[:self.tamanho] = antigo[:self.tamanho]
+                setattr(self, nome, novo)
+
+        posicoes = (self._proximo + np.arange(len(pontos))) % self.capacidade_arquivo
+        self.pontos[posicoes] = pontos
+        self.valores[posicoes] = valores
+        self.quadrados[posicoes] = np.einsum("ij,ij->i", pontos, pontos)
+        self._proximo = (self._proximo + len(pontos)) % self.capacidade_arquivo
+        self.tamanho = min(self.tamanho + len(pontos), self.capacidade_arquivo)
+
+    def estado(self):
+        """Arquivo e contadores (para ``Checkpoint.salvar``)."""
+        pontos = np.empty((0, 0)) if self.pontos is None else self.pontos[:self.tamanho]
+        return {
+            "substituto_pontos": pontos,
+            "substituto_valores": np.empty(0) if self.pontos is None else self.valores[:self.tamanho],
+            "substituto_quadrados": np.empty(0) if self.pontos is None else self.quadrados[:self.tamanho],
+            "substituto_proximo": self._proximo,
+            "substituto_contadores": np.array([self.avaliacoes_reais, self.previstas, self.repetidas]),
+        }
+
+    def restaurar(self, estado):
+        """
+        Continua a partir do estado gravado por ``estado``. Um checkpoint
+        gravado sem substituto é ignorado (o arquivo começa vazio).
+        """
+        if "substituto_pontos" not in estado:
+            return
+        tamanho = len(estado["substituto_valores"])
+        if tamanho > self.capacidade_arquivo:
+            raise ValueError(f"Checkpoint incompatível: o arquivo do substituto tem {tamanho} pontos, mais que "
+                             f"capacidade_arquivo={self.capacidade_arquivo}.")
+        self.avaliacoes_reais, self.previstas, self.repetidas = (int(v) for v in estado["substituto_contadores"])
+        self.tamanho = tamanho
+        self._proximo = int(estado["substituto_proximo"])
+        if self.tamanho == 0:
+            self.pontos = None
+            return
+        # Antes de encher, o arquivo ocupa as posições 0..tamanho-1; cheio, o anel inteiro: as posições se mantêm
+        self.pontos = np.array(estado["substituto_pontos"], dtype=float)
+        self.valores = np.array(estado["substituto_valores"], dtype=float)
+        self.quadrados = np.array(estado["substituto_quadrados"], dtype=float)
+
+    def _vizinhos(self, candidatos, k):
+        # k vizinhos de cada candidato no arquivo, por força bruta em blocos (||a||^2 já guardado)
+        arquivo = self.pontos[:self.tamanho]
+        quadrados = self.quadrados[:self.tamanho]
+        indices = np.empty((len(candidatos), k), dtype=np.int64)
+        tamanho_bloco = max(1, _ELEMENTOS_POR_BLOCO // self.tamanho)
+        for inicio in range(0, len(candidatos), tamanho_bloco):
+            bloco = candidatos[inicio:inicio + tamanho_bloco]
+            quadrados_bloco = np.einsum("ij,ij->i", bloco, bloco)
+            d2 = quadrados_bloco[:, np.newaxis] - 2.0 * bloco @ arquivo.T + quadrados
+            np.maximum(d2, 0.0, out=d2)
+            proximos = np.argpartition(d2, k - 1, axis=1)[:, :k] if k < self.tamanho else \
+                np.broadcast_to(np.arange(k), (len(bloco), k))
+            indices[inicio:inicio + len(bloco)] = proximos
+        return indices
+
+    # ----------------------------
+    # Modelo
+    # ----------------------------
+    def prever(self, candidatos):
+        """
+        Prevê o fitness dos candidatos a partir do arquivo.
+
+        Retorna:
+            tuple: (previsto, repetido), em que ``repetido`` marca os candidatos
+            que já estão no arquivo (e cujo valor previsto é o guardado).
+        """
+        candidatos = np.asarray(candidatos, dtype=float)
+        k = min(self.k, self.tamanho)
+        indices = self._vizinhos(candidatos, k)
+        # Distâncias exatas só para os k escolhidos (a expansão usada na busca perde precisão perto de zero)
+        diferencas = self.pontos[indices] - candidatos[:, np.newaxis]
+        d2 = np.einsum("ijk,ijk->ij", diferencas, diferencas)
+        repetido = d2.min(axis=1) == 0.0
+        valores = self.valores[indices]
+
+        if self.modelo == "knn" or k < 2:
+            pesos = 1.0 / np.maximum(d2, np.finfo(float).tiny)
+            previsto = np.einsum("ij,ij->i", pesos, valores) / pesos.sum(axis=1)
+        else:
+            previsto = self._rbf(candidatos, indices, valores)
+        mais_proximo = np.argmin(d2, axis=1)
+        previsto[repetido] = valores[repetido, mais_proximo[repetido]]
+        return previsto, repetido
+
+    def _rbf(self, candidatos, indices, valores):
+        # Sistema [phi 1; 1' 0] [lambda; c] = [f; 0] com phi(r) = r^3, resolvido para todos os candidatos em lote
+        vizinhos = self.pontos[indices]
+        m, k = indices.shape
+        sistema = np.zeros((m, k + 1, k + 1))
+        sistema[:, :k, :k] = np.linalg.norm(vizinhos[:, :, np.newaxis] - vizinhos[:, np.newaxis], axis=-1) ** 3
+        sistema[:, :k, k] = 1.0
+        sistema[:, k, :k] = 1.0
+        lado_direito = np.zeros((m, k + 1))
+        lado_direito[:, :k] = valores
+        # pinv: vizinhos repetidos tornam o sistema singular
+        coeficientes = np.einsum("mij,mj->mi", np.linalg.pinv(sistema), lado_direito)
+        base = np.linalg.norm(candidatos[:, np.newaxis] - vizinhos, axis=-1) ** 3
+        return np.einsum("mi,mi->m", base, coeficientes[:, :k]) + coeficientes[:, k]
+
+    # ----------------------------
+    # Avaliação
+    # ----------------------------
+    def avaliar_reais(self, funcao, pontos):
+        """Avalia todos os pontos na função real e os guarda no arquivo."""
+        valores = avaliar_populacao(funcao, pontos)
+        self.avaliacoes_reais += len(valores)
+        self.registrar(pontos, valores)
+        return valores
+
+    def avaliar(self, funcao, candidatos, referencia=None, maximizar=False):
+        """
+        Avalia um lote de candidatos, enviando à função real só os mais promissores.
+
+        Parâmetros:
+            funcao (callable): Função objetivo real (como em ``avaliar_populacao``).
+            candidatos (np.ndarray): Matriz ``(n, dim)``.
+            referencia (np.ndarray | None): Fitness que cada candidato precisa
+                vencer. Candidatos não avaliados recebem um valor que não o vence.
+            maximizar (bool): Maiores valores são melhores (GA).
+
+        Retorna:
+            np.ndarray: Fitness de cada candidato (real, arquivado ou previsto).
+        """
+        if self.tamanho < max(self.minimo_arquivo, 1):
+            return self.avaliar_reais(funcao, candidatos)
+
+        previsto, repetido = self.prever(candidatos)
+        sinal = -1.0 if maximizar else 1.0
+        ganho = sinal * previsto if referencia is None else sinal * (previsto - referencia)
+        novos = np.flatnonzero(~repetido)
+        quantidade = math.ceil(self.fracao * len(novos))
+        reais = novos[np.argsort(ganho[novos], kind="stable")[:quantidade]]
+
+        valores = previsto
+        if referencia is not None:
+            # O valor previsto nunca vence a referência: o candidato conta como tentativa sem melhora
+            censurado = np.minimum(previsto, referencia) if maximizar else np.maximum(previsto, referencia)
+            valores = np.where(repetido, previsto, censurado)
+        if len(reais):
+            valores[reais] = self.avaliar_reais(funcao, candidatos[reais])
+        if referencia is None:
+            conhecidos = np.flatnonzero(repetido)
+            conhecidos = np.concatenate([conhecidos, reais])
+            melhor = valores[conhecidos].max() if maximizar else valores[conhecidos].min()
+            previstos = np.ones(len(valores), dtype=bool)
+            previstos[conhecidos] = False
+            limite = np.nextafter(melhor, -np.inf if maximizar else np.inf)
+            valores[previstos] = np.minimum(valores[previstos], limite) if maximizar else \
+                np.maximum(valores[previstos], limite)
+        self.repetidas += int(repetido.sum())
+        self.previstas += len(novos) - len(reais)
+        return valores
+
+    def estatisticas(self):
+        """Retorna as avaliações reais, as economizadas (previstas e repetidas) e o tamanho do arquivo."""
+        economizadas = self.previstas + self.repetidas
+        total = self.avaliacoes_reais + economizadas
+        return {
+            "avaliacoes_reais": self.avaliacoes_reais,
+            "economizadas": economizadas,
+            "previstas": self.previstas,
+            "repetidas": self.repetidas,
+            "taxa_economia": economizadas / total if total else 0.0,
+            "tamanho_arquivo": self.tamanho,
+        }
@@ -0,0 +1,307 @@
+"""
+Telemetria por geração com memória constante.
+
+Os otimizadores (``pso``, ``ABC.optimize`` e ``algoritmo_genetico``) aceitam um
+parâmetro ``telemetria`` e registram, a cada geração, o melhor, o pior e a
+média do fitness, a diversidade da população, avaliações por segundo e o
+tempo gasto em cada fase. Dois destinos estão disponíveis, ambos apenas de
+acréscimo e legíveis enquanto a execução ainda está em andamento:
+
+- ``TelemetriaCSV``: CSV escrito em blocos de ``tamanho_buffer`` linhas;
+  ``acompanhar_csv`` lê o arquivo como um ``tail -f``.
+- ``TelemetriaAnel``: buffer circular em um ``.npy`` mapeado em memória
+  (``np.lib.format.open_memmap``) com as últimas ``capacidade`` gerações;
+  ``ler_anel`` devolve as linhas válidas em ordem.
+
+As colunas são definidas pelo primeiro registro.
+
+Os cronômetros por fase só ficam ativos quando há telemetria ou quando um
+``CronometroFases`` é passado como ``perfil``; caso contrário os otimizadores
+usam ``CRONOMETRO_NULO``, cujas marcações não fazem nada.
+"""
+import csv
+import os
+import time
+
+import numpy as np
+
+
+class CronometroFases:
+    """
+    Acumula o tempo de cada fase de uma geração.
+
+    ``reiniciar()`` no início da geração e ``marcar(fase)`` ao fim de cada
+    fase, que soma o tempo decorrido desde a marcação anterior. ``tempos``
+    guarda a geração atual e ``acumulado`` a execução inteira.
+
+    Passado como ``perfil`` a ``pso``, ``ABC.optimize`` ou
+    ``algoritmo_genetico``, mostra onde a execução gastou o tempo:
+
+        perfil = CronometroFases()
+        pso(funcao, perfil=perfil, mostrar_prints=False)
+        print(perfil.resumo())
+    """
+
+    def __init__(self):
+        self.tempos = {}
+        self.acumulado = {}
+        self._ultimo = time.perf_counter()
+
+    def reiniciar(self):
+        for fase in self.tempos:
+            self.tempos[fase] = 0.0
+        self._ultimo = time.perf_counter()
+
+    def marcar(self, fase):
+        agora = time.perf_counter()
+        decorrido = agora - self._ultimo
+        self.tempos[fase] = self.tempos.get(fase, 0.0) + decorrido
+        self.acumulado[fase] = self.acumulado.get(fase, 0.0) + decorrido
+        self._ultimo = agora
+
+    def total(self):
+        return sum(self.tempos.values())
+
+    def colunas(self):
+        """Tempos no formato de colunas de telemetria (``tempo_<fase>``)."""
+        return {f"tempo_{fase}": tempo for fase, tempo in self.tempos.items()}
+
+    def resumo(self):
+        """Tempo total (s) e fração do tempo de cada fase na execução inteira."""
+        total = sum(self.acumulado.values())
+        return {fase: {"tempo_s": tempo, "fracao": tempo / total if total > 0 else 0.0}
+                for fase, tempo in self.acumulado.items()}
+
+
+class _CronometroNulo:
+    """Cronômetro desligado: mesma interface de ``CronometroFases``, sem custo."""
+
+    tempos = {}
+    acumulado = {}
+
+    def reiniciar(self):
+        pass
+
+    def marcar(self, fase):
+        pass
+
+    def total(self):
+        return 0.0
+
+    def colunas(self):
+        return {}
+
+    def resumo(self):
+        return {}
+
+
+CRONOMETRO_NULO = _CronometroNulo()
+
+
+def escolher_cronometro(perfil, telemetria):
+    """Cronômetro usado por um otimizador: ``perfil``, um novo se houver telemetria, ou o nulo."""
+    if perfil is not None:
+        return perfil
+    return CronometroFases() if telemetria is not None else CRONOMETRO_NULO
+
+
+def diversidade(posicoes):
+    """Distância média das posições ao centróide da população, em O(n * d)."""
+    posicoes = np.asarray(posicoes, dtype=float)
+    centroide = posicoes.mean(axis=0)
+    return float(np.sqrt(((posicoes - centroide) ** 2).sum(axis=1)).mean())
+
+
+def distancia_media_pares(posicoes):
+    """
+    Distância quadrática média entre todos os pares de indivíduos, em O(n * d).
+
+    Usa a identidade ``média_{i != j} |x_i - x_j|^2 = 2n / (n - 1) * média_i |x_i - c|^2``,
+    em que ``c`` é o centróide, e devolve a raiz desse valor (mesma unidade das
+    posições) sem calcular a matriz ``n x n`` de distâncias.
+    """
+    posicoes = np.asarray(posicoes, dtype=float)
+    n = len(posicoes)
+    if n < 2:
+        return 0.0
+    desvios = posicoes - posicoes.mean(axis=0)
+    media_quadrados = np.einsum("ij,ij->", desvios, desvios) / n
+    return float(np.sqrt(2.0 * n / (n - 1) * media_quadrados))
+
+
+def entropia_genes(populacao):
+    """
+    Entropia média (em bits) dos genes de uma população binária.
+
+    Para cada gene, ``p`` é a fração de indivíduos com o gene ligado e a
+    entropia é ``-p log2 p - (1 - p) log2 (1 - p)``: 1 quando a população está
+    dividida ao meio e 0 quando todos concordam.
+    """
+    p = np.asarray(populacao).mean(axis=0, dtype=float)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        termos = -(p * np.log2(p) + (1.0 - p) * np.log2(1.0 - p))
+    return float(np.nan_to_num(termos).mean())
+
+
+def metricas_geracao(geracao, melhor, fitness, posicoes, num_avaliacoes, cronometro, maximizar=False):
+    """
+    Monta o registro padrão de uma geração a partir do estado do otimizador.
+
+    ``maximizar`` indica que o pior indivíduo é o de menor fitness (GA).
+    Populações binárias (``dtype`` booleano) também recebem ``entropia_genes``.
+    """
+    duracao = cronometro.total()
+    registro = {
+        "geracao": geracao,
+        "melhor": float(melhor),
+        "pior": float(np.min(fitness) if maximizar else np.max(fitness)),
+        "media": float(np.mean(fitness)),
+        "diversidade": diversidade(posicoes),
+        "distancia_pares": distancia_media_pares(posicoes),
+        "avaliacoes_por_s": num_avaliacoes / duracao if duracao > 0 else float("inf"),
+    }
+    if np.asarray(posicoes).dtype == bool:
+        registro["entropia_genes"] = entropia_genes(posicoes)
+    registro.update(cronometro.colunas())
+    return registro
+
+
+class TelemetriaCSV:
+    """
+    Acrescenta os registros a um CSV, gravando a cada ``tamanho_buffer`` linhas.
+
+    Parâmetros:
+        arquivo (str): Caminho do CSV. Se já existir, as linhas são acrescentadas.
+        tamanho_buffer (int): Linhas mantidas em memória antes de cada gravação.
+    """
+
+    def __init__(self, arquivo, tamanho_buffer=100):
+        self.arquivo = arquivo
+        self.tamanho_buffer = tamanho_buffer
+        self.colunas = None
+        self._buffer = []
+
+    def registrar(self, registro):
+        if self.colunas is None:
+            self.colunas = list(registro)
+        self._buffer.append(registro)
+        if len(self._buffer) >= self.tamanho_buffer:
+            self.gravar()
+
+    def gravar(self):
+        if not self._buffer:
+            return
+        novo = not os.path.exists(self.arquivo) or os.path.getsize(self.arquivo) == 0
+        with open(self.arquivo, "a", newline="") as arquivo:
+            escritor = csv.DictWriter(arquivo, fieldnames=self.colunas, extrasaction="ignore")
+            if novo:
+                escritor.writeheader()
+            escritor.writerows(self._buffer)
+        self._buffer.clear()
+
+    def fechar(self):
+        self.gravar()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def acompanhar_csv(arquivo, intervalo=1.0, parar=None):
+    """
+    Gera os registros de um CSV de telemetria à medida que são gravados.
+
+    Parâmetros:
+        arquivo (str): CSV escrito por ``TelemetriaCSV``.
+        intervalo (float): Segundos entre verificações quando não há linhas novas.
+        parar (callable | None): Encerra a leitura quando ``parar()`` for verdadeiro
+            e não houver mais linhas.
+
+    Gera:
+        dict: Um registro por linha, com valores convertidos para ``float``.
+    """
+    while not os.path.exists(arquivo):
+        if parar is not None and parar():
+            return
+        time.sleep(intervalo)
+
+    with open(arquivo, newline="") as f:
+        colunas = None
+        pendente = ""
+        while True:
+            trecho = f.readline()
+            if not trecho:
+                if parar is not None and parar():
+                    return
+                time.sleep(intervalo)
+                continue
+            pendente += trecho
+            if not pendente.endswith("\n"):
+                continue  # linha ainda sendo escrita
+            valores = next(csv.reader([pendente]))
+            pendente = ""
+            if colunas is None:
+                colunas = valores
+                continue
+            yield {coluna: float(valor) for coluna, valor in zip(colunas, valores)}
+
+
+class TelemetriaAnel:
+    """
+    Buffer circular de registros em um ``.npy`` mapeado em memória.
+
+    O arquivo guarda um array estruturado de ``capacidade`` linhas (uma coluna
+    por métrica). Linhas ainda não escritas têm ``geracao = NaN``. Leitores
+    podem abrir o arquivo com ``ler_anel`` a qualquer momento.
+
+    Parâmetros:
+        arquivo (str): Caminho do ``.npy``.
+        capacidade (int): Número de gerações mantidas (as mais recentes).
+        intervalo_flush (int): Registros entre sincronizações com o disco.
+    """
+
+    def __init__(self, arquivo, capacidade=10_000, intervalo_flush=100):
+        self.arquivo = arquivo
+        self.capacidade = capacidade
+        self.intervalo_flush = intervalo_flush
+        self.colunas = None
+        self._dados = None
+        self._escritos = 0
+
+    def registrar(self, registro):
+        if self._dados is None:
+            self.colunas = list(registro)
+            dtype = np.dtype([(coluna, np.float64) for coluna in self.colunas])
+            self._dados = np.lib.format.open_memmap(self.arquivo, mode="w+", dtype=dtype,
+                                                    shape=(self.capacidade,))
+            self._dados["geracao"] = np.nan
+
+        indice = self._escritos % self.capacidade
+        for coluna in self.colunas:
+            self._dados[coluna][indice] = registro.get(coluna, np.nan)
+        self._escritos += 1
+        if self._escritos % self.intervalo_flush == 0:
+            self._dados.flush()
+
+    def gravar(self):
+        if self._dados is not None:
+            self._dados.flush()
+
+    def fechar(self):
+        self.gravar()
+        self._dados = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.fechar()
+
+
+def ler_anel(arquivo):
+    """Lê um ``.npy`` de ``TelemetriaAnel`` e retorna as linhas válidas em ordem de geração."""
+    dados = np.load(arquivo, mmap_mode="r")
+    validos = dados[~np.isnan(dados["geracao"])]
+    return np.sort(validos, order="geracao")
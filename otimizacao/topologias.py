@@ -0,0 +1,289 @@
+"""
+Topologias de vizinhança do PSO (lbest).
+
+Na topologia gbest (padrão de ``pso``) todas as partículas seguem o melhor
+global, o que converge rápido mas tende a colapsar o enxame cedo em
+paisagens multimodais como a de Rastrigin. Nas topologias deste módulo cada
+partícula segue o melhor pessoal da sua vizinhança (o "líder"):
+
+- ``TopologiaAnel(raio)``: as ``raio`` partículas de cada lado no anel de índices;
+- ``TopologiaVonNeumann()``: os quatro vizinhos numa grade toroidal;
+- ``TopologiaAleatoria(k)``: cada partícula informa ``k`` partículas
+  sorteadas (e a si mesma); o sorteio é refeito sempre que o melhor global
+  não melhora (como no SPSO 2011);
+- ``TopologiaEuclidiana(k)``: os ``k`` vizinhos mais próximos na posição
+  atual, recalculados a cada geração com ``IndiceGrade``.
+
+``pso(..., topologia="anel")`` aceita o nome (com os parâmetros padrão) ou
+uma instância. Os líderes de todas as partículas saem de uma única operação
+de arrays sobre a matriz de vizinhos ``(n_particulas, k)``.
+"""
+import math
+
+import numpy as np
+
+TOPOLOGIAS = ("gbest", "anel", "von_neumann", "aleatoria", "euclidiana")
+
+# Elementos (partículas x candidatos x dimensões) processados por bloco nas consultas ao índice
+_ELEMENTOS_POR_BLOCO = 1 << 22
+# Até este número de pontos a busca por força bruta (em blocos) é mais barata que a grade
+_PONTOS_FORCA_BRUTA = 2048
+# Com mais que esta fração de consultas refeitas por força bruta, a grade é abandonada por algumas gerações
+_FRACAO_INEXATA_MAXIMA = 0.5
+_GERACOES_SEM_GRADE = 10
+
+
+def lideres_fixos(vizinhos, melhores_fitness):
+    """Para cada linha da matriz de vizinhos, o índice com menor melhor fitness pessoal."""
+    return vizinhos[np.arange(len(vizinhos)), np.argmin(melhores_fitness[vizinhos], axis=1)]
+
+
+class TopologiaAnel:
+    """Anel de índices: a vizinhança de ``i`` é ``i - raio, ..., i + raio``."""
+
+    def __init__(self, raio=1):
+        self.raio = raio
+        self._vizinhos = None
+
+    def lideres(self, particulas, melhores_fitness, rng, melhorou):
+        n = len(particulas)
+        if self._vizinhos is None or len(self._vizinhos) != n:
+            deslocamentos = np.arange(-self.raio, self.raio + 1)
+            self._vizinhos = (np.arange(n)[:, np.newaxis] + deslocamentos) % n
+        return lideres_fixos(self._vizinhos, melhores_fitness)
+
+
+class TopologiaVonNeumann:
+    """
+    Grade toroidal ``linhas x colunas`` (o divisor de ``n`` mais próximo de
+    ``sqrt(n)``); cada partícula vê a si mesma e os vizinhos acima, abaixo, à
+    esquerda e à direita. Para ``n`` primo a grade é ``1 x n``.
+    """
+
+    def __init__(self):
+        self._vizinhos = None
+
+    def lideres(self, particulas, melhores_fitness, rng, melhorou):
+        n = len(particulas)
+        if self._vizinhos is None or len(self._vizinhos) != n:
+            linhas = max(d for d in range(1, math.isqrt(n) + 1) if n % d == 0)
+            colunas = n // linhas
+            linha, coluna = np.divmod(np.arange(n), colunas)
+            self._vizinhos = np.column_stack([
+                np.arange(n),
+                ((linha - 1) % linhas) * colunas + coluna,
+                ((linha + 1) % linhas) * colunas + coluna,
+                linha * colunas + (coluna - 1) % colunas,
+                linha * colunas + (coluna + 1) % colunas,
+            ])
+        return lideres_fixos(self._vizinhos, melhores_fitness)
+
+
+class TopologiaAleatoria:
+    """
+    Topologia aleatória adaptativa: cada partícula informa ``k`` partículas
+    sorteadas e a si mesma. As vizinhanças têm tamanhos diferentes (em média
+    ``k + 1``) e são sorteadas de novo quando o melhor global não melhora.
+    """
+
+    def __init__(self, k=3):
+        self.k = k
+        self.informados = None
+
+    def lideres(self, particulas, melhores_fitness, rng, melhorou):
+        n = len(particulas)
+        if self.informados is None or not melhorou:
+            self.informados = rng.integers(0, n, (n, self.k))
+        # Pares (informante -> informado), incluindo cada partícula informando a si mesma
+        informantes = np.concatenate([np.repeat(np.arange(n), self.k), np.arange(n)])
+        informados = np.concatenate([self.informados.ravel(), np.arange(n)])
+        # O primeiro par de cada informado, na ordem do fitness do informante, é o líder
+        ordem = np.lexsort((melhores_fitness[informantes], informados))
+        primeiro = np.ones(len(ordem), dtype=bool)
+        primeiro[1:] = informados[ordem[1:]] != informados[ordem[:-1]]
+        return informantes[ordem[primeiro]]
+
+    def estado(self):
+        return {} if self.informados is None else {"topologia_informados": self.informados}
+
+    def restaurar(self, estado):
+        if "topologia_informados" in estado:
+            self.informados = estado["topologia_informados"]
+
+
+class TopologiaEuclidiana:
+    """Os ``k`` vizinhos mais próximos (incluindo a própria partícula) na posição atual."""
+
+    def __init__(self, k=3):
+        self.k = k
+        self.indice = IndiceGrade()
+
+    def lideres(self, particulas, melhores_fitness, rng, melhorou):
+        self.indice.atualizar(particulas)
+        return lideres_fixos(self.indice.vizinhos_mais_proximos(min(self.k, len(particulas))), melhores_fitness)
+
+
+def criar_topologia(topologia):
+    """
+    Converte o parâmetro ``topologia`` de ``pso`` em um objeto (``None`` para gbest).
+
+    Parâmetros:
+        topologia (str | objeto | None): Um nome de ``TOPOLOGIAS`` ou um objeto
+            com o método ``lideres(particulas, melhores_fitness, rng, melhorou)``.
+    """
+    if topologia is None or topologia == "gbest":
+        return None
+    if not isinstance(topologia, str):
+        return topologia
+    construtores = {"anel": TopologiaAnel, "von_neumann": TopologiaVonNeumann, "aleatoria": TopologiaAleatoria,
+                    "euclidiana": TopologiaEuclidiana}
+    if topologia not in construtores:
+        raise ValueError(f"Topologia desconhecida: {topologia!r}. Use uma de {TOPOLOGIAS}.")
+    return construtores[topologia]()
+
+
+# ----------------------------
+# Índice espacial
+# ----------------------------
+class IndiceGrade:
+    """
+    Grade uniforme sobre as (até) duas primeiras coordenadas, para consultas
+    de k vizinhos mais próximos sem a matriz de distâncias ``n x n``.
+
+    ``atualizar`` recalcula a célula de cada ponto dentro da caixa envolvente
+    atual (com cerca de ``pontos_por_celula`` pontos por célula) e reordena os
+    pontos por célula partindo da ordem da geração anterior: como as partículas
+    se movem pouco entre gerações, a ordenação estável recebe uma sequência quase
+    ordenada. ``vizinhos_mais_proximos`` examina só a célula do ponto e as
+    vizinhas; quando o k-ésimo vizinho encontrado está mais longe que a borda
+    desse bloco de células, a consulta daquele ponto é refeita contra todos os
+    pontos, de modo que o resultado é sempre exato.
+
+    A grade só poda bem quando as duas coordenadas separam os pontos (poucas
+    dimensões ou enxame concentrado). Com até ``_PONTOS_FORCA_BRUTA`` pontos, ou
+    quando mais da metade das consultas precisou ser refeita, a busca é feita
+    direto por força bruta em blocos (a grade volta a ser tentada a cada
+    ``_GERACOES_SEM_GRADE`` consultas).
+
+    Parâmetros:
+        pontos_por_celula (int): Ocupação média desejada das células.
+    """
+
+    def __init__(self, pontos_por_celula=8):
+        self.pontos_por_celula = pontos_por_celula
+        self.ordem = None
+        self.fracao_inexata = 0.0
+        self._consultas_sem_grade = 0
+
+    def atualizar(self, pontos):
+        self.pontos = pontos
+        n, dim = pontos.shape
+        self.eixos = min(2, dim)
+        projecao = pontos[:, :self.eixos]
+        self.minimo = projecao.min(axis=0)
+        extensao = np.maximum(projecao.max(axis=0) - self.minimo, 1e-300)
+        self.celulas_por_eixo = max(1, int((n / self.pontos_por_celula) ** (1 / self.eixos)))
+        self.tamanho_celula = extensao / self.celulas_por_eixo
+
+        self.coordenadas = np.minimum(((projecao - self.minimo) / self.tamanho_celula).astype(np.int64),
+                                      self.celulas_por_eixo - 1)
+        chaves = self._chave(self.coordenadas)
+        if self.ordem is None or len(self.ordem) != n:
+            self.ordem = np.arange(n)
+        self.ordem = self.ordem[np.argsort(chaves[self.ordem], kind="stable")]
+        self.inicio = np.searchsorted(chaves[self.ordem], np.arange(self.celulas_por_eixo ** self.eixos + 1))
+
+    def _chave(self, coordenadas):
+        chave = coordenadas[..., 0]
+        if self.eixos == 2:
+            chave = chave * self.celulas_por_eixo + coordenadas[..., 1]
+        return chave
+
+    def vizinhos_mais_proximos(self, k):
+        """
+        Os ``k`` pontos mais próximos de cada ponto (incluindo o próprio).
+
+        Retorna:
+            np.ndarray: Matriz de índices ``(n, k)``, sem ordem dentro da linha.
+        """
+        n, dim = self.pontos.shape
+        if n <= _PONTOS_FORCA_BRUTA or (self.fracao_inexata > _FRACAO_INEXATA_MAXIMA
+                                        and self._consultas_sem_grade < _GERACOES_SEM_GRADE):
+            self._consultas_sem_grade += 1
+            return self._forca_bruta(np.arange(n), k)
+        self._consultas_sem_grade = 0
+
+        deslocamentos = np.stack(np.meshgrid(*[np.arange(-1, 2)] * self.eixos, indexing="ij"), axis=-1)
+        deslocamentos = deslocamentos.reshape(-1, self.eixos)
+        ocupacao = np.diff(self.inicio)
+        if self._candidatos_grade(ocupacao) > n * n // 4:
+            # Enxame aglomerado em poucas células: a grade examinaria quase todos os pares
+            return self._forca_bruta(np.arange(n), k)
+        resultado = np.empty((n, k), dtype=np.int64)
+        inexatos = []
+
+        # Pontos processados em blocos, na ordem das células (consultas vizinhas tocam as mesmas células)
+        tamanho_bloco = max(1, _ELEMENTOS_POR_BLOCO // (len(deslocamentos) * int(ocupacao.max()) * dim))
+        for inicio_bloco in range(0, n, tamanho_bloco):
+            pontos_bloco = self.ordem[inicio_bloco:inicio_bloco + tamanho_bloco]
+            celulas = self.coordenadas[pontos_bloco][:, np.newaxis, :] + deslocamentos
+            valida = np.all((celulas >= 0) & (celulas < self.celulas_por_eixo), axis=2)
+            chaves = np.where(valida, self._chave(np.clip(celulas, 0, self.celulas_por_eixo - 1)), 0)
+            quantidade = np.where(valida, ocupacao[chaves], 0)
+            # O preenchimento segue a célula mais cheia do bloco, não a da grade inteira (enxames aglomerados)
+            ocupacao_maxima = int(quantidade.max())
+
+            # Candidatos: até ocupacao_maxima pontos de cada célula do bloco 3 x 3
+            posicao = np.arange(ocupacao_maxima)
+            presente = posicao < quantidade[..., np.newaxis]
+            candidatos = self.ordem[np.minimum(self.inicio[chaves][..., np.newaxis] + posicao, n - 1)]
+            candidatos = candidatos.reshape(len(pontos_bloco), -1)
+            presente = presente.reshape(len(pontos_bloco), -1)
+
+            diferencas = self.pontos[candidatos] - self.pontos[pontos_bloco][:, np.newaxis, :]
+            distancias = np.where(presente, np.einsum("ijk,ijk->ij", diferencas, diferencas), np.inf)
+            mais_proximos = np.argpartition(distancias, k - 1, axis=1)[:, :k]
+            resultado[pontos_bloco] = np.take_along_axis(candidatos, mais_proximos, axis=1)
+            raio = np.sqrt(np.take_along_axis(distancias, mais_proximos, axis=1).max(axis=1))
+            inexatos.append(pontos_bloco[~(raio <= self._margem(pontos_bloco))])
+
+        inexatos = np.concatenate(inexatos)
+        self.fracao_inexata = len(inexatos) / n
+        if len(inexatos):
+            resultado[inexatos] = self._forca_bruta(inexatos, k)
+        return resultado
+
+    def _candidatos_grade(self, ocupacao):
+        # Total de pares (ponto, candidato) examinados: ocupação de cada célula vezes a do seu bloco 3 x 3
+        grade = ocupacao.reshape((self.celulas_por_eixo,) * self.eixos)
+        bloco = np.pad(grade, 1)
+        for eixo in range(self.eixos):
+            bloco = sum(np.take(bloco, range(inicio, inicio + self.celulas_por_eixo), axis=eixo)
+                        for inicio in range(3))
+        return int(np.sum(grade * bloco))
+
+    def _margem(self, indices):
+        # Distância (na projeção) até a borda do bloco 3 x 3; bordas da grade não têm pontos além delas
+        coordenadas = self.coordenadas[indices]
+        projecao = self.pontos[indices, :self.eixos]
+        inferior = self.minimo + (coordenadas - 1) * self.tamanho_celula
+        superior = self.minimo + (coordenadas + 2) * self.tamanho_celula
+        margem_inferior = np.where(coordenadas - 1 < 0, np.inf, projecao - inferior)
+        margem_superior = np.where(coordenadas + 2 > self.celulas_por_eixo, np.inf, superior - projecao)
+        return np.minimum(margem_inferior, margem_superior).min(axis=1)
+
+    def _forca_bruta(self, indices, k):
+        n, dim = self.pontos.shape
+        # |a|^2 - 2a.b + |b|^2 sobre os pontos centrados na média: sem o centro, um enxame convergido longe da
+        # origem perde toda a precisão (as distâncias somem diante de |a|^2)
+        pontos = self.pontos - self.pontos.mean(axis=0)
+        quadrados = np.einsum("ij,ij->i", pontos, pontos)
+        resultado = np.empty((len(indices), k), dtype=np.int64)
+        tamanho_bloco = max(1, _ELEMENTOS_POR_BLOCO // n)
+        for inicio in range(0, len(indices), tamanho_bloco):
+            bloco = indices[inicio:inicio + tamanho_bloco]
+            distancias = quadrados[bloco][:, np.newaxis] - 2.0 * pontos[bloco] @ pontos.T + quadrados
+            # O próprio ponto sempre faz parte da vizinhança, mesmo com o arredondamento da expansão
+            distancias[np.arange(len(bloco)), bloco] = -np.inf
+            resultado[inicio:inicio + len(bloco)] = np.argpartition(distancias, k - 1, axis=1)[:, :k]
+        return resultado
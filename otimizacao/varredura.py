@@ -0,0 +1,415 @@
+"""
+Varreduras de hiperparâmetros e execuções repetidas com sementes independentes.
+
+Uma varredura é descrita por um algoritmo (``pso``, ``abc`` ou ``ga``) e um
+espaço de parâmetros, explorado em grade (produto cartesiano) ou por busca
+aleatória. Cada configuração é repetida ``repeticoes`` vezes; cada execução
+recebe um gerador derivado de ``np.random.SeedSequence(semente).spawn``, de
+modo que as execuções são estatisticamente independentes e reprodutíveis.
+
+As execuções são distribuídas em um ``ProcessPoolExecutor``. Execuções de PSO
+com enxames pequenos sobre a mesma função são empilhadas em um único array
+(``pso_empilhado``), compartilhando as operações NumPy. Cada execução
+concluída é acrescentada ao CSV de resultados, que serve de checkpoint: ao
+rodar a mesma varredura de novo, as execuções já gravadas são puladas. O CSV
+guarda a semente raiz e os campos de cada execução; um arquivo gravado por
+outra varredura é recusado em vez de ser retomado.
+
+Uso:
+    python -m otimizacao.varredura pso --espaco '{"w": [0.4, 0.7], "c1": [1, 2]}' \
+        --repeticoes 30 --saida pso.csv
+"""
+import argparse
+import csv
+import itertools
+import json
+import math
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+
+from otimizacao.abelhas import ABC
+from otimizacao.avaliacao import AvaliadorSerial
+from otimizacao.benchmark import instancia_mochila
+from otimizacao.genetico import algoritmo_genetico
+from otimizacao.objetivos import FUNCOES_TESTE
+from otimizacao.pso import pso, pso_empilhado
+
+# Parâmetros de cada algoritmo e seus valores padrão. "funcao", "dim",
+# "populacao" e "geracoes" também podem variar no espaço de busca.
+PADROES = {
+    "pso": {"funcao": "rastrigin", "dim": 2, "populacao": 30, "geracoes": 100, "w": 0.5, "c1": 1.0, "c2": 2.0},
+    "abc": {"funcao": "rastrigin", "dim": 2, "populacao": 30, "geracoes": 100, "limite_abandono": None},
+    "ga": {"funcao": "mochila", "dim": 50, "populacao": 100, "geracoes": 40, "taxa_mutacao": 0.8,
+           "num_elitismo": 2, "tamanho_torneio": 3, "instancia": 0},
+}
+COLUNAS = ["id", "algoritmo", "configuracao", "repeticao", "semente", "funcao", "dim", "populacao", "geracoes",
+           "parametros", "fitness_final", "tempo_s", "avaliacoes", "empilhada"]
+# Colunas que identificam uma execução; ao retomar, devem coincidir com as da varredura planejada
+_COLUNAS_ESPECIFICACAO = ["algoritmo", "configuracao", "repeticao", "semente", "funcao", "dim", "populacao",
+                          "geracoes", "parametros"]
+
+
+# ----------------------------
+# Espaço de busca
+# ----------------------------
+def grade_parametros(espaco):
+    """
+    Produto cartesiano de um espaço ``{parametro: [valores]}``.
+
+    Retorna:
+        list of dict: Uma configuração por combinação.
+    """
+    for nome, valores in espaco.items():
+        if not isinstance(valores, list):
+            raise ValueError(f"Na grade, '{nome}' deve ser uma lista de valores.")
+    nomes = list(espaco)
+    return [dict(zip(nomes, combinacao)) for combinacao in itertools.product(*espaco.values())]
+
+
+def busca_aleatoria(espaco, num_amostras, rng):
+    """
+    Sorteia ``num_amostras`` configurações de um espaço de busca.
+
+    Cada parâmetro é uma lista (sorteio uniforme entre os valores) ou uma tupla
+    ``(minimo, maximo)`` (uniforme contínuo, ou inteiro se ambos forem ``int``).
+    """
+    configuracoes = [{} for _ in range(num_amostras)]
+    for nome, valores in espaco.items():
+        if isinstance(valores, list):
+            sorteados = [valores[i] for i in rng.integers(0, len(valores), num_amostras)]
+        elif isinstance(valores, tuple) and len(valores) == 2:
+            minimo, maximo = valores
+            if isinstance(minimo, int) and isinstance(maximo, int):
+                sorteados = rng.integers(minimo, maximo, num_amostras, endpoint=True).tolist()
+            else:
+                sorteados = rng.uniform(minimo, maximo, num_amostras).tolist()
+        else:
+            raise ValueError(f"'{nome}' deve ser uma lista de valores ou uma tupla (minimo, maximo).")
+        for configuracao, valor in zip(configuracoes, sorteados):
+            configuracao[nome] = valor
+    return configuracoes
+
+
+def planejar_execucoes(algoritmo, espaco, repeticoes=10, semente=0, busca="grade", num_amostras=None):
+    """
+    Expande uma varredura na lista de execuções.
+
+    Parâmetros:
+        algoritmo (str): ``"pso"``, ``"abc"`` ou ``"ga"``.
+        espaco (dict): Valores de cada parâmetro (ver ``grade_parametros`` e
+            ``busca_aleatoria``); os ausentes usam ``PADROES[algoritmo]``.
+        repeticoes (int): Execuções independentes por configuração.
+        semente (int): Semente raiz da varredura.
+        busca (str): ``"grade"`` ou ``"aleatoria"``.
+        num_amostras (int | None): Configurações sorteadas na busca aleatória.
+
+    Retorna:
+        list of dict: Execuções com ``id``, parâmetros completos e uma
+        ``np.random.SeedSequence`` própria.
+    """
+    if algoritmo not in PADROES:
+        raise ValueError(f"Algoritmo desconhecido: {algoritmo!r}. Use um de {tuple(PADROES)}.")
+    desconhecidos = set(espaco) - set(PADROES[algoritmo])
+    if desconhecidos:
+        raise ValueError(f"Parâmetros desconhecidos para {algoritmo}: {sorted(desconhecidos)}")
+
+    sequencia_amostras, sequencia_execucoes = np.random.SeedSequence(semente).spawn(2)
+    if busca == "grade":
+        configuracoes = grade_parametros(espaco)
+    elif busca == "aleatoria":
+        if num_amostras is None:
+            raise ValueError("A busca aleatória exige num_amostras.")
+        configuracoes = busca_aleatoria(espaco, num_amostras, np.random.default_rng(sequencia_amostras))
+    else:
+        raise ValueError("busca deve ser 'grade' ou 'aleatoria'.")
+
+    sementes = sequencia_execucoes.spawn(len(configuracoes) * repeticoes)
+    execucoes = []
+    for indice, configuracao in enumerate(configuracoes):
+        completa = {**PADROES[algoritmo], **configuracao}
+        for repeticao in range(repeticoes):
+            execucoes.append({
+                "id": len(execucoes),
+                "algoritmo": algoritmo,
+                "configuracao": indice,
+                "repeticao": repeticao,
+                "semente": sementes[len(execucoes)],
+                **completa,
+            })
+    return execucoes
+
+
+# ----------------------------
+# Execução
+# ----------------------------
+def _parametros(execucao):
+    estruturais = {"funcao", "dim", "populacao", "geracoes"}
+    return {nome: execucao[nome] for nome in PADROES[execucao["algoritmo"]] if nome not in estruturais}
+
+
+def _linha(execucao, fitness, tempo, avaliacoes, empilhada=False):
+    return {
+        "id": execucao["id"],
+        "algoritmo": execucao["algoritmo"],
+        "configuracao": execucao["configuracao"],
+        "repeticao": execucao["repeticao"],
+        # Semente raiz da varredura (a de cada execução é derivada dela e do id)
+        "semente": execucao["semente"].entropy,
+        "funcao": execucao["funcao"],
+        "dim": execucao["dim"],
+        "populacao": execucao["populacao"],
+        "geracoes": execucao["geracoes"],
+        "parametros": json.dumps(_parametros(execucao), sort_keys=True),
+        "fitness_final": float(fitness),
+        "tempo_s": tempo,
+        "avaliacoes": avaliacoes,
+        "empilhada": empilhada,
+    }
+
+
+def executar_execucao(execucao):
+    """Executa uma única execução planejada e retorna sua linha de resultados."""
+    rng = np.random.default_rng(execucao["semente"])
+    algoritmo, dim, populacao, geracoes = (execucao[c] for c in ("algoritmo", "dim", "populacao", "geracoes"))
+    inicio = time.perf_counter()
+
+    if algoritmo == "ga":
+        pesos, valores, capacidade = instancia_mochila(dim, execucao["instancia"])
+        _, fitness, _, _ = algoritmo_genetico(
+            pesos, valores, capacidade, tamanho_populacao=populacao, taxa_mutacao=execucao["taxa_mutacao"],
+            geracoes=geracoes, num_elitismo=execucao["num_elitismo"],
+            tamanho_torneio=execucao["tamanho_torneio"], semente=rng, guardar_historico=False)
+        avaliacoes = populacao * (geracoes + 1)
+    else:
+        objetivo, limites, _ = FUNCOES_TESTE[execucao["funcao"]]
+        contador = AvaliadorSerial(objetivo)
+        if algoritmo == "pso":
+            _, fitness, _, _ = pso(contador, dimensao=dim, num_particulas=populacao, num_iteracoes=geracoes,
+                                   w=execucao["w"], c1=execucao["c1"], c2=execucao["c2"], limites=limites,
+                                   semente=rng, mostrar_prints=False, guardar_historico=False)
+        else:
+            _, fitness, _, _ = ABC(contador, num_bees=populacao, max_iter=geracoes, dim=dim, lim_inf=limites[0],
+                                   lim_sup=limites[1], limite_abandono=execucao["limite_abandono"],
+                                   semente=rng).optimize(guardar_historico=False)
+        avaliacoes = contador.num_avaliacoes
+
+    return _linha(execucao, fitness, time.perf_counter() - inicio, avaliacoes)
+
+
+def executar_empilhadas(execucoes):
+    """
+    Executa várias execuções de PSO de mesma função, dimensão, população e
+    número de gerações como um único enxame empilhado.
+    """
+    primeira = execucoes[0]
+    objetivo, limites, _ = FUNCOES_TESTE[primeira["funcao"]]
+    inicio = time.perf_counter()
+    _, melhores = pso_empilhado(
+        objetivo, [np.random.default_rng(e["semente"]) for e in execucoes], dimensao=primeira["dim"],
+        num_particulas=primeira["populacao"], num_iteracoes=primeira["geracoes"],
+        w=[e["w"] for e in execucoes], c1=[e["c1"] for e in execucoes], c2=[e["c2"] for e in execucoes],
+        limites=limites)
+    # O tempo do lote é dividido igualmente entre as execuções empilhadas
+    tempo = (time.perf_counter() - inicio) / len(execucoes)
+    avaliacoes = primeira["populacao"] * (primeira["geracoes"] + 1)
+    return [_linha(e, fitness, tempo, avaliacoes, empilhada=True) for e, fitness in zip(execucoes, melhores)]
+
+
+def _executar_lote(lote):
+    if len(lote) > 1:
+        return executar_empilhadas(lote)
+    return [executar_execucao(lote[0])]
+
+
+def agrupar_em_lotes(execucoes, empilhar_ate=64, max_empilhadas=32):
+    """
+    Agrupa execuções de PSO com enxames de até ``empilhar_ate`` partículas e
+    mesma função/dimensão/população/gerações em lotes empilhados de até
+    ``max_empilhadas`` execuções; as demais formam lotes unitários.
+    """
+    grupos = {}
+    lotes = []
+    for execucao in execucoes:
+        if execucao["algoritmo"] == "pso" and execucao["populacao"] <= empilhar_ate and max_empilhadas > 1:
+            chave = (execucao["funcao"], execucao["dim"], execucao["populacao"], execucao["geracoes"])
+            grupos.setdefault(chave, []).append(execucao)
+        else:
+            lotes.append([execucao])
+    for grupo in grupos.values():
+        lotes.extend(grupo[i:i + max_empilhadas] for i in range(0, len(grupo), max_empilhadas))
+    return lotes
+
+
+# ----------------------------
+# Tabela de resultados (checkpoint)
+# ----------------------------
+def carregar_resultados(arquivo):
+    """Lê o CSV de resultados de uma varredura (lista de dicts com tipos restaurados)."""
+    if not os.path.exists(arquivo):
+        return []
+    with open(arquivo, newline="") as f:
+        linhas = list(csv.DictReader(f))
+    for linha in linhas:
+        for coluna in ("id", "configuracao", "repeticao", "semente", "dim", "populacao", "geracoes", "avaliacoes"):
+            if coluna in linha:
+                linha[coluna] = int(linha[coluna])
+        for coluna in ("fitness_final", "tempo_s"):
+            linha[coluna] = float(linha[coluna])
+        linha["empilhada"] = linha["empilhada"] == "True"
+    return linhas
+
+
+def _conferir_checkpoint(concluidas, execucoes):
+    # Cada linha gravada precisa descrever a mesma execução planejada: semente raiz, campos estruturais e parâmetros
+    por_id = {execucao["id"]: execucao for execucao in execucoes}
+    for linha in concluidas:
+        execucao = por_id.get(linha["id"])
+        if execucao is None:
+            raise ValueError("O arquivo de resultados pertence a outra varredura; use outro arquivo de saída.")
+        esperada = _linha(execucao, math.nan, 0.0, 0)
+        diferentes = [coluna for coluna in _COLUNAS_ESPECIFICACAO if linha.get(coluna) != esperada[coluna]]
+        if diferentes:
+            raise ValueError(f"O arquivo de resultados pertence a outra varredura (difere em {', '.join(diferentes)}); "
+                             "use outro arquivo de saída.")
+
+
+def executar_varredura(execucoes, arquivo=None, num_trabalhadores=None, empilhar_ate=64, max_empilhadas=32,
+                       mostrar_prints=True):
+    """
+    Executa as execuções planejadas e grava cada uma ao concluir.
+
+    Parâmetros:
+        execucoes (list of dict): Saída de ``planejar_execucoes``.
+        arquivo (str | None): CSV de resultados. Execuções já presentes no
+            arquivo são puladas, o que permite retomar uma varredura
+            interrompida.
+        num_trabalhadores (int | None): Processos do pool (padrão: número de
+            CPUs); com 1, roda no processo atual.
+        empilhar_ate, max_empilhadas (int): Ver ``agrupar_em_lotes``; use
+            ``max_empilhadas=1`` para desativar o empilhamento.
+        mostrar_prints (bool): Imprime o progresso.
+
+    Retorna:
+        list of dict: Tabela de resultados completa, ordenada por ``id``.
+    """
+    concluidas = carregar_resultados(arquivo) if arquivo else []
+    _conferir_checkpoint(concluidas, execucoes)
+    feitas = {linha["id"] for linha in concluidas}
+    pendentes = [execucao for execucao in execucoes if execucao["id"] not in feitas]
+    if mostrar_prints and feitas:
+        print(f"Retomando: {len(feitas)} execuções já concluídas, {len(pendentes)} pendentes.")
+
+    lotes = agrupar_em_lotes(pendentes, empilhar_ate, max_empilhadas)
+    resultados = list(concluidas)
+    saida = None
+    if arquivo:
+        novo = not os.path.exists(arquivo) or os.path.getsize(arquivo) == 0
+        saida = open(arquivo, "a", newline="")
+        escritor = csv.DictWriter(saida, fieldnames=COLUNAS)
+        if novo:
+            escritor.writeheader()
+
+    def registrar(linhas):
+        resultados.extend(linhas)
+        if saida is not None:
+            escritor.writerows(linhas)
+            saida.flush()
+        if mostrar_prints:
+            print(f"[{len(resultados)}/{len(execucoes)}] " + ", ".join(
+                f"#{linha['id']} fitness={linha['fitness_final']:.6g}" for linha in linhas[:3])
+                + (" ..." if len(linhas) > 3 else ""))
+
+    try:
+        if num_trabalhadores == 1:
+            for lote in lotes:
+                registrar(_executar_lote(lote))
+        elif lotes:
+            with ProcessPoolExecutor(max_workers=num_trabalhadores) as executor:
+                for futuro in as_completed([executor.submit(_executar_lote, lote) for lote in lotes]):
+                    registrar(futuro.result())
+    finally:
+        if saida is not None:
+            saida.close()
+
+    return sorted(resultados, key=lambda linha: linha["id"])
+
+
+def resumir(resultados):
+    """
+    Estatísticas do fitness final por configuração.
+
+    Retorna:
+        list of dict: ``configuracao``, ``parametros``, ``n``, ``media``,
+        ``desvio``, ``mediana``, ``melhor`` e ``pior`` (melhor/pior pelo valor
+        numérico: o GA maximiza, os demais minimizam).
+    """
+    grupos = {}
+    for linha in resultados:
+        grupos.setdefault((linha["configuracao"], linha["funcao"], linha["dim"], linha["populacao"],
+                           linha["geracoes"], linha["parametros"]), []).append(linha)
+    resumo = []
+    for (configuracao, funcao, dim, populacao, geracoes, parametros), linhas in sorted(grupos.items()):
+        fitness = np.array([linha["fitness_final"] for linha in linhas])
+        maximizar = linhas[0]["algoritmo"] == "ga"
+        resumo.append({
+            "configuracao": configuracao,
+            "funcao": funcao,
+            "dim": dim,
+            "populacao": populacao,
+            "geracoes": geracoes,
+            "parametros": parametros,
+            "n": len(fitness),
+            "media": float(fitness.mean()),
+            "desvio": float(fitness.std(ddof=1)) if len(fitness) > 1 else 0.0,
+            "mediana": float(np.median(fitness)),
+            "melhor": float(fitness.max() if maximizar else fitness.min()),
+            "pior": float(fitness.min() if maximizar else fitness.max()),
+        })
+    return resumo
+
+
+def _espaco_json(texto):
+    # Listas JSON viram listas de valores; {"min": a, "max": b} vira a tupla (a, b) da busca aleatória
+    espaco = json.loads(texto)
+    return {nome: (valor["min"], valor["max"]) if isinstance(valor, dict) else valor
+            for nome, valor in espaco.items()}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog="python -m otimizacao.varredura", description=__doc__.split("\n\n")[0])
+    parser.add_argument("algoritmo", choices=tuple(PADROES))
+    parser.add_argument("--espaco", type=_espaco_json, default={},
+                        help='JSON, ex.: \'{"w": [0.4, 0.7], "c1": {"min": 0.5, "max": 2.5}}\'')
+    parser.add_argument("--busca", choices=("grade", "aleatoria"), default="grade")
+    parser.add_argument("--amostras", type=int, default=None)
+    parser.add_argument("--repeticoes", type=int, default=10)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--trabalhadores", type=int, default=None)
+    parser.add_argument("--max-empilhadas", type=int, default=32)
+    parser.add_argument("--saida", help="CSV de resultados (também usado para retomar a varredura).")
+    parser.add_argument("--relatorio", metavar="PASTA", help="Grava o relatório HTML/PNG da varredura nesta pasta.")
+    args = parser.parse_args(argv)
+
+    execucoes = planejar_execucoes(args.algoritmo, args.espaco, repeticoes=args.repeticoes, semente=args.semente,
+                                   busca=args.busca, num_amostras=args.amostras)
+    resultados = executar_varredura(execucoes, args.saida, num_trabalhadores=args.trabalhadores,
+                                    max_empilhadas=args.max_empilhadas)
+
+    print(f"\n{'config':>6} {'n':>4} {'média':>12} {'desvio':>12} {'melhor':>12}  parâmetros")
+    for linha in resumir(resultados):
+        print(f"{linha['configuracao']:>6} {linha['n']:>4} {linha['media']:>12.6g} {linha['desvio']:>12.6g} "
+              f"{linha['melhor']:>12.6g}  {linha['funcao']} dim={linha['dim']} pop={linha['populacao']} "
+              f"{linha['parametros']}")
+
+    if args.relatorio:
+        from otimizacao.relatorio import relatorio_varredura
+        print("Relatório:", relatorio_varredura(resultados, args.relatorio, num_trabalhadores=args.trabalhadores))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,48 @@
+"""Casos de borda dos otimizadores ``ask``/``tell``."""
+import asyncio
+
+import numpy as np
+import pytest
+
+from otimizacao.assincrono import ABCAssincrono, GAAssincrono, otimizar_assincrono
+from otimizacao.objetivos import rastrigin
+
+
+def test_ga_exige_dois_individuos():
+    with pytest.raises(ValueError):
+        GAAssincrono(n_itens=10, tamanho_populacao=1)
+
+
+def test_abc_primeiro_fitness_infinito():
+    otimizador = ABCAssincrono(num_bees=4, dim=3, semente=0)
+    ids, candidatos = otimizador.ask(1)
+    otimizador.tell(ids, [np.inf])
+    np.testing.assert_array_equal(otimizador.best_position, candidatos[0])
+    # O próximo ask já gera vizinhos a partir de best_position
+    ids, candidatos = otimizador.ask(4)
+    otimizador.tell(ids, rastrigin(candidatos))
+    ids, candidatos = otimizador.ask(2)
+    assert len(ids) == 2 and np.isfinite(candidatos).all()
+
+
+def test_abc_descarta_resposta_de_fonte_reiniciada():
+    otimizador = ABCAssincrono(num_bees=1, dim=2, limite_abandono=0, semente=0)
+    ids, _ = otimizador.ask(1)
+    otimizador.tell(ids, [1.0])
+    # Dois vizinhos da mesma fonte em voo; o primeiro (sem melhora) faz a fonte ser abandonada
+    ids, _ = otimizador.ask(2)
+    otimizador.tell(ids[:1], [5.0])
+    reiniciada = otimizador.food_sources[0].copy()
+    ids_reavaliacao, _ = otimizador.ask(1)
+    otimizador.tell(ids_reavaliacao, [3.0])
+    # A resposta atrasada do segundo vizinho (gerado da fonte antiga) não substitui a fonte nova
+    otimizador.tell(ids[1:], [0.5])
+    np.testing.assert_array_equal(otimizador.food_sources[0], reiniciada)
+    assert otimizador.fitness_values[0] == 3.0
+    assert otimizador.best_fitness == 0.5
+
+
+def test_ga_usa_todo_o_orcamento():
+    otimizador = GAAssincrono(n_itens=8, tamanho_populacao=2, semente=0)
+    asyncio.run(otimizar_assincrono(otimizador, lambda x: float(x.sum()), num_avaliacoes=50, em_voo=4))
+    assert otimizador.num_avaliacoes == 50
@@ -0,0 +1,35 @@
+"""
+Cache de fitness no GA: o cache não muda o resultado e só as avaliações
+reais entram na contagem.
+"""
+import numpy as np
+
+from otimizacao.benchmark import instancia_mochila
+from otimizacao.genetico import algoritmo_genetico
+from otimizacao.parada import CriteriosParada
+
+
+def _ga(**opcoes):
+    pesos, valores, capacidade = instancia_mochila(30, 2)
+    return algoritmo_genetico(pesos, valores, capacidade, tamanho_populacao=20, geracoes=30, semente=2, **opcoes)
+
+
+def test_cache_no_fitness_padrao(capsys):
+    sem_cache = _ga(mostrar_prints=False)
+    com_cache = _ga(capacidade_cache=1_000, mostrar_prints=True)
+
+    np.testing.assert_array_equal(com_cache[0], sem_cache[0])
+    assert com_cache[1] == sem_cache[1]
+    assert com_cache[2] == sem_cache[2]
+    assert "| cache:" in capsys.readouterr().out
+
+
+def test_acertos_do_cache_nao_gastam_orcamento():
+    sem_cache = CriteriosParada(max_avaliacoes=300)
+    _ga(parada=sem_cache, mostrar_prints=False)
+    com_cache = CriteriosParada(max_avaliacoes=300)
+    _ga(parada=com_cache, capacidade_cache=1_000, mostrar_prints=False)
+
+    # Com o mesmo orçamento, os indivíduos repetidos deixam o GA com cache ir mais longe
+    assert sem_cache.motivo == com_cache.motivo == "max_avaliacoes"
+    assert com_cache.geracao > sem_cache.geracao
@@ -0,0 +1,114 @@
+"""
+Retomada de checkpoints: interromper e retomar uma execução deve produzir o
+mesmo resultado que uma execução sem interrupção.
+"""
+import numpy as np
+import pytest
+
+from otimizacao.abelhas import ABC
+from otimizacao.avaliacao import AvaliadorSerial
+from otimizacao.benchmark import instancia_mochila
+from otimizacao.checkpoint import Checkpoint
+from otimizacao.genetico import algoritmo_genetico
+from otimizacao.objetivos import rastrigin
+from otimizacao.parada import CriteriosParada
+from otimizacao.pso import pso
+from otimizacao.substituto import Substituto
+
+
+def _pso(geracoes, **opcoes):
+    return pso(rastrigin, dimensao=5, num_particulas=20, num_iteracoes=geracoes, limites=(-5.12, 5.12), semente=3,
+               mostrar_prints=False, **opcoes)
+
+
+@pytest.mark.parametrize("topologia", ["gbest", "anel", "von_neumann", "aleatoria", "euclidiana"])
+def test_pso_retomado_igual_ao_continuo(tmp_path, topologia):
+    continuo = _pso(40, topologia=topologia)
+
+    # A primeira execução grava o checkpoint ao final da geração 15; a segunda retoma dele
+    arquivo = str(tmp_path / "pso.npz")
+    _pso(15, topologia=topologia, checkpoint=Checkpoint(arquivo))
+    retomado = _pso(40, topologia=topologia, checkpoint=Checkpoint(arquivo))
+
+    np.testing.assert_array_equal(retomado[0], continuo[0])
+    assert retomado[1] == continuo[1]
+    assert retomado[2] == continuo[2]
+
+
+def _abc(geracoes, substituto=None, **opcoes):
+    return ABC(rastrigin, num_bees=10, max_iter=geracoes, dim=4, semente=5, substituto=substituto).optimize(**opcoes)
+
+
+def _ga(geracoes, **opcoes):
+    pesos, valores, capacidade = instancia_mochila(30, 2)
+    return algoritmo_genetico(pesos, valores, capacidade, tamanho_populacao=20, geracoes=geracoes, semente=2,
+                              **opcoes)
+
+
+@pytest.mark.parametrize("executar, criterios", [
+    (_pso, {"max_avaliacoes": 700}),
+    (_pso, {"estagnacao": 8}),
+    (_abc, {"max_avaliacoes": 650}),
+    (_ga, {"estagnacao": 12}),
+])
+def test_parada_retomada_continua_os_orcamentos(tmp_path, executar, criterios):
+    continua = CriteriosParada(**criterios)
+    esperado = executar(200, parada=continua)
+    assert continua.motivo is not None
+
+    # Interrompe antes da parada; a execução retomada precisa parar na mesma geração
+    arquivo = str(tmp_path / "estado.npz")
+    executar(continua.geracao - 3, parada=CriteriosParada(**criterios), checkpoint=Checkpoint(arquivo))
+    retomada = CriteriosParada(**criterios)
+    obtido = executar(200, parada=retomada, checkpoint=Checkpoint(arquivo))
+
+    assert (retomada.motivo, retomada.geracao) == (continua.motivo, continua.geracao)
+    assert retomada.num_avaliacoes == continua.num_avaliacoes
+    np.testing.assert_array_equal(obtido[0], esperado[0])
+    assert obtido[1] == esperado[1]
+
+
+def test_abc_retomado_nao_reavalia_colonia_inicial(tmp_path):
+    arquivo = str(tmp_path / "abc.npz")
+    antes = AvaliadorSerial(rastrigin)
+    ABC(antes, num_bees=10, max_iter=15, dim=4, semente=5).optimize(checkpoint=Checkpoint(arquivo))
+    depois = AvaliadorSerial(rastrigin)
+    retomado = ABC(depois, num_bees=10, max_iter=40, dim=4, semente=5).optimize(checkpoint=Checkpoint(arquivo))
+    total = AvaliadorSerial(rastrigin)
+    continuo = ABC(total, num_bees=10, max_iter=40, dim=4, semente=5).optimize()
+
+    # A colônia inicial é avaliada uma única vez, na primeira execução
+    assert antes.num_avaliacoes + depois.num_avaliacoes == total.num_avaliacoes
+    np.testing.assert_array_equal(retomado[0], continuo[0])
+    assert retomado[2] == continuo[2]
+
+
+@pytest.mark.parametrize("executar", [_pso, _abc, _ga])
+def test_substituto_retomado_igual_ao_continuo(tmp_path, executar):
+    substituto = Substituto(fracao=0.4, capacidade_arquivo=150)
+    continuo = executar(60, substituto=substituto)
+
+    arquivo = str(tmp_path / "estado.npz")
+    executar(20, substituto=Substituto(fracao=0.4, capacidade_arquivo=150), checkpoint=Checkpoint(arquivo))
+    substituto_retomado = Substituto(fracao=0.4, capacidade_arquivo=150)
+    retomado = executar(60, substituto=substituto_retomado, checkpoint=Checkpoint(arquivo))
+
+    for valor_continuo, valor_retomado in zip(continuo, retomado):
+        np.testing.assert_array_equal(valor_retomado, valor_continuo)
+    assert substituto_retomado.estatisticas() == substituto.estatisticas()
+
+
+@pytest.mark.parametrize("executar", [_pso, _abc, _ga])
+def test_parada_gravada_nao_continua_ao_retomar(tmp_path, executar):
+    arquivo = str(tmp_path / "estado.npz")
+    primeira = CriteriosParada(estagnacao=3)
+    esperado = executar(200, parada=primeira, checkpoint=Checkpoint(arquivo))
+    assert primeira.motivo == "estagnacao"
+
+    # Rodar o mesmo comando de novo devolve o resultado gravado, sem novas gerações
+    segunda = CriteriosParada(estagnacao=3)
+    obtido = executar(200, parada=segunda, checkpoint=Checkpoint(arquivo))
+    assert (segunda.motivo, segunda.geracao) == (primeira.motivo, primeira.geracao)
+    assert segunda.num_avaliacoes == primeira.num_avaliacoes
+    for valor_esperado, valor in zip(esperado, obtido):
+        np.testing.assert_array_equal(valor, valor_esperado)
@@ -0,0 +1,69 @@
+"""
+Paridade entre o caminho NumPy e os núcleos de ``otimizacao.compilado``.
+
+Para a mesma semente, os núcleos sorteiam os mesmos números na mesma ordem do
+caminho NumPy: o GA precisa ser idêntico e o PSO e o ABC só podem diferir no
+arredondamento do seno e do cosseno compilados.
+"""
+import numpy as np
+import pytest
+
+from otimizacao import compilado
+from otimizacao.abelhas import ABC
+from otimizacao.benchmark import instancia_mochila
+from otimizacao.genetico import algoritmo_genetico
+from otimizacao.objetivos import FUNCOES_TESTE, rastrigin, schaffer_n2
+from otimizacao.pso import pso
+
+CASOS = [("pso", "rastrigin", 10), ("pso", "schaffer_n2", 2), ("abc", "rastrigin", 10), ("abc", "schaffer_n2", 2),
+         ("ga", "mochila", 50)]
+TOLERANCIA = 1e-9
+
+exige_numba = pytest.mark.skipif(not compilado.NUMBA_DISPONIVEL, reason="numba não está instalado")
+
+
+def _executar(algoritmo, funcao, dim, nucleo, populacao=40, geracoes=30, semente=7):
+    if algoritmo == "ga":
+        pesos, valores, capacidade = instancia_mochila(dim, semente)
+        return algoritmo_genetico(pesos, valores, capacidade, tamanho_populacao=populacao, geracoes=geracoes,
+                                  semente=semente, nucleo=nucleo)
+    objetivo, (inf, sup), _ = FUNCOES_TESTE[funcao]
+    if algoritmo == "pso":
+        return pso(objetivo, dimensao=dim, num_particulas=populacao, num_iteracoes=geracoes, limites=(inf, sup),
+                   semente=semente, mostrar_prints=False, nucleo=nucleo)
+    return ABC(objetivo, num_bees=populacao, max_iter=geracoes, dim=dim, lim_inf=inf, lim_sup=sup,
+               semente=semente, nucleo=nucleo).optimize()
+
+
+def _conferir(algoritmo, esperado, obtido):
+    # Solução, fitness e os dois históricos (no GA, o do fitness e o das escolhas)
+    for valor_esperado, valor in zip(esperado, obtido):
+        if algoritmo == "ga":
+            np.testing.assert_array_equal(valor, valor_esperado)
+        else:
+            np.testing.assert_allclose(valor, valor_esperado, rtol=TOLERANCIA, atol=TOLERANCIA)
+
+
+@exige_numba
+@pytest.mark.parametrize("algoritmo, funcao, dim", CASOS)
+def test_nucleo_compilado_igual_ao_numpy(algoritmo, funcao, dim):
+    _conferir(algoritmo, _executar(algoritmo, funcao, dim, "numpy"), _executar(algoritmo, funcao, dim, "numba"))
+
+
+@exige_numba
+@pytest.mark.parametrize("objetivo, dim", [(rastrigin, 1), (rastrigin, 10), (schaffer_n2, 2)])
+def test_avaliacao_compilada_igual_a_vetorizada(objetivo, dim):
+    pontos = np.random.default_rng(0).uniform(-100, 100, (200, dim))
+    codigo = compilado.codigo_objetivo(objetivo, "numba")
+    compilados = np.array([compilado._avaliar_linha(codigo, ponto) for ponto in pontos])
+    np.testing.assert_allclose(compilados, objetivo(pontos), rtol=TOLERANCIA, atol=TOLERANCIA)
+
+
+@pytest.mark.parametrize("algoritmo, funcao, dim", CASOS)
+def test_lacos_interpretados_iguais_ao_numpy(monkeypatch, algoritmo, funcao, dim):
+    # Sem o Numba, os mesmos laços rodam em Python puro: confere a lógica dos núcleos em qualquer ambiente
+    if compilado.NUMBA_DISPONIVEL:
+        pytest.skip("com o Numba instalado os laços são compilados (ver os testes acima)")
+    monkeypatch.setattr(compilado, "NUMBA_DISPONIVEL", True)
+    esperado = _executar(algoritmo, funcao, dim, "numpy", populacao=10, geracoes=8)
+    _conferir(algoritmo, esperado, _executar(algoritmo, funcao, dim, "numba", populacao=10, geracoes=8))
@@ -0,0 +1,34 @@
+"""Vizinhos mais próximos de ``IndiceGrade`` contra a força bruta direta."""
+import numpy as np
+import pytest
+
+from otimizacao.topologias import IndiceGrade
+
+
+def _conferir_vizinhos(pontos, k):
+    indice = IndiceGrade()
+    indice.atualizar(pontos)
+    vizinhos = indice.vizinhos_mais_proximos(k)
+
+    # Distâncias exatas (diferenças, sem expansão), em blocos de linhas
+    for inicio in range(0, len(pontos), 256):
+        linhas = slice(inicio, inicio + 256)
+        diferencas = pontos[linhas, np.newaxis] - pontos[np.newaxis]
+        distancias = np.einsum("ijk,ijk->ij", diferencas, diferencas)
+        k_esima = np.sort(distancias, axis=1)[:, k - 1]
+        encontrada = np.take_along_axis(distancias, vizinhos[linhas], axis=1).max(axis=1)
+        np.testing.assert_allclose(encontrada, k_esima, rtol=1e-9)
+    # Cada ponto faz parte da própria vizinhança
+    assert (vizinhos == np.arange(len(pontos))[:, np.newaxis]).any(axis=1).all()
+
+
+@pytest.mark.parametrize("n, dim, centro, espalhamento", [
+    (50, 10, 100.0, 1e-6),     # enxame convergido longe da origem (força bruta)
+    (2500, 10, 100.0, 1e-6),   # o mesmo, acima de _PONTOS_FORCA_BRUTA (a grade é tentada antes)
+    (2000, 2, -50.0, 1e-5),
+    (1500, 3, 0.0, 5.0),
+])
+@pytest.mark.parametrize("k", [1, 3, 7])
+def test_vizinhos_iguais_a_forca_bruta(n, dim, centro, espalhamento, k):
+    pontos = centro + espalhamento * np.random.default_rng(n + dim).normal(size=(n, dim))
+    _conferir_vizinhos(pontos, k)